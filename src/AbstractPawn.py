@@ -3,81 +3,92 @@
 ################################################################
 
 
-#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-from typing import Tuple
-
-
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
 class AbstractPawn():
     """
     Abstrakcyjny pionek w grze "Warcaby".
+    ----
+    Obiekty pionków są niezmienne i współdzielone (jedna instancja
+    dla każdej pary gracz-rodzaj). Stan pionka w danej grze
+    (zaznaczony, zbity, pośrednie pole bicia) przechowuje plansza,
+    patrz: `Checkers.getPawnState`.
     """
 
+    __slots__ = ()
+
     STATE_STANDBY = 0
     STATE_SELECTED = 1
     STATE_GONE = 2
     STATE_MARKED = 3
 
+    # Współdzielone instancje pionków: (klasa, argumenty) -> pionek
+    _instances = {}
+
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-    def __init__(self) -> None:
+    def __new__(cls, *args) -> 'AbstractPawn':
         """
-        Inicjalizacja klasy `AbstractPawn`.
+        Zwraca współdzieloną instancję pionka danej klasy
+        (tworzoną tylko przy pierwszym wywołaniu).
         """
 
-        self._state = self.STATE_MARKED
+        key = (cls,) + args
+        pawn = AbstractPawn._instances.get(key)
+
+        if pawn is None:
+            pawn = super().__new__(cls)
+            pawn._setup(*args)
+            AbstractPawn._instances[key] = pawn
+
+        return pawn
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-    def __str__(self) -> str:
+    def _setup(self) -> None:
         """
-        Tekstowa reprezentacja pionka.
-        ----
-        Pionek abstrakcyjny używany jest do wskazywania
-        miejsc wielokrotnego bicia damkami.
+        Jednorazowe ustawienie pól nowej instancji pionka.
         """
 
-        return 'x'
+        pass
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-    def getPlayer(self) -> int:
+    def __setattr__(self, name: str, value: object) -> None:
         """
-        Zwraca numer gracza będącego właścicielem pionka.
+        Pionki są niezmienne.
         """
 
-        return (-1)
+        raise AttributeError('AbstractPawn: pionki są niezmienne')
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-    def isRedundant(self) -> bool:
+    def __reduce__(self) -> tuple:
         """
-        Czy dany pionek powinien być usunięty z planszy?
+        Kopiowanie (`copy`, `pickle`) zwraca współdzieloną instancję.
         """
 
-        return (self.STATE_GONE == self._state) \
-            or (self.STATE_MARKED == self._state)
+        return (type(self), ())
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-    def getState(self) -> int:
+    def __str__(self) -> str:
         """
-        Sprawdza stan danego pionka.
+        Tekstowa reprezentacja pionka.
+        ----
+        Pionek abstrakcyjny używany jest do wskazywania
+        miejsc wielokrotnego bicia damkami.
         """
 
-        return self._state
+        return 'x'
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-    def setState(self, state: int) -> int:
+    def getPlayer(self) -> int:
         """
-        Ustawia nowy stan danego pionka.
-        ----
-         * `state`: jedna ze stałych wartości
-          zdefiniowanych w klasie `AbstractPawn`.
+        Zwraca numer gracza będącego właścicielem pionka.
         """
 
-        self._state = state
+        return (-1)
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -3,7 +3,11 @@
 ################################################################
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+from typing import List, Tuple
+
 from Checkers import Checkers
+from CheckersEvent import CheckersEvent
+from ComputerPlayer import ComputerPlayer
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -14,17 +18,27 @@ class AbstractUi():
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-    def __init__(self, checkers: Checkers) -> None:
+    def __init__(self, checkers: Checkers, \
+    computer: ComputerPlayer = None) -> None:
         """
         Inicjalizacja klasy `AbstractUi`.
         ----
          * `checkers`: instancja Warcabów obsługiwana przez nowy interfejs.
+         * `computer`: opcjonalny komputerowy przeciwnik
+          (grający jednym z kolorów zamiast człowieka).
         """
 
         # Pole "protected", nie "private":
         # umożliwienie bezpośrednieg dostępu do pola w klasach dzieczących.
 
         self._checkers = checkers
+        self._computer = computer
+
+        # Pola do odświeżenia, zbierane ze zdarzeń gry
+        # (na początku cała plansza).
+
+        self._dirtySquares = set(self.__allSquares())
+        checkers.subscribe(self.processEvent)
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -39,6 +53,16 @@ class AbstractUi():
         pass
 
 
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def close(self) -> None:
+        """
+        Odłączenie interfejsu od gry (koniec odbierania zdarzeń,
+        patrz: `Checkers.unsubscribe`).
+        """
+
+        self._checkers.unsubscribe(self.processEvent)
+
+
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
     def updateBoard(self) -> None:
         """
@@ -49,6 +73,69 @@ class AbstractUi():
         pass
 
 
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @staticmethod
+    def __allSquares() -> List[Tuple[int, int]]:
+        """
+        Pozycje [X, Y] wszystkich ciemnych pól planszy.
+        """
+
+        return [
+            (x, y)
+            for y in range(Checkers.BOARD_SIZE)
+            for x in range(Checkers.BOARD_SIZE)
+            if (x & 1) ^ (y & 1)
+        ]
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def processEvent(self, event: CheckersEvent) -> None:
+        """
+        Zapamiętanie pól zmienionych przez zdarzenie gry
+        (patrz: `Checkers.subscribe`).
+        """
+
+        if CheckersEvent.EVENT_RESET == event.kind:
+            self._dirtySquares.update(self.__allSquares())
+        else:
+            self._dirtySquares.update(event.squares)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def takeDirtySquares(self) -> List[Tuple[int, int]]:
+        """
+        Zwraca pola zmienione od poprzedniego wywołania
+        (i zapomina je).
+        """
+
+        squares = list(self._dirtySquares)
+        self._dirtySquares.clear()
+        return squares
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def isComputerTurn(self) -> bool:
+        """
+        Czy w obecnej turze ruch należy do komputera?
+        """
+
+        return (self._computer is not None) \
+            and self._computer.isMyTurn(self._checkers)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def playComputerTurn(self) -> bool:
+        """
+        Wykonanie ruchu przez komputer, jeśli jest jego tura.
+        Zwraca prawdę, jeśli należy zaaktualizować planszę.
+        """
+
+        if not self.isComputerTurn():
+            return False
+
+        return self._computer.playTurn(self._checkers)
+
+
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
     def drawBoard(self) -> None:
         """
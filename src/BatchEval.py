@@ -0,0 +1,166 @@
+################################################################
+# Warcaby: "/src/BatchEval.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+# Biblioteka `numpy` jest opcjonalna: bez niej działa cała gra,
+# niedostępna jest jedynie ocena pozycji w partiach.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from typing import Iterable
+
+from Bitboard import Bitboard
+from Checkers import Checkers
+from ComputerPlayer import ComputerPlayer
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class BatchEval():
+    """
+    Ocena wielu pozycji naraz (wektorowo, z użyciem `numpy`).
+    ----
+    Wynik jest zgodny z `ComputerPlayer.evaluate`: materiał,
+    awans zwykłych pionków i kontrola środka sprowadzają się do
+    sumy wag zajętych pól, więc ocena partii pozycji to kilka
+    iloczynów macierzy przez wektor wag, bez pętli po pionkach.
+    Pozycje podawane są jako tablica:
+     * N×4 (`uint32`): maski z `Checkers.getBitboards`,
+     * N×32 (`int8`): zawartość kolejnych pól (patrz: `SQUARE_*`).
+    """
+
+    # Zawartość pola w tablicy N×32
+    SQUARE_EMPTY = 0
+    SQUARE_MAN = (1, -1)
+    SQUARE_KING = (2, -2)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __init__(self) -> None:
+        """
+        Inicjalizacja klasy `BatchEval`.
+        Przygotowanie wag pól dla obu graczy.
+        """
+
+        if numpy is None:
+            raise ImportError('BatchEval: wymagana jest biblioteka numpy')
+
+        size = Checkers.BOARD_SIZE
+        bb = Bitboard(size)
+        squares = size * size // 2
+
+        centre = numpy.zeros(squares, dtype = numpy.int64)
+        rows = numpy.zeros(squares, dtype = numpy.int64)
+
+        for square in range(squares):
+            x, y = bb.squarePos(square)
+            rows[square] = y
+            if (2 <= x < size - 2) and (2 <= y < size - 2):
+                centre[square] = 1
+
+        centre *= ComputerPlayer.SCORE_CENTRE
+        advance = ComputerPlayer.SCORE_ADVANCE
+
+        # Wagi w kolejności masek `Bitboard`: zwykłe pionki obu
+        # graczy, a następnie damki. Gracz pierwszy awansuje
+        # w stronę wiersza 0, gracz drugi w stronę ostatniego wiersza.
+        self.__weights = numpy.stack ([
+            ComputerPlayer.SCORE_MAN + centre + advance * (size - 1 - rows),
+            ComputerPlayer.SCORE_MAN + centre + advance * rows,
+            ComputerPlayer.SCORE_KING + centre,
+            ComputerPlayer.SCORE_KING + centre,
+        ])
+
+        self.__shifts = numpy.arange(squares, dtype = numpy.uint32)
+        self.__squares = squares
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @staticmethod
+    def positionsFromCheckers(games: Iterable[Checkers]) -> 'numpy.ndarray':
+        """
+        Zwraca tablicę N×4 (`uint32`) masek bitowych kolejnych gier.
+        """
+
+        return numpy.array (
+            [checkers.getBitboards() for checkers in games],
+            dtype = numpy.uint32
+        ).reshape(-1, 4)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def unpackBits(self, positions: 'numpy.ndarray') -> 'numpy.ndarray':
+        """
+        Zamiana tablicy N×4 masek bitowych na tablicę N×4×32
+        zer i jedynek (zajętość kolejnych pól w każdej masce).
+        """
+
+        masks = numpy.asarray(positions, dtype = numpy.uint32)
+        return ((masks[:, :, None] >> self.__shifts) & 1).astype(numpy.int8)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def squaresFromBitboards(self, positions: 'numpy.ndarray') \
+    -> 'numpy.ndarray':
+        """
+        Zamiana tablicy N×4 masek bitowych na tablicę N×32 (`int8`).
+        """
+
+        bits = self.unpackBits(positions)
+        man, king = self.SQUARE_MAN, self.SQUARE_KING
+
+        return (
+            man[0] * bits[:, Bitboard.MASK_MEN]
+            + man[1] * bits[:, Bitboard.MASK_MEN + 1]
+            + king[0] * bits[:, Bitboard.MASK_KINGS]
+            + king[1] * bits[:, Bitboard.MASK_KINGS + 1]
+        ).astype(numpy.int8)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def evaluate(self, positions: 'numpy.ndarray', \
+    players: 'numpy.ndarray' = None) -> 'numpy.ndarray':
+        """
+        Zwraca oceny (`int64`) wszystkich pozycji z punktu widzenia
+        gracza w danej turze.
+        ----
+         * `positions`: tablica N×4 masek albo N×32 pól.
+         * `players`: gracz w turze dla każdej pozycji (liczba
+          albo tablica N liczb, domyślnie 0).
+        """
+
+        positions = numpy.asarray(positions)
+        if 2 != positions.ndim:
+            positions = positions.reshape(-1, positions.shape[-1])
+
+        if 4 == positions.shape[1]:
+            # N×4×32 zer i jedynek razy wagi 4×32
+            bits = self.unpackBits(positions)
+            weights = self.__weights * numpy.array([[1], [-1], [1], [-1]])
+            score = numpy.einsum('nms,ms->n', bits, weights)
+
+        elif self.__squares == positions.shape[1]:
+            squares = positions.astype(numpy.int8)
+            man, king = self.SQUARE_MAN, self.SQUARE_KING
+            score = (squares == man[0]) @ self.__weights[0] \
+                - (squares == man[1]) @ self.__weights[1] \
+                + (squares == king[0]) @ self.__weights[2] \
+                - (squares == king[1]) @ self.__weights[3]
+
+        else:
+            raise ValueError (
+                'BatchEval: oczekiwano tablicy N×4 lub N×%d, a nie %s'
+                % (self.__squares, positions.shape)
+            )
+
+        if players is None:
+            return score
+
+        sign = 1 - 2 * numpy.asarray(players, dtype = numpy.int64)
+        return score * sign
+
+
+################################################################
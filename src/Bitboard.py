@@ -0,0 +1,564 @@
+################################################################
+# Warcaby: "/src/Bitboard.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+from typing import List, Tuple
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class Bitboard():
+    """
+    Bitowa reprezentacja planszy w grze "Warcaby".
+    ----
+    Plansza opisana jest czterema maskami (po jednym bicie na każde
+    ciemne pole): zwykłe pionki CZARNE, zwykłe pionki BIAŁE,
+    damki CZARNE oraz damki BIAŁE.
+    ----
+    Ciemne pola numerowane są wierszami, od góry planszy
+    i od lewej do prawej: `indeks = y * (rozmiar / 2) + x / 2`.
+    """
+
+    # Indeksy masek: rodzaj pionka (0 = zwykły, 2 = damka) + gracz (0, 1)
+    MASK_MEN = 0
+    MASK_KINGS = 2
+
+    # Kierunki (identyczne jak w `Checkers.getDiagonalPawns`)
+    DIR_NW = 0
+    DIR_NE = 1
+    DIR_SW = 2
+    DIR_SE = 3
+
+    # Tablice przesunięć budowane raz dla każdego rozmiaru planszy
+    __tables = {}
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __init__(self, size: int) -> None:
+        """
+        Inicjalizacja klasy `Bitboard`.
+        ----
+         * `size`: długość boku planszy (liczba parzysta).
+        """
+
+        if size not in self.__tables:
+            self.__tables[size] = self.__buildTables(size)
+
+        self.__size = size
+        self.__full, self.__positions, self.__indices, self.__steps, \
+            self.__neighbors, self.__rays, self.__jumps, self.__attacks, \
+            self.__lines = self.__tables[size]
+
+        # Cztery maski: [CZARNE, BIAŁE, CZARNE DAMKI, BIAŁE DAMKI]
+        self.masks = [0, 0, 0, 0]
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __deepcopy__(self, memo: dict) -> 'Bitboard':
+        """
+        Kopia planszy bitowej: kopiowane są wyłącznie maski,
+        a tablice pomocnicze pozostają współdzielone.
+        """
+
+        result = Bitboard(self.__size)
+        result.masks = list(self.masks)
+        return result
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @staticmethod
+    def __buildTables(size: int) -> tuple:
+        """
+        Przygotowanie tablic pomocniczych dla danego rozmiaru planszy:
+        pełnej maski, pozycji [X, Y] każdego pola, indeksów pól,
+        par (maska, przesunięcie) dla każdego z czterech kierunków,
+        a także dla każdego pola i kierunku: bitu sąsiedniego pola
+        (0 na krawędzi planszy) i maski całej przekątnej. Dla bić
+        przygotowywane są pary (pole przeskakiwane, pole lądowania)
+        zwykłego pionka, maski pól, na których musi stać bity pionek
+        (zwykły pionek, damka), oraz dla każdej pary pól na jednej
+        przekątnej: kierunek, maska pól pomiędzy nimi i ich liczba.
+        """
+
+        half = size // 2
+
+        positions = []
+        indices = [[(-1)] * size for _ in range(size)]
+
+        for y in range(size):
+            for x in range(size):
+                if (x & 1) ^ (y & 1):
+                    indices[y][x] = len(positions)
+                    positions.append((x, y))
+
+        steps = []
+
+        for direction in range(4):
+            x_step = (+1) if (direction & 1) else (-1)
+            y_step = (+1) if (direction & 2) else (-1)
+
+            # Przesunięcie indeksu zależy od parzystości wiersza,
+            # więc pola grupowane są według różnicy indeksów.
+            shifts = {}
+            for i, (x, y) in enumerate(positions):
+                nx, ny = x + x_step, y + y_step
+                if (0 <= nx < size) and (0 <= ny < size):
+                    delta = indices[ny][nx] - i
+                    shifts[delta] = shifts.get(delta, 0) | (1 << i)
+
+            steps.append(tuple(
+                (mask, delta) for delta, mask in shifts.items()
+            ))
+
+        neighbors = []
+        rays = []
+
+        for x, y in positions:
+            squareNeighbors = []
+            squareRays = []
+            for direction in range(4):
+                x_step = (+1) if (direction & 1) else (-1)
+                y_step = (+1) if (direction & 2) else (-1)
+
+                ray = []
+                nx, ny = x + x_step, y + y_step
+                while (0 <= nx < size) and (0 <= ny < size):
+                    ray.append(1 << indices[ny][nx])
+                    nx, ny = nx + x_step, ny + y_step
+
+                squareNeighbors.append(ray[0] if ray else 0)
+                squareRays.append(sum(ray))
+            neighbors.append(tuple(squareNeighbors))
+            rays.append(tuple(squareRays))
+
+        jumps = tuple(
+            tuple(
+                (n, neighbors[n.bit_length() - 1][direction])
+                for direction, n in enumerate(neighbors[square])
+                if n and neighbors[n.bit_length() - 1][direction]
+            )
+            for square in range(len(positions))
+        )
+
+        attacks = []
+        for square in range(len(positions)):
+            kingMask = 0
+            for direction, ray in enumerate(rays[square]):
+                if not ray:
+                    continue
+                # Ostatnie pole przekątnej nie ma pola lądowania.
+                if direction & 2:
+                    last = 1 << (ray.bit_length() - 1)
+                else:
+                    last = ray & (-ray)
+                kingMask |= ray & ~last
+            attacks.append ((
+                sum(n for n, _ in jumps[square]), kingMask
+            ))
+
+        lines = []
+        for src, (sx, sy) in enumerate(positions):
+            row = []
+            for dst, (dx, dy) in enumerate(positions):
+                x_step, y_step = (dx - sx), (dy - sy)
+                if (0 == x_step) or (abs(x_step) != abs(y_step)):
+                    row.append(None)
+                    continue
+                direction = (int(y_step > 0) << 1) | int(x_step > 0)
+                between = rays[src][direction] \
+                    & ~(rays[dst][direction] | (1 << dst))
+                row.append((direction, between, abs(x_step) - 1))
+            lines.append(tuple(row))
+
+        full = (1 << (size * half)) - 1
+
+        return full, tuple(positions), indices, tuple(steps), \
+            tuple(neighbors), tuple(rays), jumps, tuple(attacks), \
+            tuple(lines)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def squareIndex(self, x: int, y: int) -> int:
+        """
+        Zwraca indeks ciemnego pola lub (-1) dla pola jasnego.
+        """
+
+        return self.__indices[y][x]
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def squarePos(self, square: int) -> Tuple[int, int]:
+        """
+        Zwraca pozycję [X, Y] ciemnego pola o danym indeksie.
+        """
+
+        return self.__positions[square]
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def clear(self) -> None:
+        """
+        Wyczyszczenie wszystkich masek.
+        """
+
+        self.masks = [0, 0, 0, 0]
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def setPiece(self, square: int, player: int, king: bool) -> None:
+        """
+        Postawienie pionka na danym polu.
+        ----
+         * `square`: indeks pola.
+         * `player`: numer gracza (0 lub 1).
+         * `king`: czy pionek jest damką.
+        """
+
+        self.removePiece(square)
+        self.masks[(self.MASK_KINGS if king else self.MASK_MEN) + player] \
+            |= (1 << square)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def removePiece(self, square: int) -> None:
+        """
+        Usunięcie dowolnego pionka z danego pola.
+        """
+
+        bit = ~(1 << square)
+        m = self.masks
+        m[0] &= bit
+        m[1] &= bit
+        m[2] &= bit
+        m[3] &= bit
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def movePiece(self, src: int, dst: int) -> None:
+        """
+        Przeniesienie pionka z pola `src` na pole `dst`.
+        """
+
+        a, b = (1 << src), (1 << dst)
+        m = self.masks
+        for i in range(4):
+            if m[i] & a:
+                m[i] ^= a | b
+                return
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def promotePiece(self, square: int) -> None:
+        """
+        Zamiana zwykłego pionka w damkę.
+        """
+
+        bit = 1 << square
+        m = self.masks
+        for player in range(2):
+            if m[self.MASK_MEN + player] & bit:
+                m[self.MASK_MEN + player] ^= bit
+                m[self.MASK_KINGS + player] |= bit
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getPlayerMask(self, player: int) -> int:
+        """
+        Maska wszystkich pionków danego gracza.
+        """
+
+        return self.masks[self.MASK_MEN + player] \
+            | self.masks[self.MASK_KINGS + player]
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getOccupiedMask(self) -> int:
+        """
+        Maska wszystkich zajętych pól.
+        """
+
+        m = self.masks
+        return m[0] | m[1] | m[2] | m[3]
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def countPieces(self, player: int) -> int:
+        """
+        Liczba pionków danego gracza.
+        """
+
+        return self.getPlayerMask(player).bit_count()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def step(self, mask: int, direction: int) -> int:
+        """
+        Przesunięcie wszystkich bitów maski o jedno pole
+        w danym kierunku (0 = NW, 1 = NE, 2 = SW, 3 = SE).
+        Bity wychodzące poza planszę są odrzucane.
+        """
+
+        result = 0
+        for m, delta in self.__steps[direction]:
+            if delta > 0:
+                result |= (mask & m) << delta
+            else:
+                result |= (mask & m) >> (-delta)
+        return result
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def canCapture(self, square: int, player: int, king: bool, \
+    frozen: int = 0) -> bool:
+        """
+        Czy pionek gracza `player` stojący na polu `square`
+        może wykonać jakieś bicie?
+        ----
+         * `frozen`: maska pól zablokowanych (zbite w trwającym ruchu
+          pionki oraz pośrednie pola bicia), których nie można
+          ani przeskoczyć, ani zająć.
+        ----
+        Bez przechodzenia pole po polu: pierwsze zajęte pole
+        na przekątnej wyznaczane jest z maski przekątnej (najniższy
+        bit na południe, najwyższy na północ).
+        """
+
+        m = self.masks
+        enemy = (m[player ^ 1] | m[self.MASK_KINGS + (player ^ 1)]) \
+            & ~frozen
+
+        # Żaden pionek przeciwnika nie stoi tam, gdzie można go zbić.
+        if not (enemy & self.__attacks[square][king]):
+            return False
+
+        blockers = m[0] | m[1] | m[2] | m[3] | frozen
+
+        if not king:
+            for n, landing in self.__jumps[square]:
+                if (n & enemy) and not (landing & blockers):
+                    return True
+            return False
+
+        neighbors = self.__neighbors
+
+        for direction, ray in enumerate(self.__rays[square]):
+            ray &= blockers
+            if not ray:
+                continue
+
+            # Pierwszy pionek na przekątnej
+            if direction & 2:
+                n = ray & (-ray)
+            else:
+                n = 1 << (ray.bit_length() - 1)
+
+            if n & enemy:
+                behind = neighbors[n.bit_length() - 1][direction]
+                if behind and not (behind & blockers):
+                    return True
+
+        return False
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getCapturingPieces(self, player: int, frozen: int = 0) -> int:
+        """
+        Maska pionków gracza `player`, które mogą wykonać bicie.
+        ----
+        Pola są wyznaczane od strony bitych pionków: najpierw
+        pionki przeciwnika z wolnym polem za nimi, a potem (przesuwając
+        w przeciwnym kierunku) pionki mogące je przeskoczyć.
+        """
+
+        empty = ~(self.getOccupiedMask() | frozen) & self.__full
+        enemy = self.getPlayerMask(player ^ 1) & ~frozen
+        men = self.masks[self.MASK_MEN + player]
+        kings = self.masks[self.MASK_KINGS + player]
+        step = self.step
+
+        result = 0
+        for direction in range(4):
+            opposite = 3 - direction
+            targets = enemy & step(empty, opposite)
+            s = step(targets, opposite)
+            result |= s & men
+
+            # Damki: dalej po wolnych polach (tylko jeśli są damki).
+            if kings:
+                while s:
+                    result |= s & kings
+                    s = step(s & empty, opposite)
+
+        return result
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def validateMove(self, src: int, dst: int, player: int, king: bool, \
+    frozen: int = 0) -> Tuple[int, List[int]]:
+        """
+        Sprawdzenie ruchu pionka z pola `src` na pole `dst`
+        (zasady jak w `Checkers.validateSelectedPawnMove`).
+        Zwraca liczbę przeskoczonych pól (0 dla ruchu niepoprawnego)
+        oraz listę indeksów zbitych pionków.
+        """
+
+        line = self.__lines[src][dst]
+        if line is None:
+            return (0, [])
+
+        direction, between, d_step = line
+
+        m = self.masks
+        occupied = m[0] | m[1] | m[2] | m[3] | frozen
+        own = m[player] | m[self.MASK_KINGS + player] | frozen
+
+        jumped = between & occupied
+
+        if (d_step > 0) and (not king) and ((d_step > 1) or not jumped):
+            return (0, [])
+
+        # Przeskakiwane pionki muszą należeć do przeciwnika
+        # i nie mogą stać bezpośrednio jeden za drugim.
+        if jumped & own:
+            return (0, [])
+
+        neighbors = self.__neighbors
+        captured = []
+        while jumped:
+            low = jumped & (-jumped)
+            jumped ^= low
+            square = low.bit_length() - 1
+            if neighbors[square][direction] & between & occupied:
+                return (0, [])
+            captured.append(square)
+
+        # Kolejność od pola startowego
+        if not (direction & 2):
+            captured.reverse()
+
+        if (not captured) and (not king) and ((direction >> 1) != player):
+            return (0, [])
+
+        return ((d_step + 1), captured)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def generateMoves(self, player: int) \
+    -> List[Tuple[int, Tuple[int, ...], Tuple[int, ...]]]:
+        """
+        Generowanie wszystkich dozwolonych ruchów danego gracza.
+        Każdy ruch to trójka: pole startowe, kolejne pola lądowania
+        oraz zbite pionki (indeksy pól).
+        ----
+        Jeżeli którykolwiek pionek może bić, to zwracane są wyłącznie
+        pełne sekwencje bić (zakończone dopiero wtedy, gdy pionek
+        nie może bić dalej).
+        """
+
+        men = self.masks[self.MASK_MEN + player]
+        kings = self.masks[self.MASK_KINGS + player]
+
+        moves = []
+
+        capturing = self.getCapturingPieces(player)
+        while capturing:
+            low = capturing & (-capturing)
+            capturing ^= low
+            self.__generateCaptures (
+                moves, low.bit_length() - 1, player, bool(kings & low)
+            )
+
+        if moves:
+            return moves
+
+        empty = ~self.getOccupiedMask() & self.__full
+        forward = (self.DIR_NW, self.DIR_NE) if (0 == player) \
+            else (self.DIR_SW, self.DIR_SE)
+
+        neighbors = self.__neighbors
+
+        pieces = men | kings
+        while pieces:
+            low = pieces & (-pieces)
+            pieces ^= low
+            src = low.bit_length() - 1
+
+            if kings & low:
+                for direction, n in enumerate(neighbors[src]):
+                    while n & empty:
+                        square = n.bit_length() - 1
+                        moves.append((src, (square,), ()))
+                        n = neighbors[square][direction]
+            else:
+                for direction in forward:
+                    n = neighbors[src][direction] & empty
+                    if n:
+                        moves.append((src, (n.bit_length() - 1,), ()))
+
+        return moves
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __generateCaptures(self, moves: list, src: int, player: int, \
+    king: bool) -> None:
+        """
+        Dopisanie do listy `moves` wszystkich sekwencji bić
+        pionka stojącego na polu `src`.
+        ----
+        Tak jak w `Checkers.processInput`, pionek pozostaje na polu
+        startowym aż do końca ruchu, a zbite pionki i pośrednie
+        pola bicia blokują dalsze skoki.
+        """
+
+        occupied = self.getOccupiedMask()
+        enemy = self.getPlayerMask(player ^ 1)
+        full = self.__full
+        neighbors = self.__neighbors
+
+        def jumps(square: int, frozen: int):
+            empty = ~(occupied | frozen) & full
+            capturable = enemy & ~frozen
+
+            for direction, n in enumerate(neighbors[square]):
+                captured = []
+                glued = False
+
+                while n:
+                    if n & empty:
+                        if captured:
+                            yield (n.bit_length() - 1), tuple(captured)
+                        if not king:
+                            break
+                        glued = False
+                    elif (n & capturable) and not glued:
+                        if (not king) and captured:
+                            break
+                        captured.append(n.bit_length() - 1)
+                        glued = True
+                    else:
+                        break
+                    n = neighbors[n.bit_length() - 1][direction]
+
+        def walk(square: int, frozen: int, landings: tuple, \
+        captured: tuple) -> None:
+            found = False
+            for landing, taken in jumps(square, frozen):
+                found = True
+                newFrozen = frozen
+                for c in taken:
+                    newFrozen |= (1 << c)
+                if landings:
+                    # Poprzednie pole lądowania staje się polem pośrednim
+                    newFrozen |= (1 << square)
+                walk (
+                    landing, newFrozen,
+                    landings + (landing,), captured + taken
+                )
+            if (not found) and landings:
+                moves.append((src, landings, captured))
+
+        walk(src, 0, (), ())
+
+
+################################################################
@@ -4,11 +4,17 @@
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-from typing import List, Tuple
+from typing import Callable, List, Tuple
 
 from AbstractPawn import AbstractPawn
 from WeakPawn import WeakPawn
 from StrongPawn import StrongPawn
+from Bitboard import Bitboard
+from CheckersEvent import CheckersEvent
+from Fen import Fen
+from Move import Move
+from Snapshot import Snapshot
+from Zobrist import Zobrist
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -34,10 +40,21 @@ class Checkers():
     TURNINFO_WRONG_PLAYER = 4
     TURNINFO_INVALID_MOVE = 5
 
+    # Sposób sprawdzania zasad gry: przechodzenie po obiektach pionków
+    # lub przesunięcia i maski bitowe (`Bitboard`).
+    BACKEND_OBJECTS   = 0
+    BACKEND_BITBOARDS = 1
+
+    # Tablice przekątnych budowane raz dla każdego rozmiaru planszy
+    __raysCache = {}
+
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-    def __init__(self) -> None:
+    def __init__(self, backend: int = BACKEND_OBJECTS) -> None:
         """
         Inicjalizacja klasy `Checkers`.
+        ----
+         * `backend`: sposób sprawdzania zasad gry
+          (`BACKEND_OBJECTS` lub `BACKEND_BITBOARDS`).
         """
 
         # Pusta plansza
@@ -47,6 +64,26 @@ class Checkers():
             for _ in range(self.BOARD_SIZE)
         ]
 
+        # Bitowa reprezentacja planszy, zawsze zgodna z `__board`.
+        # Maska `__frozenMask` zawiera pola zablokowane w trakcie
+        # bicia (zbite pionki oraz pośrednie pola bicia).
+
+        self.__backend = backend
+        self.__bitboard = Bitboard(self.BOARD_SIZE)
+        self.__frozenMask = 0
+
+        # Hasz Zobrista aktualnej pozycji (razem ze stroną grającą)
+
+        self.__zobrist = Zobrist(self.BOARD_SIZE * self.BOARD_SIZE // 2)
+        self.__hash = 0
+
+        # Pozycje pól na przekątnych wychodzących z każdego pola planszy
+        # (współdzielone przez wszystkie instancje klasy).
+
+        if self.BOARD_SIZE not in self.__raysCache:
+            self.__raysCache[self.BOARD_SIZE] = \
+                self.__buildRays(self.BOARD_SIZE)
+
         # Stan rozgrywki
 
         self.__state = self.GAMESTATE_END
@@ -66,6 +103,47 @@ class Checkers():
         self.__multiFightPawn = None
         self.__obligatoryPawns = []
 
+        # Pionki obu graczy mogące wykonać bicie oraz liczba pionków
+        # (aktualizowane po każdym ruchu tylko na zmienionych przekątnych).
+        # Wartość `None` oznacza konieczność ponownego przejrzenia planszy.
+
+        self.__fightingPawns = None
+        self.__leftPawns = [0, 0]
+
+        # Pola zmienione w ostatnim ruchu oraz zbite pionki
+        # (pozycja X, pozycja Y, obiekt pionka)
+
+        self.__touchedSquares = []
+        self.__capturedPawns = []
+
+        # Kolejne pola lądowania w trwającym ruchu
+
+        self.__movePath = []
+
+        # Pola zmienione przez ostatnie wywołanie `processInput`
+
+        self.__changedSquares = []
+
+        # Stos cofania ruchów: tylko dane zmienione przez każdy ruch
+
+        self.__undoStack = []
+
+        # Funkcje otrzymujące zdarzenia gry (`CheckersEvent`)
+
+        self.__subscribers = []
+
+        # Licznik zmian stanu gry oraz numer ostatniej zmiany planszy
+        # (pionki lub zaznaczenie), a także zapamiętane na ich podstawie
+        # tekstowe reprezentacje planszy i komunikatu.
+
+        self.__version = 0
+        self.__boardVersion = 0
+
+        self.__textBoard = None
+        self.__textBoardVersion = -1
+        self.__textState = None
+        self.__textStateVersion = -1
+
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
     def newGame(self) -> None:
@@ -90,14 +168,125 @@ class Checkers():
 
         self.__obligatoryPawns = []
 
+        self.__onBoardReplaced()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __onBoardReplaced(self) -> None:
+        """
+        Odbudowanie danych pomocniczych po podmianie całej planszy:
+        masek bitowych, hasza pozycji, śledzonych bić
+        oraz stosu cofania ruchów.
+        """
+
+        self.__bitboard.clear()
+        self.__frozenMask = 0
+        self.__fightingPawns = None
+        self.__undoStack = []
+
+        for y in range(self.BOARD_SIZE):
+            for x in range(self.BOARD_SIZE):
+                pawn = self.__board[y][x]
+                if (pawn is not None) and (pawn.getPlayer() >= 0):
+                    self.__bitboard.setPiece (
+                        self.__bitboard.squareIndex(x, y),
+                        pawn.getPlayer(),
+                        pawn.canTakeMultipleSteps()
+                    )
+
+        self.__hash = self.__zobrist.hashMasks (
+            self.__bitboard.masks, self.__player
+        )
+
+        self.__touch()
+
+        if self.__subscribers:
+            self.__emit(CheckersEvent.EVENT_RESET)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __touch(self, board: bool = True) -> None:
+        """
+        Zwiększenie licznika zmian po każdej modyfikacji gry.
+        ----
+         * `board`: czy zmieniła się również plansza
+          (pionki, pośrednie pola bicia lub zaznaczenie).
+        """
+
+        self.__version += 1
+
+        if board:
+            self.__boardVersion = self.__version
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getVersion(self) -> int:
+        """
+        Zwraca licznik zmian stanu gry (plansza, tura, stan,
+        informacja o turze). Rośnie po każdej zmianie, więc widoki
+        pochodne można zapamiętywać razem z numerem wersji.
+        """
+
+        return self.__version
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getBoardVersion(self) -> int:
+        """
+        Zwraca numer wersji (`Checkers.getVersion`), w której
+        ostatnio zmieniła się plansza (pionki lub zaznaczenie).
+        """
+
+        return self.__boardVersion
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getBackend(self) -> int:
+        """
+        Zwraca sposób sprawdzania zasad gry
+        (`BACKEND_OBJECTS` lub `BACKEND_BITBOARDS`).
+        """
+
+        return self.__backend
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getBitboards(self) -> Tuple[int, int, int, int]:
+        """
+        Zwraca cztery maski bitowe planszy: zwykłe pionki CZARNE,
+        zwykłe pionki BIAŁE, damki CZARNE oraz damki BIAŁE.
+        ----
+        Bit o indeksie `y * (BOARD_SIZE / 2) + x / 2` odpowiada
+        ciemnemu polu [X, Y].
+        """
+
+        return tuple(self.__bitboard.masks)
+
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
     def getTextBoard(self) -> List[List[str]]:
         """
         Zwrócenie tekstowej reprezentacji planszy.
+        ----
+        Zaznaczony pionek jest objęty w nawiasy kwadratowe.
+        Tekst budowany jest tylko po zmianie planszy
+        (`Checkers.getBoardVersion`), a zwracana jest kopia wierszy.
         """
 
-        return [
+        if self.__textBoardVersion != self.__boardVersion:
+            self.__textBoard = self.__buildTextBoard()
+            self.__textBoardVersion = self.__boardVersion
+
+        return [row[:] for row in self.__textBoard]
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __buildTextBoard(self) -> List[List[str]]:
+        """
+        Zbudowanie tekstowej reprezentacji planszy.
+        """
+
+        result = [
             [
                 '' if self.__board[y][x] is None else str(self.__board[y][x])
                 for x in range(self.BOARD_SIZE)
@@ -105,6 +294,31 @@ class Checkers():
             for y in range(self.BOARD_SIZE)
         ]
 
+        if self.GAMESTATE_PUT == self.__state:
+            x, y = self.__selectedPawnPos
+            result[y][x] = '[' + result[y][x] + ']'
+
+        return result
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getTextSquare(self, x: int, y: int) -> str:
+        """
+        Zwrócenie tekstowej reprezentacji jednego pola
+        (jak w `Checkers.getTextBoard`).
+        ----
+         * `x`, `y`: pozycja pola na planszy.
+        """
+
+        pawn = self.__board[y][x]
+        text = '' if pawn is None else str(pawn)
+
+        if (self.GAMESTATE_PUT == self.__state) \
+        and ((x, y) == self.__selectedPawnPos):
+            text = '[' + text + ']'
+
+        return text
+
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
     def setTextBoard(self, textBoard: List[List[str]]) -> None:
@@ -154,7 +368,12 @@ class Checkers():
 
                     self.__board[y][x] = pawn
 
+            self.__onBoardReplaced()
+
         except Exception as e:
+            # Plansza mogła zostać częściowo podmieniona.
+            self.__touch()
+
             #$$ print('Ojej... Checkers Exception!')
             #$$ print('@' * 64)
             #$$ print(textBoard)
@@ -165,6 +384,159 @@ class Checkers():
             )
 
 
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def setBitboards(self, masks: Tuple[int, int, int, int]) -> None:
+        """
+        Rozłożenie pionków na podstawie czterech masek bitowych
+        (w formacie zwracanym przez `Checkers.getBitboards`).
+        ----
+        Szybsza alternatywa dla `Checkers.setTextBoard`,
+        np. przy przekazywaniu pozycji między procesami.
+        """
+
+        self.__placePawns(masks)
+        self.__onBoardReplaced()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getFen(self) -> str:
+        """
+        Zwraca jednowierszowy zapis pozycji w formacie FEN (`Fen`):
+        pionki oraz gracz w obecnej turze.
+        """
+
+        return Fen.format(self.__bitboard.masks, self.__player)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def setFen(self, text: str) -> None:
+        """
+        Ustawienie pozycji zapisanej w formacie FEN (`Fen`).
+        Gra jest kontynuowana od podniesienia pionka przez gracza
+        z zapisu, z wyznaczonymi obowiązkowymi biciami.
+        Niepoprawny zapis zgłaszany jest wyjątkiem `ValueError`
+        (plansza pozostaje wtedy bez zmian).
+        ----
+         * `text`: zapis pozycji (np. `B:W1,2,K3:B21,22`).
+        """
+
+        masks, player = Fen.parse(text, self.BOARD_SIZE * self.BOARD_SIZE // 2)
+
+        self.__state = self.GAMESTATE_TAKE
+        self.__turninfo = self.TURNINFO_NOTHING
+        self.__player = player
+
+        self.__placePawns(masks)
+        self.__onBoardReplaced()
+        self.__updateGameData()
+        self.__touch(False)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __placePawns(self, masks: Tuple[int, int, int, int]) -> None:
+        """
+        Wyczyszczenie planszy i ustawienie pionków według masek bitowych.
+        """
+
+        bb = self.__bitboard
+
+        for y in range(self.BOARD_SIZE):
+            for x in range(self.BOARD_SIZE):
+                self.__board[y][x] = None
+
+        for i, mask in enumerate(masks):
+            player = i & 1
+            pawnType = StrongPawn if (i & Bitboard.MASK_KINGS) else WeakPawn
+            while mask:
+                low = mask & (-mask)
+                x, y = bb.squarePos(low.bit_length() - 1)
+                self.__board[y][x] = pawnType(player)
+                mask ^= low
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def snapshot(self) -> Snapshot:
+        """
+        Zwraca zwarty, niezmienny zapis obecnej pozycji (`Snapshot`),
+        razem z zaznaczonym pionkiem i trwającym wielokrotnym biciem.
+        Zapis można odtworzyć funkcją `Checkers.restore`.
+        ----
+        Zapis nie obejmuje historii ruchów (stosu cofania).
+        """
+
+        bb = self.__bitboard
+
+        def index(pos: Tuple[int, int]) -> int:
+            return -1 if pos is None else bb.squareIndex(*pos)
+
+        selected, fighting, path = -1, -1, ()
+        if self.GAMESTATE_PUT == self.__state:
+            selected = index(self.__selectedPawnPos)
+            fighting = index(self.__fightingPawnPos)
+            path = tuple(index(pos) for pos in self.__movePath)
+
+        obligatory = 0
+        for pos in self.__obligatoryPawns:
+            obligatory |= 1 << index(pos)
+
+        return Snapshot (
+            tuple(bb.masks), self.__player, self.__state, self.__turninfo,
+            selected, fighting, self.__frozenMask, path, obligatory
+        )
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def restore(self, snapshot: Snapshot) -> None:
+        """
+        Odtworzenie pozycji zapisanej funkcją `Checkers.snapshot`.
+        Historia ruchów (stos cofania) zostaje wyczyszczona.
+        ----
+         * `snapshot`: zapis pozycji (`Snapshot`).
+        """
+
+        bb = self.__bitboard
+        pos = bb.squarePos
+
+        self.__placePawns(snapshot.masks)
+
+        self.__player = snapshot.player
+        self.__state = snapshot.state
+        self.__turninfo = snapshot.turninfo
+
+        self.__onBoardReplaced()
+
+        obligatory, self.__obligatoryPawns = snapshot.obligatory, []
+        while obligatory:
+            low = obligatory & (-obligatory)
+            self.__obligatoryPawns.append(pos(low.bit_length() - 1))
+            obligatory ^= low
+
+        self.__selectedPawnPos = None
+        self.__fightingPawnPos = None
+        self.__multiFightPawn = None
+        self.__movePath = []
+
+        if self.GAMESTATE_PUT == self.__state:
+            self.__selectedPawnPos = pos(snapshot.selected)
+            self.__fightingPawnPos = pos(snapshot.fighting)
+            self.__movePath = [pos(square) for square in snapshot.path]
+
+            x, y = self.__selectedPawnPos
+            self.__multiFightPawn = self.__board[y][x]
+
+            # Pośrednie pola bicia (bez pionków w maskach bitowych)
+            markers = snapshot.frozen & ~bb.getOccupiedMask()
+            while markers:
+                low = markers & (-markers)
+                x, y = pos(low.bit_length() - 1)
+                self.__board[y][x] = AbstractPawn()
+                markers ^= low
+
+            self.__frozenMask = snapshot.frozen
+
+        self.__touch()
+
+
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
     def setCurrentPlayer(self, player: int) -> None:
         """
@@ -175,7 +547,27 @@ class Checkers():
          * `player`: indeks gracza (0, 1).
         """
 
+        if (1 == player) != (1 == self.__player):
+            self.__hash ^= self.__zobrist.sideKey
+
         self.__player = player
+        self.__touch(False)
+
+        if self.__subscribers:
+            self.__emit(CheckersEvent.EVENT_TURN)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getPositionHash(self) -> int:
+        """
+        Zwraca 64-bitowy hasz Zobrista aktualnej pozycji
+        (układ pionków oraz strona grająca w obecnej turze).
+        ----
+        Hasz dotyczy pozycji z początku tury, bez zaznaczonego pionka
+        i bez trwającego wielokrotnego bicia.
+        """
+
+        return self.__hash
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -206,6 +598,21 @@ class Checkers():
     def getTextState(self) -> str:
         """
         Zwrócenie tekstowego komunikatu o aktualnym stanie gry.
+        Komunikat budowany jest tylko po zmianie gry
+        (`Checkers.getVersion`).
+        """
+
+        if self.__textStateVersion != self.__version:
+            self.__textState = self.__buildTextState()
+            self.__textStateVersion = self.__version
+
+        return self.__textState
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __buildTextState(self) -> str:
+        """
+        Zbudowanie tekstowego komunikatu o aktualnym stanie gry.
         """
 
         def checkPreviusTurnInfo() -> str:
@@ -241,58 +648,96 @@ class Checkers():
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-    def getDiagonalPawns(self, direction: int, bx: int, by: int) \
-    -> Tuple[List[AbstractPawn]]:
+    def generateMoves(self) -> List[Move]:
         """
-        Zwraca przekątne listy pionków w czterech kierunkach
-        (NW, NE, SW, SE) od dowolnej pozycji na planszy.
+        Zwraca wszystkie dozwolone ruchy gracza w obecnej turze.
         ----
-         * `direction`: Ograniczenie do wyłącznie jednego kierunku.
-          (0 = NW, 1 = NE, 2 = SW, 3 = SE)
-         * `bx`, `by`: pozycje względem których wybierane są przekątne.
+        Obowiązkowe bicia są uwzględnione: jeżeli jakikolwiek pionek
+        może bić, to zwracane są wyłącznie pełne sekwencje bić.
+        Ruchy dotyczą pozycji z początku tury (bez uwzględnienia
+        zaznaczonego pionka i trwającego wielokrotnego bicia).
         """
 
-        colBorder = [
-            lambda x: x >= 0,
-            lambda x: x < self.BOARD_SIZE
-        ]
+        if self.GAMESTATE_END == self.__state:
+            return []
+
+        pos = self.__bitboard.squarePos
 
-        rowBorder = [
-            lambda y: y >= 0,
-            lambda y: y < self.BOARD_SIZE
+        return [
+            Move (
+                pos(start),
+                tuple(pos(s) for s in path),
+                tuple(pos(s) for s in captured)
+            )
+            for start, path, captured
+            in self.__bitboard.generateMoves(self.__player)
         ]
 
-        def grabPawns(x_dir: int, y_dir: int) -> List[AbstractPawn]:
-            result = []
-            x, y = bx, by
-            x_step = (-1) if 0 == x_dir else (+1)
-            y_step = (-1) if 0 == y_dir else (+1)
 
-            x += x_step
-            y += y_step
-            while colBorder[x_dir](x) and colBorder[y_dir](y):
-                result.append(self.__board[y][x])
-                x += x_step
-                y += y_step
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @staticmethod
+    def __buildRays(size: int) -> tuple:
+        """
+        Przygotowanie tablic przekątnych dla danego rozmiaru planszy.
+        Dla każdego pola [X, Y] i każdego kierunku (NW, NE, SW, SE)
+        zapisywana jest krotka kolejnych pozycji na przekątnej
+        oraz jej skrócona wersja (dwa pola) dla zwykłych pionków.
+        """
+
+        rays = []
+        shortRays = []
+
+        for by in range(size):
+            rowOfRays = []
+            rowOfShortRays = []
 
-            return result
+            for bx in range(size):
+                squareRays = []
 
-        if (direction >= 0) and (direction < 4):
-            return grabPawns((direction & 1), ((direction >> 1) & 1))
+                for direction in range(4):
+                    x_step = (+1) if (direction & 1) else (-1)
+                    y_step = (+1) if (direction & 2) else (-1)
 
-        # Kierunek: Północny-Zachód (North-West)
-        nw = grabPawns(0, 0)
+                    ray = []
+                    x, y = (bx + x_step), (by + y_step)
+                    while (0 <= x < size) and (0 <= y < size):
+                        ray.append((x, y))
+                        x += x_step
+                        y += y_step
 
-        # Kierunek: Północny-Wschód (North-East)
-        ne = grabPawns(1, 0)
+                    squareRays.append(tuple(ray))
 
-        # Kierunek: Południowy-Zachód (South-West)
-        sw = grabPawns(0, 1)
+                rowOfRays.append(tuple(squareRays))
+                rowOfShortRays.append(tuple(r[:2] for r in squareRays))
 
-        # Kierunek: Południowy-Wschód (South-East)
-        se = grabPawns(1, 1)
+            rays.append(rowOfRays)
+            shortRays.append(rowOfShortRays)
 
-        return nw, ne, sw, se
+        return rays, shortRays
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getDiagonalPawns(self, direction: int, bx: int, by: int) \
+    -> Tuple[List[AbstractPawn]]:
+        """
+        Zwraca przekątne listy pionków w czterech kierunkach
+        (NW, NE, SW, SE) od dowolnej pozycji na planszy.
+        ----
+         * `direction`: Ograniczenie do wyłącznie jednego kierunku.
+          (0 = NW, 1 = NE, 2 = SW, 3 = SE)
+         * `bx`, `by`: pozycje względem których wybierane są przekątne.
+        """
+
+        board = self.__board
+        rays = self.__raysCache[self.BOARD_SIZE][0][by][bx]
+
+        if (direction >= 0) and (direction < 4):
+            return [board[y][x] for x, y in rays[direction]]
+
+        return tuple(
+            [board[y][x] for x, y in ray]
+            for ray in rays
+        )
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -304,33 +749,38 @@ class Checkers():
          * `sx`, `sy`: pozycja, z której pionek dalej bije.
         """
 
-        diagonals = list(self.getDiagonalPawns((-1), sx, sy))
+        if self.BACKEND_BITBOARDS == self.__backend:
+            # Indeks ciemnego pola jak w `Bitboard.squareIndex`
+            # (bez dodatkowego wywołania funkcji).
+            return self.__bitboard.canCapture (
+                (sy * self.BOARD_SIZE + sx) >> 1,
+                pawn.getPlayer(),
+                pawn.canTakeMultipleSteps(),
+                self.__frozenMask
+            )
 
-        if not pawn.canTakeMultipleSteps():
-            for i, d in enumerate(diagonals):
-                diagonals[i] = d[:2]
+        rays = self.__raysCache[self.BOARD_SIZE] \
+            [0 if pawn.canTakeMultipleSteps() else 1][sy][sx]
 
+        board = self.__board
         player = pawn.getPlayer()
+        frozen = self.__frozenMask
 
-        def checkDiagonal(d: List[AbstractPawn]) -> bool:
+        # Przekątne sprawdzane są do pierwszego napotkanego pionka.
+        for ray in rays:
             enemySpotted = False
-            for x in d:
-                if x is None:
+            for x, y in ray:
+                other = board[y][x]
+                if other is None:
                     if enemySpotted:
                         return True
+                elif (other.getPlayer() != player) and (not enemySpotted) \
+                and not (frozen and self.__isFrozen(x, y)):
+                    enemySpotted = True
                 else:
-                    if (not x.isRedundant()) and (x.getPlayer() != player):
-                        # Nie można przekoczyć dwóch sklejonych pionków!
-                        if enemySpotted:
-                            return False
-                        enemySpotted = True
-                    else:
-                        return False
-            return False
-
-        for d in diagonals:
-            if checkDiagonal(d):
-                return True
+                    # Własny pionek, pionek zbity albo
+                    # dwa sklejone pionki przeciwnika.
+                    break
 
         return False
 
@@ -347,6 +797,23 @@ class Checkers():
          * `dx`, `dy`: wskazana kolumna i wskazany wiersz.
         """
 
+        if self.BACKEND_BITBOARDS == self.__backend:
+            # Indeksy pól jak w `Checkers.canPawnFight`
+            pawn = self.__multiFightPawn
+            steps, captured = self.__bitboard.validateMove (
+                (sy * self.BOARD_SIZE + sx) >> 1,
+                (dy * self.BOARD_SIZE + dx) >> 1,
+                pawn.getPlayer(),
+                pawn.canTakeMultipleSteps(),
+                self.__frozenMask
+            )
+
+            # Oznacz wszystkie pionki na drodze jako martwe
+            for square in captured:
+                self.__frozenMask |= (1 << square)
+
+            return (steps, len(captured))
+
         x_step, y_step = (dx - sx), (dy - sy)
 
         # Anuluj, jeśli ruch nie jest po przekątnej
@@ -356,8 +823,9 @@ class Checkers():
         # Sprawdź kierunek ruchu (NW = 0, NE = 1, SW = 2, SE = 3)
         direction = (int(y_step > 0) << 1) | int(x_step > 0)
 
-        # Skopiuj wszystkie pionki z danej przekątnej
-        diagonal = self.getDiagonalPawns(direction, sx, sy)
+        # Pozycje pól z danej przekątnej
+        ray = self.__raysCache[self.BOARD_SIZE][0][sy][sx][direction]
+        board = self.__board
 
         # Indeks pola na przekątnej po wykonaniu ruchu przez pionka
         d_step = abs(x_step) - 1
@@ -365,7 +833,8 @@ class Checkers():
         # Czy pionek może poruszać się o więcej niż jedno pole?
         if d_step > 0:
             if not self.__multiFightPawn.canTakeMultipleSteps():
-                if (d_step > 1) or (diagonal[0] is None):
+                x, y = ray[0]
+                if (d_step > 1) or (board[y][x] is None):
                     return (0, 0)
 
         player = self.__multiFightPawn.getPlayer()
@@ -374,19 +843,23 @@ class Checkers():
         # lub próbuje przeskoczyć dwa sklejone pionki?
         glued = False
         for i in range((d_step - 1), (-1), (-1)):
-            if diagonal[i] is None:
+            x, y = ray[i]
+            pawn = board[y][x]
+            if pawn is None:
                 glued = False
             else:
-                if diagonal[i].isRedundant() or \
-                (diagonal[i].getPlayer() == player) or glued:
+                if (pawn.getPlayer() == player) or glued \
+                or self.__isFrozen(x, y):
                     return (0, 0)
                 glued = True
 
         # Oznacz wszystkie pionki na drodze jako martwe
         defeated_pawns = 0
         for i in range(0, d_step):
-            if diagonal[i] is not None:
-                diagonal[i].setState(AbstractPawn.STATE_GONE)
+            x, y = ray[i]
+            if board[y][x] is not None:
+                self.__frozenMask |= \
+                    1 << self.__bitboard.squareIndex(x, y)
                 defeated_pawns += 1
 
         # Jeżeli nie zbito żadnego pionka, to czy zaznaczony
@@ -404,11 +877,7 @@ class Checkers():
         Usunięcie wszystkich nieprawdziwych pionków po skończonym biciu.
         """
 
-        for y in range(len(self.__board)):
-            for x, pawn in enumerate(self.__board[y]):
-                if pawn is not None:
-                    if pawn.isRedundant():
-                        self.__board[y][x] = None
+        self.__removeFrozenPawns(True)
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -418,13 +887,134 @@ class Checkers():
         Dodatkowo następuje usunięcie pozycji wielokrotnego bicia.
         """
 
-        for row in self.__board:
-            for pawn in row:
-                if (pawn is not None) \
-                and (AbstractPawn.STATE_GONE == pawn.getState()):
-                    pawn.setState(AbstractPawn.STATE_STANDBY)
+        self.__removeFrozenPawns(False)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __removeFrozenPawns(self, capture: bool) -> None:
+        """
+        Usunięcie pośrednich pól bicia oraz (jeśli `capture`)
+        zbitych pionków, czyli pól zapisanych w `__frozenMask`.
+        Zbite pionki trafiają do `__capturedPawns`.
+        """
+
+        bb = self.__bitboard
+        board = self.__board
+
+        self.__capturedPawns = []
+
+        mask = self.__frozenMask
+        while mask:
+            low = mask & (-mask)
+            square = low.bit_length() - 1
+            x, y = bb.squarePos(square)
+            pawn = board[y][x]
 
-        self.removeMarkedPawns()
+            if pawn.getPlayer() < 0:
+                board[y][x] = None
+            elif capture:
+                self.__capturedPawns.append((x, y, pawn))
+                board[y][x] = None
+                bb.removePiece(square)
+
+            mask ^= low
+
+        if self.__frozenMask:
+            self.__touch()
+
+        self.__frozenMask = 0
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __isFrozen(self, x: int, y: int) -> bool:
+        """
+        Czy pole jest zablokowane w trwającym biciu
+        (zbity pionek lub pośrednie pole bicia)?
+        """
+
+        return bool (
+            (self.__frozenMask >> self.__bitboard.squareIndex(x, y)) & 1
+        )
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getPawnState(self, x: int, y: int) -> int:
+        """
+        Zwraca stan pionka na danym polu (jedna ze stałych
+        `AbstractPawn.STATE_*`) albo `None` dla pustego pola.
+        ----
+         * `x`, `y`: pozycja pola na planszy.
+        """
+
+        pawn = self.__board[y][x]
+
+        if pawn is None:
+            return None
+
+        if pawn.getPlayer() < 0:
+            return AbstractPawn.STATE_MARKED
+
+        if self.__isFrozen(x, y):
+            return AbstractPawn.STATE_GONE
+
+        if (self.GAMESTATE_PUT == self.__state) \
+        and ((x, y) == self.__selectedPawnPos):
+            return AbstractPawn.STATE_SELECTED
+
+        return AbstractPawn.STATE_STANDBY
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __rescanFightingPawns(self) -> None:
+        """
+        Przejrzenie całej planszy: policzenie pionków obu graczy
+        i wyszukanie wszystkich pionków mogących wykonać bicie.
+        """
+
+        self.__fightingPawns = [set(), set()]
+        self.__leftPawns = [0, 0]
+
+        for y in range(len(self.__board)):
+            for x, pawn in enumerate(self.__board[y]):
+                if pawn is not None:
+                    player = pawn.getPlayer()
+                    self.__leftPawns[player] += 1
+
+                    if self.canPawnFight(pawn, x, y):
+                        self.__fightingPawns[player].add((x, y))
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __recheckFightingPawns(self, changes: list) -> None:
+        """
+        Ponowne sprawdzenie bić wyłącznie dla pionków stojących
+        na przekątnych przechodzących przez pola zmienione
+        w ostatnim ruchu (`__touchedSquares`).
+        ----
+         * `changes`: lista, do której trafiają pary (gracz, pole)
+           dodane lub usunięte z `__fightingPawns` (do cofnięcia ruchu).
+        """
+
+        rays = self.__raysCache[self.BOARD_SIZE][0]
+        board = self.__board
+        fighting = self.__fightingPawns
+
+        checked = set()
+        for tx, ty in self.__touchedSquares:
+            checked.add((tx, ty))
+            for ray in rays[ty][tx]:
+                checked.update(ray)
+
+        for x, y in checked:
+            pawn = board[y][x]
+            owner = pawn.getPlayer() \
+                if (pawn is not None) and self.canPawnFight(pawn, x, y) \
+                else -1
+
+            for player in range(2):
+                if ((x, y) in fighting[player]) != (owner == player):
+                    fighting[player] ^= {(x, y)}
+                    changes.append((player, (x, y)))
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -438,27 +1028,239 @@ class Checkers():
         """
 
         self.__obligatoryPawns = []
-        left_pawns = [0, 0]
 
-        for y in range(len(self.__board)):
-            for x, pawn in enumerate(self.__board[y]):
-                if pawn is not None:
-                    player = pawn.getPlayer()
-                    left_pawns[player] += 1
+        if self.BACKEND_BITBOARDS == self.__backend:
+            bb = self.__bitboard
+            left_pawns = [bb.countPieces(0), bb.countPieces(1)]
+
+            mask = bb.getCapturingPieces(self.__player)
+            while mask:
+                low = mask & (-mask)
+                self.__obligatoryPawns.append (
+                    bb.squarePos(low.bit_length() - 1)
+                )
+                mask ^= low
+
+        else:
+            # Pełne przejrzenie planszy tylko po jej podmianie,
+            # w pozostałych przypadkach wystarczą zmienione przekątne.
+            if self.__fightingPawns is None:
+                self.__rescanFightingPawns()
+            else:
+                # Zmiany trafiają do rekordu cofania bieżącego ruchu
+                self.__leftPawns[self.__player] -= \
+                    len(self.__capturedPawns)
+                self.__recheckFightingPawns(self.__undoStack[-1][-1])
 
-                    if (player == self.__player) \
-                    and self.canPawnFight(pawn, x, y):
-                        self.__obligatoryPawns.append((x, y))
+            left_pawns = self.__leftPawns
+            self.__obligatoryPawns = list(self.__fightingPawns[self.__player])
 
         # Czy na planszy nie został żaden pionek któregoś z graczy?
         for i, c in enumerate(left_pawns):
             if c <= 0:
                 # Zwycięzcą jest gracz, którego pionki zostały
+                if (i ^ 1) != self.__player:
+                    self.__hash ^= self.__zobrist.sideKey
                 self.__player = i ^ 1
                 self.__state = self.GAMESTATE_END
+
+                if self.__subscribers:
+                    self.__emit(CheckersEvent.EVENT_GAME_OVER)
                 return
 
 
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __cancelSelection(self) -> None:
+        """
+        Odznaczenie podniesionego pionka i wycofanie
+        niedokończonego (wielokrotnego) bicia.
+        """
+
+        if self.GAMESTATE_PUT == self.__state:
+            self.resetMarkedPawns()
+            self.__state = self.GAMESTATE_TAKE
+
+            if self.__subscribers:
+                self.__emit (
+                    CheckersEvent.EVENT_DESELECTED,
+                    (self.__selectedPawnPos,) + tuple(self.__movePath)
+                )
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __commitMove(self, move: Move) -> None:
+        """
+        Przeniesienie pionka na ostatnie pole ruchu, ewentualny awans,
+        zapamiętanie danych do cofnięcia ruchu i przekazanie tury.
+        Zbite pionki muszą być już usunięte z planszy (`__capturedPawns`).
+        """
+
+        board = self.__board
+        bb = self.__bitboard
+        (sx, sy), (x, y) = move.start, move.path[-1]
+
+        pawn = board[sy][sx]
+
+        # Ostatni element rekordu to lista zmian `__fightingPawns`
+        # uzupełniana w `__updateGameData` (`None`, jeśli bicia
+        # nie są jeszcze śledzone i trzeba będzie przejrzeć planszę).
+        self.__undoStack.append((
+            move, pawn, self.__capturedPawns, self.__hash,
+            self.__player, self.__state, self.__turninfo,
+            self.__obligatoryPawns,
+            None if (self.__fightingPawns is None) else []
+        ))
+
+        src, dst = bb.squareIndex(sx, sy), bb.squareIndex(x, y)
+        keys = self.__zobrist.pieceKeys
+        kind = self.__pieceKind(pawn)
+
+        board[sy][sx] = None
+        board[y][x] = pawn
+        bb.movePiece(src, dst)
+        self.__hash ^= keys[kind][src] ^ keys[kind][dst]
+
+        for cx, cy, c in self.__capturedPawns:
+            self.__hash ^= keys[self.__pieceKind(c)][bb.squareIndex(cx, cy)]
+
+        # Czy pionek może awansować?
+        promotion = (0, len(board) - 1)
+        promoted = (type(pawn) == WeakPawn) \
+            and (promotion[self.__player] == y)
+        if promoted:
+            board[y][x] = StrongPawn(self.__player)
+            bb.promotePiece(dst)
+            self.__hash ^= keys[kind][dst] \
+                ^ keys[Bitboard.MASK_KINGS + self.__player][dst]
+
+        self.__touchedSquares = [(sx, sy), (x, y)] \
+            + [(cx, cy) for cx, cy, _ in self.__capturedPawns]
+
+        if self.__subscribers:
+            self.__emit(CheckersEvent.EVENT_MOVED, move.getClicks())
+            if move.captured:
+                self.__emit(CheckersEvent.EVENT_CAPTURED, move.captured)
+            if promoted:
+                self.__emit(CheckersEvent.EVENT_PROMOTED, ((x, y),))
+
+        # Przekazanie tury dla kolejnego gracza
+        self.__player = self.__player ^ 1
+        self.__hash ^= self.__zobrist.sideKey
+
+        if self.__subscribers:
+            self.__emit(CheckersEvent.EVENT_TURN)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @staticmethod
+    def __pieceKind(pawn: AbstractPawn) -> int:
+        """
+        Indeks maski bitowej (oraz kluczy Zobrista) dla danego pionka.
+        """
+
+        if pawn.canTakeMultipleSteps():
+            return Bitboard.MASK_KINGS + pawn.getPlayer()
+
+        return Bitboard.MASK_MEN + pawn.getPlayer()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def makeMove(self, move: Move) -> None:
+        """
+        Wykonanie pełnego ruchu (bez wskazywania kolejnych pól).
+        Ruch można wycofać funkcją `Checkers.unmakeMove`.
+        ----
+         * `move`: dozwolony ruch zwrócony przez `Checkers.generateMoves`.
+        """
+
+        self.__cancelSelection()
+
+        board = self.__board
+        bb = self.__bitboard
+
+        self.__capturedPawns = []
+        for x, y in move.captured:
+            self.__capturedPawns.append((x, y, board[y][x]))
+            board[y][x] = None
+            bb.removePiece(bb.squareIndex(x, y))
+
+        self.__turninfo = self.TURNINFO_NOTHING
+        self.__commitMove(move)
+        self.__updateGameData()
+
+        # Jak `__touch`, bez wywołania funkcji (przeszukiwanie)
+        self.__version += 1
+        self.__boardVersion = self.__version
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getMoveHistory(self) -> List[Move]:
+        """
+        Zwraca ruchy wykonane od początku gry (lub od ostatniej
+        podmiany planszy), w kolejności ich wykonania.
+        """
+
+        return [record[0] for record in self.__undoStack]
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def unmakeMove(self) -> Move:
+        """
+        Cofnięcie ostatniego ruchu (wykonanego funkcją `Checkers.makeMove`
+        lub poprzez `Checkers.processInput`). Zwraca cofnięty ruch
+        albo `None`, jeżeli nie ma już ruchów do cofnięcia.
+        """
+
+        if not self.__undoStack:
+            return None
+
+        self.__cancelSelection()
+
+        (
+            move, pawn, captured, self.__hash,
+            self.__player, self.__state, self.__turninfo,
+            self.__obligatoryPawns, changes
+        ) = self.__undoStack.pop()
+
+        if changes is None:
+            self.__fightingPawns = None
+        else:
+            for player, square in reversed(changes):
+                self.__fightingPawns[player] ^= {square}
+            self.__leftPawns[self.__player ^ 1] += len(captured)
+
+        board = self.__board
+        bb = self.__bitboard
+        (sx, sy), (x, y) = move.start, move.path[-1]
+
+        board[y][x] = None
+        bb.removePiece(bb.squareIndex(x, y))
+
+        board[sy][sx] = pawn
+        bb.setPiece (
+            bb.squareIndex(sx, sy),
+            pawn.getPlayer(), pawn.canTakeMultipleSteps()
+        )
+
+        for cx, cy, c in captured:
+            board[cy][cx] = c
+            bb.setPiece (
+                bb.squareIndex(cx, cy),
+                c.getPlayer(), c.canTakeMultipleSteps()
+            )
+
+        self.__version += 1
+        self.__boardVersion = self.__version
+
+        if self.__subscribers:
+            self.__emit (
+                CheckersEvent.EVENT_UNDONE, move.getClicks() + move.captured
+            )
+            self.__emit(CheckersEvent.EVENT_TURN)
+
+        return move
+
+
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
     def processInput(self, x: int, y: int) -> bool:
         """
@@ -469,10 +1271,15 @@ class Checkers():
          * `y`: indeks wiersza, od góry do dołu [0-7].
         """
 
+        turninfoBefore = self.__turninfo
+        stateBefore = (self.__state, self.__player)
         self.__turninfo = self.TURNINFO_NOTHING
 
         checkPawns = False
 
+        # Pola zmienione przez wskazanie (te same, co w zdarzeniach)
+        changed = []
+
         def subprocess() -> bool:
 
             # Czy wybrano "białe" pole zamiast pola "czarnego"?
@@ -499,15 +1306,18 @@ class Checkers():
                         return True
 
                 self.__multiFightPawn = self.__board[y][x]
-                self.__multiFightPawn.setState(AbstractPawn.STATE_SELECTED)
                 self.__selectedPawnPos = (x, y)
                 self.__fightingPawnPos = self.__selectedPawnPos
+                self.__movePath = []
                 self.__state = self.GAMESTATE_PUT
+
+                changed.append((x, y))
+                if self.__subscribers:
+                    self.__emit(CheckersEvent.EVENT_SELECTED, ((x, y),))
                 return True
 
             # Czy gracz powinien przesunąć pionka?
             if self.GAMESTATE_PUT == self.__state:
-                no_more_moves = False
                 accept_move = False
                 sx, sy = self.__selectedPawnPos
                 fx, fy = self.__fightingPawnPos
@@ -519,12 +1329,10 @@ class Checkers():
                 # Czy odklikniętio zaznaczonego pionka?
                 if (sx == x) and (sy == y):
                     self.__turninfo = self.TURNINFO_CANCELLED
-                    no_more_moves = True
 
                 # Czy dane pole jest zablokowane przez innego pionka?
                 elif self.__board[y][x] is not None:
                     self.__turninfo = self.TURNINFO_INVALID_MOVE
-                    no_more_moves = True
 
                 else:
 
@@ -540,18 +1348,24 @@ class Checkers():
 
                                 # Dodanie pośredniego pola bicia
                                 self.__board[y][x] = AbstractPawn()
+                                self.__frozenMask |= \
+                                    1 << self.__bitboard.squareIndex(x, y)
                                 self.__fightingPawnPos = (x, y)
+                                self.__movePath.append((x, y))
 
                                 # Pozostanie w stanie przeskakiwania na pola
                                 self.__state = self.GAMESTATE_PUT
                                 self.__turninfo = self.TURNINFO_FIGHT_AGAIN
+
+                                changed.append((x, y))
+                                if self.__subscribers:
+                                    self.__emit (
+                                        CheckersEvent.EVENT_JUMPED, ((x, y),)
+                                    )
                                 return True
                             else:
-                                no_more_moves = True
                                 accept_move = True
                         else:
-                            no_more_moves = True
-
                             # Nie zbito żadnego pionka, ale istnieje
                             # przynajmniej jedno obowiązkowe bicie!
                             if len(self.__obligatoryPawns) > 0:
@@ -561,34 +1375,30 @@ class Checkers():
 
                     else:
                         self.__turninfo = self.TURNINFO_INVALID_MOVE
-                        no_more_moves = True
-
-                # Odznaczenie pionka, kiedy nie może już się poruszać.
-                if no_more_moves:
-                    self.__multiFightPawn.setState(AbstractPawn.STATE_STANDBY)
 
                 # Przeniesienie zaznaczonego pionka na nową pozycję
                 # oraz usunięcie zbędnych (pokonanych i pośrednich) pionków
                 if accept_move:
-                    pawn = self.__board[sy][sx]
-                    self.__board[y][x] = pawn
-                    self.__board[sy][sx] = None
                     self.removeMarkedPawns()
-
-                    # Czy pionek może awansować?
-                    promotion = (0, len(self.__board) - 1)
-                    if (type(pawn) == WeakPawn) \
-                    and promotion[self.__player] == y:
-                        self.__board[y][x] = StrongPawn(self.__player)
-
-                    # Przekazanie tury dla kolejnego gracza oraz sprawdzenie
-                    # stanu planszy po przeniesieniu jednego pionka.
-                    self.__player = self.__player ^ 1
+                    self.__movePath.append((x, y))
+                    move = Move (
+                        (sx, sy), tuple(self.__movePath),
+                        tuple((cx, cy) for cx, cy, _ in self.__capturedPawns)
+                    )
+                    changed.extend(move.getClicks() + move.captured)
+                    self.__commitMove(move)
+
+                    # Sprawdzenie stanu planszy po przeniesieniu pionka.
                     nonlocal checkPawns
                     checkPawns = True
                 else:
                     self.resetMarkedPawns()
 
+                    squares = ((sx, sy),) + tuple(self.__movePath)
+                    changed.extend(squares)
+                    if self.__subscribers:
+                        self.__emit(CheckersEvent.EVENT_DESELECTED, squares)
+
                 return True
 
             return False
@@ -596,7 +1406,70 @@ class Checkers():
         t = subprocess()
         if checkPawns:
             self.__updateGameData()
+
+        if self.__subscribers and (turninfoBefore != self.__turninfo):
+            self.__emit(CheckersEvent.EVENT_INFO)
+
+        # Kolejność wierszami, jak w `Checkers.getTextBoard`.
+        self.__changedSquares = sorted (
+            set(changed), key = lambda xy: (xy[1], xy[0])
+        )
+
+        if self.__changedSquares:
+            self.__touch()
+        elif (turninfoBefore != self.__turninfo) \
+        or (stateBefore != (self.__state, self.__player)):
+            self.__touch(False)
+
         return t
 
 
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getChangedSquares(self) -> List[Tuple[int, int]]:
+        """
+        Zwraca pozycje [X, Y] pól, których tekstowa reprezentacja
+        (patrz: `Checkers.getTextBoard`) zmieniła się w ostatnim
+        wywołaniu `Checkers.processInput`.
+        """
+
+        return list(self.__changedSquares)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def subscribe(self, callback: Callable[[CheckersEvent], None]) -> None:
+        """
+        Rejestracja funkcji wywoływanej po każdej zmianie w grze
+        (zaznaczenie pionka, ruch, bicie, awans, zmiana tury,
+        koniec gry...), zamiast odpytywania całej planszy.
+        ----
+         * `callback`: funkcja przyjmująca zdarzenie (`CheckersEvent`).
+        """
+
+        self.__subscribers.append(callback)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def unsubscribe(self, callback: Callable[[CheckersEvent], None]) -> None:
+        """
+        Wyrejestrowanie funkcji dodanej przez `Checkers.subscribe`.
+        """
+
+        if callback in self.__subscribers:
+            self.__subscribers.remove(callback)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __emit(self, kind: int, squares: tuple = ()) -> None:
+        """
+        Przekazanie zdarzenia wszystkim subskrybentom.
+        Wywołania poprzedza sprawdzenie, czy ktokolwiek subskrybuje,
+        aby przeszukiwanie bez subskrybentów nie tworzyło zdarzeń.
+        """
+
+        event = CheckersEvent(kind, self.__player, tuple(squares))
+
+        for callback in list(self.__subscribers):
+            callback(event)
+
+
 ################################################################
@@ -0,0 +1,60 @@
+################################################################
+# Warcaby: "/src/CheckersEvent.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+from typing import NamedTuple, Tuple
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class CheckersEvent(NamedTuple):
+    """
+    Zdarzenie w grze "Warcaby" przekazywane subskrybentom
+    (patrz: `Checkers.subscribe`).
+    ----
+     * `kind`: rodzaj zdarzenia (jedna ze stałych `EVENT_*`).
+     * `player`: gracz, którego dotyczy zdarzenie (dla `EVENT_TURN`
+      gracz w nowej turze, dla `EVENT_GAME_OVER` zwycięzca).
+     * `squares`: pozycje [X, Y] pól, których tekstowa reprezentacja
+      (patrz: `Checkers.getTextSquare`) mogła się zmienić.
+    """
+
+    # Podmiana całej planszy (np. nowa gra): należy odświeżyć wszystko
+    EVENT_RESET = 0
+
+    # Zaznaczenie pionka i jego odznaczenie (razem z wycofaniem
+    # pośrednich pól niedokończonego bicia)
+    EVENT_SELECTED = 1
+    EVENT_DESELECTED = 2
+
+    # Pośrednie pole lądowania w trwającym wielokrotnym biciu
+    EVENT_JUMPED = 3
+
+    # Wykonany ruch: pole startowe i kolejne pola lądowania
+    EVENT_MOVED = 4
+
+    # Zbite pionki przeciwnika (usunięte z planszy)
+    EVENT_CAPTURED = 5
+
+    # Awans pionka na damkę
+    EVENT_PROMOTED = 6
+
+    # Cofnięty ruch (`Checkers.unmakeMove`)
+    EVENT_UNDONE = 7
+
+    # Zmiana gracza w obecnej turze
+    EVENT_TURN = 8
+
+    # Zmiana informacji o turze (`Checkers.TURNINFO_*`)
+    EVENT_INFO = 9
+
+    # Koniec gry
+    EVENT_GAME_OVER = 10
+
+    kind: int
+    player: int
+    squares: Tuple[Tuple[int, int], ...]
+
+
+################################################################
@@ -0,0 +1,462 @@
+################################################################
+# Warcaby: "/src/ComputerPlayer.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import time
+from typing import TYPE_CHECKING, List, Optional
+
+from Bitboard import Bitboard
+from Checkers import Checkers
+from Move import Move
+
+if TYPE_CHECKING:
+    from OpeningBook import OpeningBook
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class SearchInterrupted(Exception):
+    """
+    Przerwanie przeszukiwania po wyczerpaniu limitu węzłów lub czasu.
+    """
+
+    pass
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class ComputerPlayer():
+    """
+    Komputerowy przeciwnik w grze "Warcaby".
+    ----
+    Ruch wybierany jest algorytmem negamax z cięciami alfa-beta,
+    iteracyjnym pogłębianiem, tablicą transpozycji o stałym rozmiarze
+    oraz porządkowaniem ruchów (ruch z tablicy transpozycji,
+    bicia wielu pionków, ruchy "zabójcze").
+    """
+
+    # Ocena pozycji (z punktu widzenia gracza w danej turze)
+    SCORE_WIN = 100000
+    SCORE_MAN = 100
+    SCORE_KING = 300
+    SCORE_ADVANCE = 4
+    SCORE_CENTRE = 6
+
+    # Domyślny limit czasu na jeden ruch (w sekundach)
+    DEFAULT_TIME = 1.0
+
+    # Rodzaje wartości zapisywanych w tablicy transpozycji
+    BOUND_EXACT = 0
+    BOUND_LOWER = 1
+    BOUND_UPPER = 2
+
+    # Co ile węzłów sprawdzany jest limit czasu
+    TIME_CHECK_NODES = 1024
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __init__(self, player: int, maxNodes: int = None, \
+    maxTime: float = None, maxDepth: int = 32, \
+    tableBits: int = 16, book: Optional['OpeningBook'] = None) -> None:
+        """
+        Inicjalizacja klasy `ComputerPlayer`.
+        ----
+         * `player`: numer gracza (0 lub 1), którym gra komputer.
+         * `maxNodes`: limit odwiedzonych węzłów na jeden ruch.
+         * `maxTime`: limit czasu na jeden ruch (w sekundach).
+          Jeżeli nie podano żadnego limitu, to używany jest
+          `ComputerPlayer.DEFAULT_TIME`.
+         * `maxDepth`: maksymalna głębokość iteracyjnego pogłębiania.
+         * `tableBits`: rozmiar tablicy transpozycji (2^`tableBits`).
+         * `book`: księga otwarć (`OpeningBook`), z której ruchy
+          wybierane są bez przeszukiwania.
+        """
+
+        self.__player = player
+        self.__book = book
+
+        if (maxNodes is None) and (maxTime is None):
+            maxTime = self.DEFAULT_TIME
+
+        self.__maxNodes = maxNodes
+        self.__maxTime = maxTime
+        self.__maxDepth = maxDepth
+
+        # Tablica transpozycji: krotki (hasz, głębokość, wynik,
+        # rodzaj wyniku, najlepszy ruch, numer przeszukiwania).
+        self.__tableMask = (1 << tableBits) - 1
+        self.__table = [None] * (1 << tableBits)
+        self.__generation = 0
+
+        # Ruchy "zabójcze" (dwa na każdy poziom drzewa)
+        self.__killers = []
+
+        # Plansza używana wyłącznie do przeszukiwania
+        self.__board = Checkers(Checkers.BACKEND_BITBOARDS)
+        self.__board.newGame()
+
+        # Statystyki ostatniego przeszukiwania
+        self.__nodes = 0
+        self.__depth = 0
+        self.__score = 0
+
+        self.__deadline = None
+
+        # Maski pól do oceny pozycji
+        self.__buildEvaluationMasks()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __buildEvaluationMasks(self) -> None:
+        """
+        Przygotowanie masek wierszy (awans zwykłych pionków)
+        oraz środka planszy.
+        """
+
+        size = Checkers.BOARD_SIZE
+        bb = Bitboard(size)
+
+        self.__rowMasks = [0] * size
+        self.__centreMask = 0
+
+        for y in range(size):
+            for x in range(size):
+                square = bb.squareIndex(x, y)
+                if square < 0:
+                    continue
+                self.__rowMasks[y] |= (1 << square)
+                if (2 <= x < size - 2) and (2 <= y < size - 2):
+                    self.__centreMask |= (1 << square)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getPlayer(self) -> int:
+        """
+        Zwraca numer gracza, którym gra komputer.
+        """
+
+        return self.__player
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getSearchInfo(self) -> dict:
+        """
+        Zwraca statystyki ostatniego przeszukiwania:
+        liczbę węzłów, osiągniętą głębokość i ocenę pozycji.
+        """
+
+        return {
+            'nodes': self.__nodes,
+            'depth': self.__depth,
+            'score': self.__score
+        }
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def isMyTurn(self, checkers: Checkers) -> bool:
+        """
+        Czy komputer powinien teraz wykonać ruch w danej grze?
+        """
+
+        state, _, player = checkers.getGameState()
+
+        return (Checkers.GAMESTATE_TAKE == state) \
+            and (self.__player == player)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def playTurn(self, checkers: Checkers) -> bool:
+        """
+        Wykonanie ruchu komputera w danej grze, jeśli jest jego tura.
+        Zwraca prawdę, jeśli wykonano ruch.
+        """
+
+        if not self.isMyTurn(checkers):
+            return False
+
+        move = self.chooseMove(checkers)
+        if move is None:
+            return False
+
+        checkers.makeMove(move)
+        return True
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def evaluate(self, checkers: Checkers) -> int:
+        """
+        Ocena pozycji z punktu widzenia gracza w obecnej turze:
+        materiał (pionki i damki), awans zwykłych pionków
+        oraz kontrola środka planszy.
+        """
+
+        _, _, player = checkers.getGameState()
+        masks = checkers.getBitboards()
+
+        score = 0
+        for side in range(2):
+            men = masks[Bitboard.MASK_MEN + side]
+            kings = masks[Bitboard.MASK_KINGS + side]
+
+            value = self.SCORE_MAN * men.bit_count() \
+                + self.SCORE_KING * kings.bit_count() \
+                + self.SCORE_CENTRE * ((men | kings) & self.__centreMask) \
+                    .bit_count()
+
+            # Gracz pierwszy awansuje w stronę wiersza 0,
+            # gracz drugi w stronę ostatniego wiersza.
+            for y, rowMask in enumerate(self.__rowMasks):
+                rows = (len(self.__rowMasks) - 1 - y) if (0 == side) else y
+                value += self.SCORE_ADVANCE * rows \
+                    * (men & rowMask).bit_count()
+
+            score += value if (side == player) else (-value)
+
+        return score
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def chooseMove(self, checkers: Checkers) -> Move:
+        """
+        Wybranie najlepszego ruchu dla gracza w obecnej turze.
+        Zwraca `None`, jeśli gracz nie ma żadnego ruchu.
+        ----
+         * `checkers`: gra w stanie podnoszenia pionka, w której
+          należy wykonać ruch (nie jest modyfikowana w trakcie
+          przeszukiwania).
+        """
+
+        board = self.__board
+        board.restore(checkers.snapshot())
+
+        moves = board.generateMoves()
+        if not moves:
+            return None
+        if 1 == len(moves):
+            return moves[0]
+
+        if self.__book is not None:
+            move = self.__book.chooseMove(board)
+            if move is not None:
+                self.__nodes, self.__depth, self.__score = 0, 0, 0
+                return move
+
+        return self.search(board)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def search(self, checkers: Checkers) -> Move:
+        """
+        Iteracyjne pogłębianie aż do wyczerpania limitu węzłów lub czasu.
+        Zwraca najlepszy ruch z ostatniej ukończonej iteracji.
+        ----
+         * `checkers`: gra przeszukiwana funkcjami `Checkers.makeMove`
+          i `Checkers.unmakeMove` (po przeszukiwaniu pozycja jest
+          taka sama jak przed nim).
+        """
+
+        self.__nodes = 0
+        self.__depth = 0
+        self.__score = 0
+        self.__generation += 1
+        self.__killers = [[None, None] for _ in range(self.__maxDepth + 64)]
+
+        self.__deadline = None
+        if self.__maxTime is not None:
+            self.__deadline = time.perf_counter() + self.__maxTime
+
+        bestMove = self.orderMoves(checkers.generateMoves(), None, 0)[0]
+
+        try:
+            for depth in range(1, (self.__maxDepth + 1)):
+                score = self.__negamax (
+                    checkers, depth, (-self.SCORE_WIN), self.SCORE_WIN, 0
+                )
+
+                entry = self.__probe(checkers.getPositionHash())
+                if (entry is not None) and (entry[4] is not None):
+                    bestMove = entry[4]
+
+                self.__depth = depth
+                self.__score = score
+
+                # Wygrana lub przegrana jest już pewna.
+                if abs(score) > (self.SCORE_WIN - 1000):
+                    break
+
+        except SearchInterrupted:
+            pass
+
+        return bestMove
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def orderMoves(self, moves: List[Move], bestMove: Move, ply: int) \
+    -> List[Move]:
+        """
+        Uporządkowanie ruchów: najpierw ruch z tablicy transpozycji,
+        potem bicia największej liczby pionków i ruchy "zabójcze".
+        """
+
+        killers = self.__killers[ply] if ply < len(self.__killers) \
+            else (None, None)
+
+        def key(move: Move) -> int:
+            if move == bestMove:
+                return (-1000)
+            k = (-10) * len(move.captured)
+            if move == killers[0]:
+                k -= 2
+            elif move == killers[1]:
+                k -= 1
+            return k
+
+        return sorted(moves, key = key)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __probe(self, h: int) -> tuple:
+        """
+        Odczyt wpisu z tablicy transpozycji (lub `None`).
+        """
+
+        entry = self.__table[h & self.__tableMask]
+        if (entry is not None) and (entry[0] == h):
+            return entry
+        return None
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __store(self, h: int, depth: int, score: int, bound: int, \
+    move: Move) -> None:
+        """
+        Zapis wpisu w tablicy transpozycji.
+        ----
+        Wpis jest zastępowany, jeśli pochodzi z wcześniejszego
+        przeszukiwania, dotyczy tej samej pozycji lub nowy wpis
+        ma przynajmniej taką samą głębokość.
+        """
+
+        i = h & self.__tableMask
+        old = self.__table[i]
+
+        if (old is None) or (old[5] != self.__generation) \
+        or (old[0] == h) or (depth >= old[1]):
+            self.__table[i] = (h, depth, score, bound, move, self.__generation)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __negamax(self, checkers: Checkers, depth: int, \
+    alpha: int, beta: int, ply: int) -> int:
+        """
+        Przeszukiwanie negamax z cięciami alfa-beta.
+        Bicia są zawsze przeszukiwane dalej (nawet na głębokości 0),
+        więc ocena pozycji nie zapada w trakcie wymiany pionków.
+        """
+
+        self.__nodes += 1
+
+        if (self.__maxNodes is not None) \
+        and (self.__nodes >= self.__maxNodes):
+            raise SearchInterrupted()
+
+        if (self.__deadline is not None) \
+        and (0 == (self.__nodes % self.TIME_CHECK_NODES)) \
+        and (time.perf_counter() >= self.__deadline):
+            raise SearchInterrupted()
+
+        # Brak ruchów (również po zakończeniu gry zbiciem ostatniego
+        # pionka) oznacza przegraną gracza w obecnej turze.
+        moves = checkers.generateMoves()
+        if not moves:
+            return ply - self.SCORE_WIN
+
+        if (depth <= 0) and (not moves[0].captured):
+            return self.evaluate(checkers)
+
+        # Wyniki wygranych zapisywane są względem bieżącego węzła.
+        h = checkers.getPositionHash()
+        entry = self.__probe(h)
+        ttMove = None
+
+        if entry is not None:
+            ttMove = entry[4]
+            if entry[1] >= depth:
+                score = self.__fromTable(entry[2], ply)
+                if self.BOUND_EXACT == entry[3]:
+                    return score
+                if (self.BOUND_LOWER == entry[3]) and (score >= beta):
+                    return score
+                if (self.BOUND_UPPER == entry[3]) and (score <= alpha):
+                    return score
+
+        alphaOrig = alpha
+        bestScore = (-self.SCORE_WIN) - 1
+        bestMove = None
+
+        for move in self.orderMoves(moves, ttMove, ply):
+            checkers.makeMove(move)
+            try:
+                score = -self.__negamax (
+                    checkers, (depth - 1), (-beta), (-alpha), (ply + 1)
+                )
+            finally:
+                checkers.unmakeMove()
+
+            if score > bestScore:
+                bestScore = score
+                bestMove = move
+
+            if score > alpha:
+                alpha = score
+
+            if alpha >= beta:
+                if (not move.captured) and (ply < len(self.__killers)):
+                    killers = self.__killers[ply]
+                    if killers[0] != move:
+                        killers[1] = killers[0]
+                        killers[0] = move
+                break
+
+        if bestScore <= alphaOrig:
+            bound = self.BOUND_UPPER
+        elif bestScore >= beta:
+            bound = self.BOUND_LOWER
+        else:
+            bound = self.BOUND_EXACT
+
+        self.__store (
+            h, max(depth, 0), self.__toTable(bestScore, ply), bound, bestMove
+        )
+
+        return bestScore
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __toTable(self, score: int, ply: int) -> int:
+        """
+        Zamiana wyniku wygranej (zależnego od odległości od korzenia)
+        na wynik zależny od odległości od danego węzła.
+        """
+
+        if score > (self.SCORE_WIN - 1000):
+            return score + ply
+        if score < (1000 - self.SCORE_WIN):
+            return score - ply
+        return score
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __fromTable(self, score: int, ply: int) -> int:
+        """
+        Odwrotność funkcji `ComputerPlayer.__toTable`.
+        """
+
+        if score > (self.SCORE_WIN - 1000):
+            return score - ply
+        if score < (1000 - self.SCORE_WIN):
+            return score + ply
+        return score
+
+
+################################################################
@@ -4,32 +4,56 @@
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-from typing import Tuple
+import sys
+from typing import List, TextIO, Tuple
 
 from AbstractUi import AbstractUi
 from Checkers import Checkers
+from ComputerPlayer import ComputerPlayer
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
 class ConsoleUi(AbstractUi):
     """
     Konsolowy interfejs do gry "Warcaby".
+    ----
+    Każda klatka (komunikat i plansza) budowana jest w jednym buforze
+    i wypisywana jednym wywołaniem. W trybie ANSI po pierwszej klatce
+    wysyłane są tylko zmienione fragmenty wierszy (z pozycjonowaniem
+    kursora), co ogranicza ruch na wolnych łączach.
     """
 
+    # Sekwencje sterujące terminala ANSI
+    ANSI_CLEAR_SCREEN = '\x1b[2J\x1b[H'
+    ANSI_CLEAR_LINE = '\x1b[2K'
+    ANSI_CLEAR_BELOW = '\x1b[J'
+
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-    def __init__(self, checkers: Checkers) -> None:
+    def __init__(self, checkers: Checkers, \
+    computer: ComputerPlayer = None, output: TextIO = None, \
+    ansi: bool = False) -> None:
         """
         Inicjalizacja klasy `ConsoleUi`.
         ----
          * checkers: instancja Warcabów obsługiwana przez nowy interfejs.
+         * computer: opcjonalny komputerowy przeciwnik.
+         * output: strumień wyjściowy (domyślnie `sys.stdout`).
+         * ansi: przerysowywanie wyłącznie zmienionych pól
+          (wymaga terminala obsługującego sekwencje ANSI).
         """
 
-        super().__init__(checkers)
+        super().__init__(checkers, computer)
+
+        self.__output = sys.stdout if output is None else output
+        self.__ansi = ansi
+
+        # Wiersze ostatnio wyświetlonej klatki (tryb ANSI)
+        self.__lastFrame = None
 
         # Tekstowa reprezentacja planszy Warcabów.
         self.__textBoard = [
-            [None] * Checkers.BOARD_SIZE
+            ['----'] * Checkers.BOARD_SIZE
             for _ in range(Checkers.BOARD_SIZE)
         ]
 
@@ -59,29 +83,26 @@ class ConsoleUi(AbstractUi):
             self._checkers.newGame()
             self.gameLoop()
 
+        else:
+            self.close()
+
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
     def updateBoard(self) -> None:
         """Patrz: `AbstractUi.updateBoard`."""
 
-        simpleTextBoard = self._checkers.getTextBoard()
-
-        for y in range(Checkers.BOARD_SIZE):
-            for x in range(Checkers.BOARD_SIZE):
-
-                # Odczytanie obiektu na danej pozycji planszy
-                if (x & 1) ^ (y & 1):
-                    t = simpleTextBoard[y][x]
-                else:
-                    t = ''
+        # Odczytywane są tylko pola zmienione od poprzedniej klatki
+        # (pola jasne nigdy się nie zmieniają).
+        for x, y in self.takeDirtySquares():
+            t = self._checkers.getTextSquare(x, y)
 
-                # Zamiana na czytelniejszy format
-                if not t:
-                    t = '----'
-                else:
-                    t = f'{t:^4}'
+            # Zamiana na czytelniejszy format
+            if not t:
+                t = '----'
+            else:
+                t = f'{t:^4}'
 
-                self.__textBoard[y][x] = t
+            self.__textBoard[y][x] = t
 
         self.__message = self._checkers.getTextState()
 
@@ -90,34 +111,73 @@ class ConsoleUi(AbstractUi):
     def drawBoard(self) -> None:
         """Patrz: `AbstractUi.drawBoard`."""
 
-        # Wyświetlenie głównego komunikatu.
+        frame = self.renderFrame()
+
+        if not self.__ansi:
+            text = '\n'.join(frame) + '\n'
+
+        elif (self.__lastFrame is None) \
+        or (len(self.__lastFrame) != len(frame)):
+            text = self.ANSI_CLEAR_SCREEN + '\n'.join(frame) + '\n'
+
+        else:
+            parts = []
+            for n, (old, new) in enumerate(zip(self.__lastFrame, frame)):
+                if old == new:
+                    continue
+
+                if len(old) != len(new):
+                    parts.append (
+                        f'\x1b[{n + 1};1H' + self.ANSI_CLEAR_LINE + new
+                    )
+                    continue
+
+                # Najkrótszy fragment wiersza obejmujący wszystkie zmiany
+                start = 0
+                while old[start] == new[start]:
+                    start += 1
+                end = len(new)
+                while old[end - 1] == new[end - 1]:
+                    end -= 1
 
-        print(self.__dashedLine)
-        print(self.__message)
-        print(self.__dashedLine)
-        print()
+                parts.append(f'\x1b[{n + 1};{start + 1}H' + new[start:end])
 
-        # Wyświetlenie planszy.
+            # Kursor pod planszą, wyczyszczenie poprzednich komunikatów
+            parts.append(f'\x1b[{len(frame) + 1};1H' + self.ANSI_CLEAR_BELOW)
+            text = ''.join(parts)
 
-        def printColNames() -> None:
-            print('    ', end = '')
-            for n in self.__columnNames:
-                print(f' ({n:^2})', end = '')
-            print()
+        self.__lastFrame = frame
 
-        def printRowName(y: int) -> None:
-            print(f' ({self.__rowNames[y]}) ', end = '')
+        self.__output.write(text)
+        self.__output.flush()
 
-        printColNames()
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def renderFrame(self) -> List[str]:
+        """
+        Zwraca wiersze klatki: główny komunikat oraz planszę
+        (na podstawie danych z ostatniego `ConsoleUi.updateBoard`).
+        """
+
+        colNames = '    ' + ''.join (
+            f' ({n:^2})' for n in self.__columnNames
+        )
+
+        frame = [
+            self.__dashedLine,
+            self.__message,
+            self.__dashedLine,
+            '',
+            colNames
+        ]
 
         for y, row in enumerate(self.__textBoard):
-            printRowName(y)
-            for x in row:
-                print(f'{x} ', end = '')
-            printRowName(y)
-            print()
+            rowName = f' ({self.__rowNames[y]}) '
+            frame.append(rowName + ''.join(f'{x} ' for x in row) + rowName)
+
+        frame.append(colNames)
 
-        printColNames()
+        return frame
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -132,7 +192,8 @@ class ConsoleUi(AbstractUi):
 
         while True:
             try:
-                print('Wybierz pozycję: ', end = '')
+                self.__output.write('Wybierz pozycję: ')
+                self.__output.flush()
                 t = input()
 
                 if (not t) or (len(t) <= 0):
@@ -158,7 +219,7 @@ class ConsoleUi(AbstractUi):
                 return (x, y)
 
             except ValueError as e:
-                print(f'<< WYJĄTEK >>  {e}')
+                print(f'<< WYJĄTEK >>  {e}', file = self.__output)
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -167,19 +228,28 @@ class ConsoleUi(AbstractUi):
         Prosta pętla gry.
         """
 
+        self.__gameState, _, _ = self._checkers.getGameState()
+
         while Checkers.GAMESTATE_END != self.__gameState:
+            if self.playComputerTurn():
+                self.__gameState, _, _ = self._checkers.getGameState()
+                continue
+
             self.updateBoard()
             self.drawBoard()
 
-            print(self.__dashedLine)
+            print(self.__dashedLine, file = self.__output)
             xy = self.readInput()
-            print(self.__dashedLine)
+            print(self.__dashedLine, file = self.__output)
 
             if xy is None:
                 return
 
             self._checkers.processInput(xy[0], xy[1])
-            self.__gamestate, _, _ = self._checkers.getGameState()
+            self.__gameState, _, _ = self._checkers.getGameState()
+
+        self.updateBoard()
+        self.drawBoard()
 
 
 ################################################################
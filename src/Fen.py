@@ -0,0 +1,222 @@
+################################################################
+# Warcaby: "/src/Fen.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import argparse
+import math
+import time
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from Bitboard import Bitboard
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class Fen():
+    """
+    Zwarty, jednowierszowy zapis pozycji (FEN warcabowy),
+    np. `B:W1,2,K3:B21,22,K30`.
+    ----
+    Pierwsza litera oznacza gracza w obecnej turze, a dalej
+    po dwukropkach podane są pola pionków obu kolorów (`K` przed
+    numerem pola oznacza damkę). Zgodnie z PDN kolor `B` (Black)
+    oznacza gracza rozpoczynającego (indeks 0, pionki CZARNE),
+    a kolor `W` (White) gracza drugiego. Pola numerowane są
+    od 1 jak w `Pdn` (indeks bitu w masce + 1).
+    ----
+    Pionek (nie damka) nie może stać w rzędzie, w którym awansuje
+    (jak w `Checkers`: rząd 0 dla gracza 0, ostatni dla gracza 1).
+    """
+
+    COLORS = ('B', 'W')
+
+    KING = 'K'
+
+    # Liczba ciemnych pól planszy 8×8
+    DEFAULT_SQUARES = 32
+
+    # Maksymalna liczba zapamiętanych błędów w `Fen.load`
+    MAX_ERRORS = 100
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def format(cls, masks: Tuple[int, int, int, int], player: int) -> str:
+        """
+        Zapis pozycji w formacie FEN.
+        ----
+         * `masks`: cztery maski bitowe (jak `Checkers.getBitboards`).
+         * `player`: gracz w obecnej turze (0 lub 1).
+        """
+
+        parts = [cls.COLORS[player]]
+
+        # Kolejność jak w większości programów: najpierw białe.
+        for side in (1, 0):
+            men = masks[Bitboard.MASK_MEN + side]
+            kings = masks[Bitboard.MASK_KINGS + side]
+
+            squares = []
+            mask = men | kings
+            while mask:
+                low = mask & (-mask)
+                square = low.bit_length()
+                squares.append (
+                    (cls.KING + str(square)) if (kings & low) \
+                        else str(square)
+                )
+                mask ^= low
+
+            parts.append(cls.COLORS[side] + ','.join(squares))
+
+        return ':'.join(parts)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def parse(cls, text: str, squares: int = DEFAULT_SQUARES) \
+    -> Tuple[Tuple[int, int, int, int], int]:
+        """
+        Odczyt pozycji zapisanej w formacie FEN.
+        Zwraca parę (cztery maski bitowe, gracz w obecnej turze).
+        Niepoprawny zapis (także pionek w rzędzie awansu)
+        zgłaszany jest wyjątkiem `ValueError`.
+        ----
+         * `text`: zapis pozycji (np. `W:W9,K11:B14,15`).
+         * `squares`: liczba ciemnych pól planszy.
+        """
+
+        parts = text.strip().rstrip('.').split(':')
+        if 3 != len(parts):
+            raise ValueError('FEN: oczekiwano trzech części')
+
+        if parts[0] not in cls.COLORS:
+            raise ValueError(f'FEN: nieznany gracz "{parts[0]}"')
+
+        masks = [0, 0, 0, 0]
+        occupied = 0
+        seen = [False, False]
+
+        # Pola rzędów awansu obu graczy (pierwszy i ostatni rząd)
+        row = (1 << (math.isqrt(2 * squares) // 2)) - 1
+        promotion = (row, row << (squares - row.bit_length()))
+
+        for part in parts[1:]:
+            if (not part) or (part[0] not in cls.COLORS):
+                raise ValueError(f'FEN: nieznany kolor "{part[:1]}"')
+
+            side = cls.COLORS.index(part[0])
+            if seen[side]:
+                raise ValueError(f'FEN: powtórzony kolor "{part[0]}"')
+            seen[side] = True
+
+            if 1 == len(part):
+                continue
+
+            for token in part[1:].split(','):
+                king = token.startswith(cls.KING)
+                number = token[1:] if king else token
+
+                if not number.isdigit():
+                    raise ValueError(f'FEN: niepoprawne pole "{token}"')
+
+                square = int(number) - 1
+                if not (0 <= square < squares):
+                    raise ValueError(f'FEN: pole spoza planszy "{token}"')
+
+                bit = 1 << square
+                if occupied & bit:
+                    raise ValueError(f'FEN: zajęte pole "{token}"')
+                occupied |= bit
+
+                if (not king) and (promotion[side] & bit):
+                    raise ValueError(f'FEN: pionek na polu awansu "{token}"')
+
+                kind = Bitboard.MASK_KINGS if king else Bitboard.MASK_MEN
+                masks[kind + side] |= bit
+
+        return tuple(masks), cls.COLORS.index(parts[0])
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def load(cls, lines: Iterable[str], errors: List[Tuple[int, str]] = None, \
+    squares: int = DEFAULT_SQUARES, stats: Dict[str, int] = None) \
+    -> Iterator[Tuple[Tuple[int, int, int, int], int]]:
+        """
+        Generator pozycji odczytywanych z kolejnych wierszy
+        (po jednej pozycji w wierszu). Puste wiersze i komentarze
+        (od znaku `#`) są pomijane. Niepoprawne wiersze nie przerywają
+        odczytu: trafiają na listę `errors`.
+        ----
+         * `lines`: kolejne wiersze (np. otwarty plik tekstowy).
+         * `errors`: lista, do której dopisywane są pary (numer wiersza,
+          opis błędu), najwyżej `Fen.MAX_ERRORS`.
+         * `squares`: liczba ciemnych pól planszy.
+         * `stats`: słownik, w którym zliczane są wszystkie wiersze
+          poprawne (`valid`) i niepoprawne (`invalid`), także te
+          ponad limit listy `errors`.
+        """
+
+        parse = cls.parse
+
+        if stats is not None:
+            stats.setdefault('valid', 0)
+            stats.setdefault('invalid', 0)
+
+        for number, line in enumerate(lines, 1):
+            text = line.split('#', 1)[0].strip()
+            if not text:
+                continue
+
+            try:
+                position = parse(text, squares)
+            except ValueError as e:
+                if stats is not None:
+                    stats['invalid'] += 1
+                if (errors is not None) and (len(errors) < cls.MAX_ERRORS):
+                    errors.append((number, str(e)))
+                continue
+
+            if stats is not None:
+                stats['valid'] += 1
+            yield position
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def main() -> None:
+    """
+    Uruchomienie z wiersza poleceń, np.: `python Fen.py pozycje.txt`
+    (odczyt wszystkich pozycji z pliku i pomiar szybkości).
+    """
+
+    parser = argparse.ArgumentParser(description = 'Warcaby: FEN')
+    parser.add_argument('path', metavar = 'PLIK')
+    args = parser.parse_args()
+
+    errors = []
+    stats = {}
+
+    start = time.perf_counter()
+    with open(args.path, encoding = 'utf-8') as f:
+        for _ in Fen.load(f, errors, stats = stats):
+            pass
+    seconds = time.perf_counter() - start
+
+    for number, error in errors:
+        print(f'Wiersz {number}: {error}')
+
+    count = stats['valid']
+    print('Pozycje: %d (błędne wiersze: %d), %.2f s (%.0f pozycji/s)' % (
+        count, stats['invalid'], seconds,
+        (count / seconds) if seconds > 0 else 0.0
+    ))
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    main()
+
+
+################################################################
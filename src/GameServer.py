@@ -0,0 +1,449 @@
+################################################################
+# Warcaby: "/src/GameServer.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import argparse
+import asyncio
+import itertools
+import json
+import time
+from typing import Dict, List, Set, Tuple
+
+from Checkers import Checkers
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class GameSession():
+    """
+    Jedna gra prowadzona przez serwer wraz z podłączonymi klientami.
+    """
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __init__(self, sessionId: int) -> None:
+        """
+        Inicjalizacja klasy `GameSession`.
+        ----
+         * `sessionId`: numer gry nadany przez serwer.
+        """
+
+        self.sessionId = sessionId
+
+        self.checkers = Checkers()
+        self.checkers.newGame()
+
+        # Strumienie zapisu klientów oglądających tę grę
+        self.clients: Set[asyncio.StreamWriter] = set()
+
+        self.lastActivity = time.monotonic()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def touch(self) -> None:
+        """
+        Zapamiętanie czasu ostatniej aktywności w grze.
+        """
+
+        self.lastActivity = time.monotonic()
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class GameServer():
+    """
+    Serwer wielu gier "Warcaby" oparty na `asyncio` (bez wątków
+    i bez `tkinter`).
+    ----
+    Klienci łączą się przez TCP i wysyłają obiekty JSON, po jednym
+    w wierszu. Polecenie wskazane jest polem `cmd`:
+     * `new`: utworzenie nowej gry i dołączenie do niej.
+     * `join` (`session`): dołączenie do istniejącej gry.
+     * `input` (`x`, `y`): wskazanie pola (jak w `Checkers.processInput`).
+     * `reset`: rozpoczęcie gry od nowa.
+     * `state`: pełny stan gry.
+     * `quit`: rozłączenie.
+    Po każdej zmianie gry wszyscy jej klienci otrzymują obiekt
+    `update` ze zmienionymi polami i stanem gry, a w odpowiedzi
+    na `new`, `join`, `reset` i `state` obiekt `state` z całą planszą.
+    Błędy zgłaszane są obiektem `error`. Gry bez aktywności
+    przez `idleTimeout` sekund są usuwane (klienci otrzymują `timeout`
+    i są rozłączani), podobnie jak połączenia bez gry. Klienci
+    oglądający trwającą grę pozostają połączeni, o ile odbierają dane
+    (patrz: `writeBufferLimit`).
+    """
+
+    DEFAULT_PORT = 8765
+
+    # Maksymalna długość jednego wiersza od klienta (w bajtach)
+    LINE_LIMIT = 4096
+
+    # Domyślny limit niewysłanych danych jednego klienta (w bajtach)
+    WRITE_BUFFER_LIMIT = 1 << 20
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __init__(self, host: str = '127.0.0.1', \
+    port: int = DEFAULT_PORT, idleTimeout: float = 300.0, \
+    reapInterval: float = 10.0, maxSessions: int = 10000, \
+    writeBufferLimit: int = WRITE_BUFFER_LIMIT) -> None:
+        """
+        Inicjalizacja klasy `GameServer`.
+        ----
+         * `host`, `port`: adres nasłuchiwania (port 0: dowolny wolny).
+         * `idleTimeout`: czas bez aktywności (w sekundach),
+          po którym gra lub połączenie są zamykane.
+         * `reapInterval`: co ile sekund usuwane są nieaktywne gry.
+         * `maxSessions`: maksymalna liczba jednoczesnych gier.
+         * `writeBufferLimit`: liczba niewysłanych bajtów, po której
+          przekroczeniu klient oglądający grę jest rozłączany.
+        """
+
+        self.__host = host
+        self.__port = port
+        self.__idleTimeout = idleTimeout
+        self.__reapInterval = reapInterval
+        self.__maxSessions = maxSessions
+        self.__writeBufferLimit = writeBufferLimit
+
+        self.__sessions: Dict[int, GameSession] = {}
+        self.__sessionIds = itertools.count(1)
+
+        self.__server = None
+        self.__reaper = None
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    async def start(self) -> Tuple[str, int]:
+        """
+        Uruchomienie serwera. Zwraca faktyczny adres nasłuchiwania.
+        """
+
+        self.__server = await asyncio.start_server (
+            self.__handleClient, self.__host, self.__port,
+            limit = self.LINE_LIMIT
+        )
+        self.__reaper = asyncio.create_task(self.__reapSessions())
+
+        return self.__server.sockets[0].getsockname()[:2]
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    async def close(self) -> None:
+        """
+        Zatrzymanie serwera i rozłączenie wszystkich klientów.
+        """
+
+        if self.__reaper is not None:
+            self.__reaper.cancel()
+            self.__reaper = None
+
+        for sessionId in list(self.__sessions):
+            self.__closeSession(sessionId)
+
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+            self.__server = None
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    async def serveForever(self) -> None:
+        """
+        Uruchomienie serwera do czasu przerwania programu.
+        """
+
+        await self.start()
+        try:
+            await self.__server.serve_forever()
+        finally:
+            await self.close()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getSessionCount(self) -> int:
+        """
+        Liczba aktualnie prowadzonych gier.
+        """
+
+        return len(self.__sessions)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @staticmethod
+    def __send(writer: asyncio.StreamWriter, message: dict) -> None:
+        """
+        Wysłanie obiektu JSON w jednym wierszu (bez czekania
+        na opróżnienie bufora).
+        """
+
+        if not writer.is_closing():
+            writer.write(json.dumps(message).encode('utf-8') + b'\n')
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @staticmethod
+    def __stateMessage(session: GameSession, kind: str, \
+    squares: List[Tuple[int, int]]) -> dict:
+        """
+        Obiekt z zawartością wybranych pól i stanem gry.
+        """
+
+        checkers = session.checkers
+        textBoard = checkers.getTextBoard()
+        state, turninfo, player = checkers.getGameState()
+
+        return {
+            'type': kind,
+            'session': session.sessionId,
+            'squares': [[x, y, textBoard[y][x]] for x, y in squares],
+            'state': state,
+            'turninfo': turninfo,
+            'player': player,
+            'message': checkers.getTextState(),
+        }
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @staticmethod
+    def __allSquares() -> List[Tuple[int, int]]:
+        """
+        Pozycje [X, Y] wszystkich ciemnych pól planszy.
+        """
+
+        return [
+            (x, y)
+            for y in range(Checkers.BOARD_SIZE)
+            for x in range(Checkers.BOARD_SIZE)
+            if (x & 1) ^ (y & 1)
+        ]
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __broadcast(self, session: GameSession, message: dict, \
+    sender: asyncio.StreamWriter = None) -> None:
+        """
+        Wysłanie obiektu do wszystkich klientów danej gry.
+        ----
+        Na opróżnienie bufora czeka tylko klient wysyłający polecenie
+        (`sender`), więc pozostali klienci, którzy nie odbierają danych,
+        są rozłączani po przekroczeniu `writeBufferLimit` (bufory
+        nie rosną bez końca).
+        """
+
+        for writer in list(session.clients):
+            self.__send(writer, message)
+
+            if (writer is not sender) \
+            and (writer.transport.get_write_buffer_size() \
+            > self.__writeBufferLimit):
+                session.clients.discard(writer)
+                writer.close()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __closeSession(self, sessionId: int) -> None:
+        """
+        Usunięcie gry i rozłączenie jej klientów.
+        """
+
+        session = self.__sessions.pop(sessionId, None)
+        if session is None:
+            return
+
+        self.__broadcast(session, {'type': 'timeout', 'session': sessionId})
+        for writer in session.clients:
+            writer.close()
+        session.clients.clear()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    async def __reapSessions(self) -> None:
+        """
+        Okresowe usuwanie gier bez aktywności.
+        """
+
+        while True:
+            await asyncio.sleep(self.__reapInterval)
+
+            deadline = time.monotonic() - self.__idleTimeout
+            for sessionId, session in list(self.__sessions.items()):
+                if session.lastActivity < deadline:
+                    self.__closeSession(sessionId)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    async def __handleClient(self, reader: asyncio.StreamReader, \
+    writer: asyncio.StreamWriter) -> None:
+        """
+        Obsługa jednego połączenia: odczyt kolejnych poleceń.
+        """
+
+        session = None
+
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for (
+                        reader.readline(), self.__idleTimeout
+                    )
+                except asyncio.TimeoutError:
+                    if session is None:
+                        self.__send(writer, {'type': 'timeout'})
+                        break
+
+                    # Cała gra bez aktywności: usunięcie od razu,
+                    # bez czekania na `__reapSessions`. Klient oglądający
+                    # trwającą grę pozostaje połączony (zostanie
+                    # rozłączony razem z grą).
+                    if session.lastActivity \
+                    <= time.monotonic() - self.__idleTimeout:
+                        self.__closeSession(session.sessionId)
+                        session = None
+                        break
+                    continue
+                except ValueError:
+                    # Wiersz dłuższy niż `LINE_LIMIT`
+                    self.__send (
+                        writer, {'type': 'error', 'message': 'line too long'}
+                    )
+                    break
+
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError()
+                except ValueError:
+                    self.__send (
+                        writer, {'type': 'error', 'message': 'invalid json'}
+                    )
+                    continue
+
+                if 'quit' == request.get('cmd'):
+                    break
+
+                session = self.__processRequest(request, session, writer)
+
+                await writer.drain()
+
+        except ConnectionError:
+            pass
+
+        finally:
+            if session is not None:
+                session.clients.discard(writer)
+            writer.close()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __processRequest(self, request: dict, session: GameSession, \
+    writer: asyncio.StreamWriter) -> GameSession:
+        """
+        Wykonanie jednego polecenia klienta.
+        Zwraca grę, do której klient jest dołączony (lub `None`).
+        """
+
+        def error(message: str) -> GameSession:
+            self.__send(writer, {'type': 'error', 'message': message})
+            return session
+
+        def attach(newSession: GameSession) -> GameSession:
+            if session is not None:
+                session.clients.discard(writer)
+            newSession.clients.add(writer)
+            newSession.touch()
+            self.__send(writer, self.__stateMessage (
+                newSession, 'state', self.__allSquares()
+            ))
+            return newSession
+
+        command = request.get('cmd')
+
+        if 'new' == command:
+            if len(self.__sessions) >= self.__maxSessions:
+                return error('too many sessions')
+            sessionId = next(self.__sessionIds)
+            self.__sessions[sessionId] = GameSession(sessionId)
+            return attach(self.__sessions[sessionId])
+
+        if 'join' == command:
+            sessionId = request.get('session')
+            newSession = self.__sessions.get(sessionId) \
+                if type(sessionId) is int else None
+            if newSession is None:
+                return error('unknown session')
+            return attach(newSession)
+
+        if session is None or session.sessionId not in self.__sessions:
+            return error('no session')
+
+        if 'input' == command:
+            x, y = request.get('x'), request.get('y')
+            if (type(x) is not int) or (type(y) is not int) \
+            or not (0 <= x < Checkers.BOARD_SIZE) \
+            or not (0 <= y < Checkers.BOARD_SIZE):
+                return error('invalid square')
+
+            session.touch()
+            session.checkers.processInput(x, y)
+            self.__broadcast(session, self.__stateMessage (
+                session, 'update', session.checkers.getChangedSquares()
+            ), writer)
+            return session
+
+        if 'reset' == command:
+            session.touch()
+            session.checkers.newGame()
+            self.__broadcast(session, self.__stateMessage (
+                session, 'state', self.__allSquares()
+            ), writer)
+            return session
+
+        if 'state' == command:
+            session.touch()
+            self.__send(writer, self.__stateMessage (
+                session, 'state', self.__allSquares()
+            ))
+            return session
+
+        return error('unknown command')
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def main() -> None:
+    """
+    Uruchomienie z wiersza poleceń, np.:
+    `python GameServer.py --host 0.0.0.0 --port 8765`.
+    """
+
+    parser = argparse.ArgumentParser(description = 'Warcaby: serwer gier')
+    parser.add_argument('--host', default = '127.0.0.1')
+    parser.add_argument('--port', type = int,
+        default = GameServer.DEFAULT_PORT)
+    parser.add_argument('--idle', type = float, default = 300.0,
+        help = 'czas bez aktywności (w sekundach) do zamknięcia gry')
+    parser.add_argument('--max-sessions', type = int, default = 10000)
+    args = parser.parse_args()
+
+    server = GameServer (
+        args.host, args.port, args.idle,
+        maxSessions = args.max_sessions
+    )
+
+    try:
+        asyncio.run(server.serveForever())
+    except KeyboardInterrupt:
+        pass
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    main()
+
+
+################################################################
@@ -0,0 +1,36 @@
+################################################################
+# Warcaby: "/src/Move.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+from typing import NamedTuple, Tuple
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class Move(NamedTuple):
+    """
+    Pełny ruch w grze "Warcaby".
+    ----
+     * `start`: pozycja [X, Y] przesuwanego pionka.
+     * `path`: kolejne pozycje [X, Y], na które pionek jest stawiany
+      (dokładnie jedna dla ruchu bez bicia).
+     * `captured`: pozycje [X, Y] wszystkich zbitych pionków.
+    """
+
+    start: Tuple[int, int]
+    path: Tuple[Tuple[int, int], ...]
+    captured: Tuple[Tuple[int, int], ...]
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getClicks(self) -> Tuple[Tuple[int, int], ...]:
+        """
+        Zwraca kolejne pola, które należy wskazać w `Checkers.processInput`,
+        aby wykonać ten ruch.
+        """
+
+        return (self.start,) + self.path
+
+
+################################################################
@@ -0,0 +1,251 @@
+################################################################
+# Warcaby: "/src/OpeningBook.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import argparse
+import mmap
+import random
+import struct
+from typing import Iterable, List, Tuple
+
+from Bitboard import Bitboard
+from Checkers import Checkers
+from Move import Move
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class OpeningBook():
+    """
+    Księga otwarć zapisana w pliku binarnym.
+    ----
+    Plik zawiera rekordy (hasz pozycji, pole startowe, pole końcowe,
+    waga) posortowane według hasza Zobrista (`Checkers.getPositionHash`).
+    Wyszukiwanie binarne odbywa się bezpośrednio na pliku
+    odwzorowanym w pamięci (`mmap`), więc otwarcie księgi nic nie
+    kosztuje, a wiele procesów współdzieli te same strony pamięci.
+    """
+
+    RECORD = struct.Struct('<QBBH')
+
+    MAX_WEIGHT = 0xFFFF
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __init__(self, path: str) -> None:
+        """
+        Otwarcie pliku księgi otwarć.
+        ----
+         * `path`: plik zapisany funkcją `OpeningBook.build`.
+        """
+
+        self.__file = open(path, 'rb')
+        self.__data = None
+        self.__count = 0
+
+        size = self.__file.seek(0, 2)
+        if size > 0:
+            self.__data = mmap.mmap (
+                self.__file.fileno(), 0, access = mmap.ACCESS_READ
+            )
+            self.__count = size // self.RECORD.size
+
+        self.__bitboard = Bitboard(Checkers.BOARD_SIZE)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def close(self) -> None:
+        """
+        Zamknięcie pliku księgi otwarć.
+        """
+
+        if self.__data is not None:
+            self.__data.close()
+        self.__file.close()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __len__(self) -> int:
+        """
+        Liczba rekordów w księdze.
+        """
+
+        return self.__count
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def lookup(self, positionHash: int) -> List[Tuple[int, int, int]]:
+        """
+        Zwraca listę trójek (pole startowe, pole końcowe, waga)
+        zapisanych dla danej pozycji (pusta, jeśli pozycji nie ma).
+        ----
+         * `positionHash`: hasz pozycji (`Checkers.getPositionHash`).
+        """
+
+        record = self.RECORD
+        data = self.__data
+
+        lo, hi = 0, self.__count
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if record.unpack_from(data, mid * record.size)[0] < positionHash:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        result = []
+        while lo < self.__count:
+            h, start, end, weight = record.unpack_from(data, lo * record.size)
+            if h != positionHash:
+                break
+            result.append((start, end, weight))
+            lo += 1
+
+        return result
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def chooseMove(self, checkers: Checkers, rng: random.Random = None) \
+    -> Move:
+        """
+        Wybranie ruchu z księgi dla obecnej pozycji gry.
+        Zwraca `None`, jeśli pozycji nie ma w księdze.
+        ----
+         * `rng`: losowanie ruchu proporcjonalnie do wag
+          (domyślnie wybierany jest ruch o największej wadze).
+        """
+
+        entries = self.lookup(checkers.getPositionHash())
+        if not entries:
+            return None
+
+        if rng is None:
+            start, end, _ = max(entries, key = lambda e: e[2])
+        else:
+            start, end, _ = rng.choices (
+                entries, weights = [e[2] for e in entries]
+            )[0]
+
+        square = self.__bitboard.squareIndex
+        for move in checkers.generateMoves():
+            if (square(*move.start) == start) \
+            and (square(*move.path[-1]) == end):
+                return move
+
+        # Hasz pozycji pasuje, ale ruchu nie ma (kolizja hasza).
+        return None
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def build(cls, path: str, games: Iterable[Iterable[Move]], \
+    maxPlies: int = 12) -> int:
+        """
+        Zbudowanie księgi z zapisów gier rozpoczętych od
+        `Checkers.newGame`. Wagą ruchu jest liczba gier, w których
+        go wykonano. Zwraca liczbę zapisanych rekordów.
+        ----
+         * `path`: plik wynikowy.
+         * `games`: kolejne gry jako sekwencje ruchów.
+         * `maxPlies`: liczba początkowych ruchów każdej gry.
+        """
+
+        checkers = Checkers(Checkers.BACKEND_BITBOARDS)
+        square = Bitboard(Checkers.BOARD_SIZE).squareIndex
+        weights = {}
+
+        for game in games:
+            checkers.newGame()
+            for ply, move in enumerate(game):
+                if ply >= maxPlies:
+                    break
+                key = (
+                    checkers.getPositionHash(),
+                    square(*move.start), square(*move.path[-1])
+                )
+                weights[key] = weights.get(key, 0) + 1
+                checkers.makeMove(move)
+
+        with open(path, 'wb') as f:
+            for key in sorted(weights):
+                f.write(cls.RECORD.pack (
+                    *key, min(weights[key], cls.MAX_WEIGHT)
+                ))
+
+        return len(weights)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @staticmethod
+    def selfPlayGames(games: int, plies: int = 12, maxNodes: int = 2000, \
+    randomPlies: int = 2, seed: int = 0) -> Iterable[List[Move]]:
+        """
+        Generator początków gier rozegranych przez komputer
+        (`ComputerPlayer`) do wykorzystania w `OpeningBook.build`.
+        ----
+         * `games`: liczba gier.
+         * `plies`: liczba ruchów w każdej grze.
+         * `maxNodes`: limit węzłów przeszukiwania na jeden ruch.
+         * `randomPlies`: liczba początkowych ruchów losowych
+          (dla zróżnicowania otwarć).
+         * `seed`: ziarno losowania.
+        """
+
+        # Import lokalny: `ComputerPlayer` może korzystać z księgi.
+        from ComputerPlayer import ComputerPlayer
+
+        rng = random.Random(seed)
+        checkers = Checkers(Checkers.BACKEND_BITBOARDS)
+        computer = ComputerPlayer(0, maxNodes = maxNodes)
+
+        for _ in range(games):
+            checkers.newGame()
+            line = []
+
+            for ply in range(plies):
+                moves = checkers.generateMoves()
+                if not moves:
+                    break
+                if ply < randomPlies:
+                    move = rng.choice(moves)
+                else:
+                    move = computer.chooseMove(checkers)
+                line.append(move)
+                checkers.makeMove(move)
+
+            yield line
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def main() -> None:
+    """
+    Uruchomienie z wiersza poleceń, np.:
+    `python OpeningBook.py otwarcia.bin --games 200 --plies 10`.
+    """
+
+    parser = argparse.ArgumentParser(description = 'Warcaby: księga otwarć')
+    parser.add_argument('path', metavar = 'PLIK')
+    parser.add_argument('--games', type = int, default = 100)
+    parser.add_argument('--plies', type = int, default = 12)
+    parser.add_argument('--nodes', type = int, default = 2000)
+    parser.add_argument('--seed', type = int, default = 0)
+    args = parser.parse_args()
+
+    count = OpeningBook.build (
+        args.path,
+        OpeningBook.selfPlayGames (
+            args.games, args.plies, args.nodes, seed = args.seed
+        ),
+        args.plies
+    )
+
+    print('Zapisano %d pozycji-ruchów.' % count)
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    main()
+
+
+################################################################
@@ -0,0 +1,210 @@
+################################################################
+# Warcaby: "/src/ParallelComputerPlayer.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from Checkers import Checkers
+from ComputerPlayer import ComputerPlayer
+from Move import Move
+from Snapshot import Snapshot
+
+if TYPE_CHECKING:
+    from OpeningBook import OpeningBook
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def searchRootMove(snapshot: Snapshot, move: Move, maxDepth: int, \
+maxNodes: int, maxTime: float, tableBits: int) \
+-> Tuple[Optional[int], int, int]:
+    """
+    Przeszukanie pozycji po jednym ruchu z korzenia (w procesie roboczym).
+    Zwraca ocenę ruchu (z punktu widzenia gracza wykonującego ruch),
+    osiągniętą głębokość oraz liczbę odwiedzonych węzłów.
+    Jeśli limity przerwały przeszukiwanie przed ukończeniem pierwszej
+    iteracji, zwracana jest ocena `None` i głębokość 0 (ruch nie został
+    sprawdzony).
+    ----
+     * `snapshot`: zapis pozycji z korzenia (`Checkers.snapshot`).
+     * `move`: sprawdzany ruch z korzenia.
+     * pozostałe argumenty: limity jak w klasie `ComputerPlayer`.
+    """
+
+    player = snapshot.player
+
+    board = Checkers(Checkers.BACKEND_BITBOARDS)
+    board.restore(snapshot)
+    board.makeMove(move)
+
+    # Przeciwnik nie ma już ruchu (lub pionków).
+    if not board.generateMoves():
+        return (ComputerPlayer.SCORE_WIN - 1), 1, 1
+
+    computer = ComputerPlayer (
+        player ^ 1, maxNodes, maxTime, max(1, maxDepth - 1), tableBits
+    )
+    computer.search(board)
+    info = computer.getSearchInfo()
+
+    if 0 == info['depth']:
+        return None, 0, info['nodes']
+
+    return (-info['score']), (info['depth'] + 1), info['nodes']
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class ParallelComputerPlayer(ComputerPlayer):
+    """
+    Komputerowy przeciwnik przeszukujący ruchy na wielu rdzeniach.
+    ----
+    Ruchy z korzenia rozdzielane są między procesy robocze
+    (`concurrent.futures.ProcessPoolExecutor`). Procesy otrzymują
+    wyłącznie zwarty zapis pozycji (`Snapshot`) oraz sprawdzany ruch,
+    a nie całe obiekty `Checkers`.
+    ----
+    Procesy robocze zamyka `ParallelComputerPlayer.close` lub wyjście
+    z bloku `with`. Pula nie zamknięta jawnie zamykana jest
+    przy usunięciu obiektu albo przy zakończeniu programu.
+    """
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __init__(self, player: int, workers: int = None, \
+    maxNodes: int = None, maxTime: float = None, maxDepth: int = 32, \
+    tableBits: int = 16, book: Optional['OpeningBook'] = None) -> None:
+        """
+        Inicjalizacja klasy `ParallelComputerPlayer`.
+        ----
+         * `player`: numer gracza (0 lub 1), którym gra komputer.
+         * `workers`: liczba procesów roboczych
+          (domyślnie liczba rdzeni procesora).
+         * `maxNodes`, `maxTime`: łączne limity na jeden ruch,
+          dzielone między ruchy z korzenia.
+         * `maxDepth`, `tableBits`, `book`: jak w klasie `ComputerPlayer`.
+        """
+
+        if (maxNodes is None) and (maxTime is None):
+            maxTime = self.DEFAULT_TIME
+
+        super().__init__ (
+            player, maxNodes, maxTime, maxDepth, tableBits, book
+        )
+
+        self.__workers = workers or os.cpu_count() or 1
+        self.__pool = None
+        self.__poolFinalizer = None
+
+        self.__maxNodes = maxNodes
+        self.__maxTime = maxTime
+        self.__maxDepth = maxDepth
+        self.__tableBits = tableBits
+        self.__book = book
+
+        self.__info = {'nodes': 0, 'depth': 0, 'score': 0}
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def close(self) -> None:
+        """
+        Zamknięcie procesów roboczych.
+        """
+
+        if self.__pool is not None:
+            self.__poolFinalizer()
+            self.__pool = None
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __enter__(self) -> 'ParallelComputerPlayer':
+        """
+        Użycie w bloku `with` (procesy zamykane na jego końcu).
+        """
+
+        return self
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __exit__(self, *exc) -> None:
+        """
+        Zamknięcie procesów roboczych na końcu bloku `with`.
+        """
+
+        self.close()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getSearchInfo(self) -> dict:
+        """Patrz: `ComputerPlayer.getSearchInfo`."""
+
+        return dict(self.__info)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def chooseMove(self, checkers: Checkers) -> Move:
+        """Patrz: `ComputerPlayer.chooseMove`."""
+
+        moves = checkers.generateMoves()
+        if not moves:
+            return None
+        if 1 == len(moves):
+            return moves[0]
+
+        if self.__book is not None:
+            move = self.__book.chooseMove(checkers)
+            if move is not None:
+                self.__info = {'nodes': 0, 'depth': 0, 'score': 0}
+                return move
+
+        if self.__pool is None:
+            self.__pool = ProcessPoolExecutor(self.__workers)
+            self.__poolFinalizer = weakref.finalize (
+                self, self.__pool.shutdown
+            )
+
+        snapshot = checkers.snapshot()
+
+        # Ruchy z korzenia wykonywane są partiami po `workers` naraz,
+        # więc każdy ruch dostaje odpowiednią część limitów.
+        maxNodes = None
+        if self.__maxNodes is not None:
+            maxNodes = max(1, self.__maxNodes // len(moves))
+
+        maxTime = None
+        if self.__maxTime is not None:
+            maxTime = self.__maxTime \
+                * min(self.__workers, len(moves)) / len(moves)
+
+        futures = [
+            self.__pool.submit (
+                searchRootMove, snapshot, move,
+                self.__maxDepth, maxNodes, maxTime, self.__tableBits
+            )
+            for move in moves
+        ]
+
+        results = [f.result() for f in futures]
+        nodes = sum(r[2] for r in results)
+
+        # Ruchy niesprawdzone w ramach limitów nie mają oceny.
+        searched = [i for i in range(len(moves)) if results[i][1] > 0]
+        if not searched:
+            self.__info = {'nodes': nodes, 'depth': 0, 'score': 0}
+            return self.orderMoves(moves, None, 0)[0]
+
+        best = max(searched, key = lambda i: results[i][0])
+
+        self.__info = {
+            'nodes': nodes,
+            'depth': min(results[i][1] for i in searched),
+            'score': results[best][0]
+        }
+
+        return moves[best]
+
+
+################################################################
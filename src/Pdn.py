@@ -0,0 +1,337 @@
+################################################################
+# Warcaby: "/src/Pdn.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import argparse
+import re
+import time
+from typing import Dict, Iterable, Iterator, List, NamedTuple, TextIO
+
+from Bitboard import Bitboard
+from Checkers import Checkers
+from Move import Move
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class PdnGame(NamedTuple):
+    """
+    Zapis jednej gry w formacie PDN.
+    ----
+     * `tags`: pary (nazwa, wartość) z nagłówka gry.
+     * `moves`: kolejne ruchy w notacji PDN (np. `22-18`, `9x18x27`).
+     * `result`: wynik gry (`2-0`, `0-2`, `1-1` albo `*`).
+    """
+
+    tags: Dict[str, str]
+    moves: List[str]
+    result: str
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class Pdn():
+    """
+    Odczyt i zapis gier w formacie PDN (Portable Draughts Notation).
+    ----
+    Pola numerowane są od 1 wierszami ciemnych pól, od góry planszy
+    (numer pola = indeks pola w `Checkers.getBitboards` + 1).
+    W wyniku pierwsza liczba dotyczy gracza rozpoczynającego
+    (indeks 0, pionki CZARNE): `2-0` oznacza jego wygraną.
+    Odczyt jest strumieniowy, więc nawet bardzo duże archiwa
+    nie są wczytywane do pamięci w całości.
+    """
+
+    RESULT_FIRST_WINS = '2-0'
+    RESULT_SECOND_WINS = '0-2'
+    RESULT_DRAW = '1-1'
+    RESULT_UNKNOWN = '*'
+
+    RESULTS = (RESULT_FIRST_WINS, RESULT_SECOND_WINS, RESULT_DRAW,
+        RESULT_UNKNOWN)
+
+    # Kolejność znaczników w zapisywanych grach
+    TAG_ORDER = ('Event', 'Site', 'Date', 'Round', 'Black', 'White',
+        'Result')
+
+    LINE_LENGTH = 79
+
+    # Maksymalna liczba zapamiętanych błędów w `Pdn.replay`
+    MAX_ERRORS = 100
+
+    __tagPattern = re.compile(r'^\[\s*(\w+)\s+"(.*)"\s*\]\s*$')
+    __movePattern = re.compile(r'^\d+(?:[-x]\d+)+$')
+    __bitboard = Bitboard(Checkers.BOARD_SIZE)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def formatMove(cls, move: Move) -> str:
+        """
+        Zapis ruchu w notacji PDN (`start-koniec` albo
+        `start x lądowanie x ...` dla bić).
+        """
+
+        square = cls.__bitboard.squareIndex
+        squares = [str(square(*xy) + 1) for xy in move.getClicks()]
+
+        return ('x' if move.captured else '-').join(squares)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def parseMove(cls, checkers: Checkers, text: str) -> Move:
+        """
+        Odszukanie dozwolonego ruchu zapisanego w notacji PDN.
+        Zwraca `None`, jeśli ruch nie jest dozwolony lub jest
+        niejednoznaczny.
+        ----
+        Bicie może być zapisane w pełni (wszystkie pola lądowania)
+        albo skrótowo (tylko pole startowe i końcowe). Ruch zgodny
+        ze wszystkimi podanymi polami ma pierwszeństwo przed skrótem.
+        """
+
+        if not cls.__movePattern.match(text):
+            return None
+
+        capture = 'x' in text
+        squares = [int(s) - 1 for s in re.split('[-x]', text)]
+        square = cls.__bitboard.squareIndex
+
+        found = []
+        for move in checkers.generateMoves():
+            if bool(move.captured) != capture:
+                continue
+
+            clicks = [square(*xy) for xy in move.getClicks()]
+            if clicks == squares:
+                return move
+
+            if (2 == len(squares)) and (clicks[0] == squares[0]) \
+            and (clicks[-1] == squares[-1]):
+                found.append(move)
+
+        return found[0] if 1 == len(found) else None
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def gameFromCheckers(cls, checkers: Checkers, \
+    tags: Dict[str, str] = None) -> PdnGame:
+        """
+        Zapis gry rozegranej od `Checkers.newGame`
+        (ruchy z `Checkers.getMoveHistory`).
+        """
+
+        state, _, player = checkers.getGameState()
+
+        if Checkers.GAMESTATE_END == state:
+            winner = player
+        elif not checkers.generateMoves():
+            winner = player ^ 1
+        else:
+            winner = None
+
+        if winner is None:
+            result = cls.RESULT_UNKNOWN
+        elif 0 == winner:
+            result = cls.RESULT_FIRST_WINS
+        else:
+            result = cls.RESULT_SECOND_WINS
+
+        tags = dict(tags or {})
+        tags['Result'] = result
+
+        return PdnGame (
+            tags,
+            [cls.formatMove(m) for m in checkers.getMoveHistory()],
+            result
+        )
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def write(cls, stream: TextIO, games: Iterable[PdnGame]) -> int:
+        """
+        Zapisanie kolejnych gier do strumienia tekstowego
+        (znacznik `Result` zawsze odpowiada wynikowi gry).
+        Zwraca liczbę zapisanych gier.
+        """
+
+        count = 0
+
+        for game in games:
+            tags = dict(game.tags, Result = game.result)
+            names = [n for n in cls.TAG_ORDER if n in tags] \
+                + sorted(n for n in tags if n not in cls.TAG_ORDER)
+            for name in names:
+                value = tags[name].replace('"', "'")
+                stream.write(f'[{name} "{value}"]\n')
+
+            tokens = []
+            for i, move in enumerate(game.moves):
+                if 0 == (i & 1):
+                    tokens.append(f'{(i >> 1) + 1}.')
+                tokens.append(move)
+            tokens.append(game.result)
+
+            line = ''
+            for token in tokens:
+                if line and (len(line) + 1 + len(token) > cls.LINE_LENGTH):
+                    stream.write(line + '\n')
+                    line = token
+                else:
+                    line = (line + ' ' + token) if line else token
+            stream.write(line + '\n\n')
+
+            count += 1
+
+        return count
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def read(cls, stream: Iterable[str]) -> Iterator[PdnGame]:
+        """
+        Generator kolejnych gier odczytywanych ze strumienia tekstowego
+        (wiersz po wierszu). Komentarze w nawiasach klamrowych
+        oraz numery ruchów są pomijane.
+        """
+
+        tags, moves = {}, []
+        comment = 0
+
+        for line in stream:
+            if (0 == comment) and (not moves):
+                match = cls.__tagPattern.match(line)
+                if match:
+                    tags[match.group(1)] = match.group(2)
+                    continue
+
+            for token in re.split(r'(\{|\})|\s+', line):
+                if not token:
+                    continue
+                if '{' == token:
+                    comment += 1
+                    continue
+                if '}' == token:
+                    comment = max(0, comment - 1)
+                    continue
+                if comment:
+                    continue
+
+                if token in cls.RESULTS:
+                    yield PdnGame(tags, moves, token)
+                    tags, moves = {}, []
+                    continue
+
+                # Numer ruchu, np. "12." lub "12..."
+                token = re.sub(r'^\d+\.+', '', token)
+                if token:
+                    moves.append(token)
+
+        if tags or moves:
+            yield PdnGame(tags, moves, tags.get('Result', cls.RESULT_UNKNOWN))
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def replay(cls, games: Iterable[PdnGame]) -> dict:
+        """
+        Odtworzenie gier z weryfikacją każdego ruchu według zasad gry.
+        Zwraca słownik z liczbą gier (wszystkich, poprawnych,
+        błędnych), liczbą ruchów, czasem, liczbą gier na sekundę
+        oraz listą pierwszych błędów (numer gry, opis).
+        """
+
+        checkers = Checkers(Checkers.BACKEND_BITBOARDS)
+        stats = {'games': 0, 'valid': 0, 'invalid': 0, 'moves': 0}
+        errors = []
+
+        start = time.perf_counter()
+
+        for number, game in enumerate(games, 1):
+            stats['games'] += 1
+            error = cls.__replayGame(checkers, game)
+
+            if error is None:
+                stats['valid'] += 1
+                stats['moves'] += len(game.moves)
+            else:
+                stats['invalid'] += 1
+                if len(errors) < cls.MAX_ERRORS:
+                    errors.append((number, error))
+
+        stats['seconds'] = time.perf_counter() - start
+        stats['gamesPerSecond'] = (stats['games'] / stats['seconds']) \
+            if stats['seconds'] > 0 else 0.0
+        stats['errors'] = errors
+
+        return stats
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def __replayGame(cls, checkers: Checkers, game: PdnGame) -> str:
+        """
+        Odtworzenie jednej gry (od pozycji ze znacznika `FEN`,
+        jeśli jest podany). Zwraca opis błędu albo `None`.
+        """
+
+        if 'FEN' in game.tags:
+            try:
+                checkers.setFen(game.tags['FEN'])
+            except ValueError as e:
+                return str(e)
+        else:
+            checkers.newGame()
+
+        for ply, text in enumerate(game.moves):
+            move = cls.parseMove(checkers, text)
+            if move is None:
+                return f'ruch {ply + 1} ({text}) jest niedozwolony'
+            checkers.makeMove(move)
+
+        # Wynik musi się zgadzać, jeśli gra faktycznie się skończyła.
+        recorded = cls.gameFromCheckers(checkers).result
+        if (cls.RESULT_UNKNOWN != recorded) and (recorded != game.result):
+            return f'wynik {game.result} zamiast {recorded}'
+
+        return None
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def main() -> None:
+    """
+    Uruchomienie z wiersza poleceń, np.: `python Pdn.py archiwum.pdn`
+    (weryfikacja wszystkich gier z pliku).
+    """
+
+    parser = argparse.ArgumentParser(description = 'Warcaby: PDN')
+    parser.add_argument('paths', nargs = '+', metavar = 'PLIK')
+    args = parser.parse_args()
+
+    def lines() -> Iterator[str]:
+        for path in args.paths:
+            with open(path, encoding = 'utf-8') as f:
+                yield from f
+
+    stats = Pdn.replay(Pdn.read(lines()))
+
+    for number, error in stats['errors']:
+        print(f'Gra {number}: {error}')
+
+    print('Gry: %d (poprawne: %d, błędne: %d), ruchy: %d' % (
+        stats['games'], stats['valid'], stats['invalid'], stats['moves']
+    ))
+    print('%.2f s (%.1f gier/s)' % (
+        stats['seconds'], stats['gamesPerSecond']
+    ))
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    main()
+
+
+################################################################
@@ -0,0 +1,177 @@
+################################################################
+# Warcaby: "/src/Perft.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import argparse
+import time
+from typing import List, Tuple
+
+from Checkers import Checkers
+from Move import Move
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class Perft():
+    """
+    Liczenie wszystkich pozycji osiągalnych w zadanej liczbie ruchów
+    ("perft"). Służy do sprawdzania poprawności generatora ruchów
+    oraz do mierzenia jego wydajności (liczba węzłów na sekundę).
+    ----
+    Ruchy zawsze generowane są na maskach bitowych
+    (`Checkers.generateMoves`), niezależnie od reprezentacji planszy.
+    """
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __init__(self, checkers: Checkers) -> None:
+        """
+        Inicjalizacja klasy `Perft`.
+        ----
+         * `checkers`: gra, od której obecnej pozycji liczone są ruchy.
+          Po zakończeniu liczenia pozycja jest przywracana.
+        """
+
+        self.__checkers = checkers
+        self.__table = {}
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def perft(self, depth: int, dedup: bool = False) -> int:
+        """
+        Zwraca liczbę liści drzewa gry o głębokości `depth`.
+        ----
+         * `depth`: liczba ruchów (półruchów) od obecnej pozycji.
+         * `dedup`: zapamiętywanie wyników dla powtarzających się
+          pozycji (według skrótu Zobrist i pozostałej głębokości).
+        """
+
+        self.__table = {}
+
+        return self.__count(depth, dedup)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def divide(self, depth: int, dedup: bool = False) \
+    -> List[Tuple[Move, int]]:
+        """
+        Zwraca listę par (ruch z obecnej pozycji, liczba liści
+        poddrzewa o głębokości `depth - 1`).
+        """
+
+        checkers = self.__checkers
+        self.__table = {}
+        result = []
+
+        for move in checkers.generateMoves():
+            checkers.makeMove(move)
+            result.append((move, self.__count(depth - 1, dedup)))
+            checkers.unmakeMove()
+
+        return result
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def measure(self, depth: int, dedup: bool = False) -> dict:
+        """
+        Liczenie liści wraz z pomiarem czasu. Zwraca słownik
+        z kluczami `nodes`, `seconds` oraz `nps` (węzły na sekundę).
+        """
+
+        start = time.perf_counter()
+        nodes = self.perft(depth, dedup)
+        seconds = time.perf_counter() - start
+
+        return {
+            'nodes': nodes,
+            'seconds': seconds,
+            'nps': (nodes / seconds) if seconds > 0 else 0.0
+        }
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __count(self, depth: int, dedup: bool) -> int:
+        """
+        Rekurencyjne liczenie liści.
+        """
+
+        if depth <= 0:
+            return 1
+
+        checkers = self.__checkers
+
+        if dedup:
+            key = (checkers.getPositionHash(), depth)
+            nodes = self.__table.get(key)
+            if nodes is not None:
+                return nodes
+
+        moves = checkers.generateMoves()
+
+        if 1 == depth:
+            nodes = len(moves)
+        else:
+            nodes = 0
+            for move in moves:
+                checkers.makeMove(move)
+                nodes += self.__count(depth - 1, dedup)
+                checkers.unmakeMove()
+
+        if dedup:
+            self.__table[key] = nodes
+
+        return nodes
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def main() -> None:
+    """
+    Uruchomienie z wiersza poleceń, np.: `python Perft.py 6 --divide`.
+    """
+
+    parser = argparse.ArgumentParser(description = 'Warcaby: perft')
+    parser.add_argument('depth', type = int)
+    parser.add_argument('--divide', action = 'store_true',
+        help = 'liczba liści dla każdego ruchu z pozycji początkowej')
+    parser.add_argument('--hash', action = 'store_true',
+        help = 'pomijanie powtarzających się pozycji (skrót Zobrist)')
+    parser.add_argument('--board', metavar = 'PLIK',
+        help = 'plik z planszą ("_" oznacza puste pole)')
+    parser.add_argument('--player', type = int, choices = (0, 1),
+        default = 0, help = 'gracz w pierwszej turze')
+    args = parser.parse_args()
+
+    checkers = Checkers(Checkers.BACKEND_BITBOARDS)
+    checkers.newGame()
+
+    if args.board:
+        with open(args.board, encoding = 'utf-8') as f:
+            checkers.setTextBoard ([
+                [('' if '_' == x else x) for x in line.split()]
+                for line in f.read().splitlines() if line.strip()
+            ])
+    checkers.setCurrentPlayer(args.player)
+
+    perft = Perft(checkers)
+
+    if args.divide:
+        total = 0
+        for move, nodes in perft.divide(args.depth, args.hash):
+            clicks = ' '.join('%d,%d' % xy for xy in move.getClicks())
+            print('%-24s %d' % (clicks, nodes))
+            total += nodes
+        print('Razem: %d' % total)
+
+    info = perft.measure(args.depth, args.hash)
+    print('perft(%d) = %d, %.3f s, %.0f węzłów/s' % (
+        args.depth, info['nodes'], info['seconds'], info['nps']
+    ))
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    main()
+
+
+################################################################
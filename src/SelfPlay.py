@@ -0,0 +1,280 @@
+################################################################
+# Warcaby: "/src/SelfPlay.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Tuple
+
+from Bitboard import Bitboard
+from Checkers import Checkers
+from ComputerPlayer import ComputerPlayer
+from Move import Move
+
+
+# Strategia wyboru ruchu: (gra, dozwolone ruchy, generator liczb) -> ruch.
+# Strategie przekazywane do procesów roboczych muszą być funkcjami
+# zdefiniowanymi na poziomie modułu (wymóg modułu `pickle`).
+Policy = Callable[[Checkers, List[Move], random.Random], Move]
+
+# Numeracja pól jak w `Checkers.getBitboards`
+_bitboard = Bitboard(Checkers.BOARD_SIZE)
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def randomPolicy(checkers: Checkers, moves: List[Move], \
+rng: random.Random) -> Move:
+    """
+    Strategia: losowy dozwolony ruch.
+    """
+
+    return rng.choice(moves)
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def greedyCapturePolicy(checkers: Checkers, moves: List[Move], \
+rng: random.Random) -> Move:
+    """
+    Strategia: ruch bijący najwięcej pionków (losowy spośród
+    równorzędnych), a w drugiej kolejności ruch dający promocję.
+    """
+
+    # Awansować może tylko pionek (nie damka) w ostatnim rzędzie
+    # po stronie przeciwnika.
+    player = checkers.getGameState()[2]
+    men = checkers.getBitboards()[Bitboard.MASK_MEN + player]
+    row = (0, checkers.BOARD_SIZE - 1)[player]
+
+    def gain(move: Move) -> int:
+        man = men & (1 << _bitboard.squareIndex(*move.start))
+        promotion = bool(man) and (row == move.path[-1][1])
+        return 2 * len(move.captured) + int(promotion)
+
+    best = max(gain(m) for m in moves)
+
+    return rng.choice([m for m in moves if gain(m) == best])
+
+
+# Przeciwnicy komputerowi dla strategii `computerPolicy`:
+# gracz -> (gra, `ComputerPlayer`)
+_computers = {}
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def computerPolicy(checkers: Checkers, moves: List[Move], \
+rng: random.Random) -> Move:
+    """
+    Strategia: przeszukiwanie alfa-beta (`ComputerPlayer`)
+    z niewielkim limitem węzłów, aby wynik nie zależał od czasu.
+    Każda gra dostaje nowego przeciwnika (pustą tablicę transpozycji),
+    więc wynik gry nie zależy od gier rozegranych wcześniej.
+    """
+
+    player = checkers.getGameState()[2]
+
+    game, computer = _computers.get(player, (None, None))
+    if game is not checkers:
+        computer = ComputerPlayer(player, maxNodes = 2000)
+        _computers[player] = (checkers, computer)
+
+    return computer.chooseMove(checkers)
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def playGame(policies: Tuple[Policy, Policy], seed: int, \
+maxPlies: int, backend: int) -> Tuple[int, int]:
+    """
+    Rozegranie jednej pełnej gry. Zwraca parę (zwycięzca, liczba ruchów),
+    gdzie zwycięzca to 0 lub 1, albo -1 w przypadku remisu
+    (przekroczenie limitu `maxPlies` ruchów).
+    ----
+     * `policies`: strategie gracza 0 oraz gracza 1.
+     * `seed`: ziarno losowania dla obu strategii.
+    """
+
+    checkers = Checkers(backend)
+    checkers.newGame()
+    rng = random.Random(seed)
+
+    for plies in range(maxPlies):
+        state, _, player = checkers.getGameState()
+
+        if Checkers.GAMESTATE_END == state:
+            return player, plies
+
+        moves = checkers.generateMoves()
+
+        # Brak możliwego ruchu oznacza przegraną.
+        if not moves:
+            return (player ^ 1), plies
+
+        checkers.makeMove(policies[player](checkers, moves, rng))
+
+    state, _, player = checkers.getGameState()
+    if Checkers.GAMESTATE_END == state:
+        return player, maxPlies
+
+    return -1, maxPlies
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def playGames(policies: Tuple[Policy, Policy], seeds: List[int], \
+maxPlies: int, backend: int) -> List[Tuple[int, int, int]]:
+    """
+    Rozegranie serii gier w jednym procesie. Strategie zamieniają się
+    kolorami co drugą grę (według parzystości ziarna).
+    Zwraca listę trójek (zwycięska strategia, zwycięzca, liczba ruchów).
+    """
+
+    results = []
+
+    for seed in seeds:
+        swap = seed & 1
+        pair = (policies[1], policies[0]) if swap else policies
+        winner, plies = playGame(pair, seed, maxPlies, backend)
+        results.append (
+            ((-1 if winner < 0 else winner ^ swap), winner, plies)
+        )
+
+    return results
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class SelfPlay():
+    """
+    Masowe rozgrywanie gier pomiędzy dwiema strategiami wyboru ruchów,
+    bez interfejsu użytkownika, na wielu procesach jednocześnie.
+    """
+
+    # Strategie dostępne z wiersza poleceń
+    POLICIES = {
+        'random': randomPolicy,
+        'greedy': greedyCapturePolicy,
+        'computer': computerPolicy,
+    }
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __init__(self, policyA: Policy, policyB: Policy, \
+    workers: int = None, maxPlies: int = 200, \
+    backend: int = Checkers.BACKEND_BITBOARDS) -> None:
+        """
+        Inicjalizacja klasy `SelfPlay`.
+        ----
+         * `policyA`, `policyB`: strategie wyboru ruchu.
+         * `workers`: liczba procesów roboczych (domyślnie liczba
+          rdzeni procesora, 1 = gry w bieżącym procesie).
+         * `maxPlies`: limit ruchów w grze, po którym ogłaszany jest remis.
+         * `backend`: reprezentacja planszy w rozgrywanych grach.
+        """
+
+        self.__policies = (policyA, policyB)
+        self.__workers = workers or os.cpu_count() or 1
+        self.__maxPlies = maxPlies
+        self.__backend = backend
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def run(self, games: int, seed: int = 0) -> dict:
+        """
+        Rozegranie `games` gier. Zwraca słownik ze statystykami:
+        wygrane strategii A i B, remisy, wygrane gracza 0 i 1,
+        długości gier (średnia, minimum, maksimum) oraz liczba
+        gier na sekundę.
+        ----
+         * `seed`: ziarno pierwszej gry (kolejne gry: `seed + i`).
+        """
+
+        seeds = list(range(seed, seed + games))
+        start = time.perf_counter()
+
+        if 1 == self.__workers:
+            results = playGames (
+                self.__policies, seeds, self.__maxPlies, self.__backend
+            )
+
+        else:
+            # Podział na paczki, aby ograniczyć koszt komunikacji.
+            chunks = [
+                seeds[i : i + 16] for i in range(0, len(seeds), 16)
+            ]
+            with ProcessPoolExecutor(self.__workers) as pool:
+                futures = [
+                    pool.submit (
+                        playGames, self.__policies, chunk,
+                        self.__maxPlies, self.__backend
+                    )
+                    for chunk in chunks
+                ]
+                results = [r for f in futures for r in f.result()]
+
+        seconds = time.perf_counter() - start
+        lengths = [plies for _, _, plies in results]
+
+        return {
+            'games': games,
+            'winsA': sum(1 for p, _, _ in results if 0 == p),
+            'winsB': sum(1 for p, _, _ in results if 1 == p),
+            'draws': sum(1 for p, _, _ in results if p < 0),
+            'winsPlayer0': sum(1 for _, w, _ in results if 0 == w),
+            'winsPlayer1': sum(1 for _, w, _ in results if 1 == w),
+            'meanPlies': (sum(lengths) / games) if games else 0.0,
+            'minPlies': min(lengths, default = 0),
+            'maxPlies': max(lengths, default = 0),
+            'seconds': seconds,
+            'gamesPerSecond': (games / seconds) if seconds > 0 else 0.0,
+        }
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def main() -> None:
+    """
+    Uruchomienie z wiersza poleceń, np.:
+    `python SelfPlay.py greedy random --games 2000`.
+    """
+
+    names = list(SelfPlay.POLICIES)
+
+    parser = argparse.ArgumentParser(description = 'Warcaby: self-play')
+    parser.add_argument('policyA', choices = names)
+    parser.add_argument('policyB', choices = names)
+    parser.add_argument('--games', type = int, default = 1000)
+    parser.add_argument('--workers', type = int, default = None)
+    parser.add_argument('--max-plies', type = int, default = 200)
+    parser.add_argument('--seed', type = int, default = 0)
+    args = parser.parse_args()
+
+    selfPlay = SelfPlay (
+        SelfPlay.POLICIES[args.policyA], SelfPlay.POLICIES[args.policyB],
+        args.workers, args.max_plies
+    )
+    stats = selfPlay.run(args.games, args.seed)
+
+    n = max(1, stats['games'])
+    print('%s: %d (%.1f%%), %s: %d (%.1f%%), remisy: %d (%.1f%%)' % (
+        args.policyA, stats['winsA'], 100.0 * stats['winsA'] / n,
+        args.policyB, stats['winsB'], 100.0 * stats['winsB'] / n,
+        stats['draws'], 100.0 * stats['draws'] / n
+    ))
+    print('Wygrane czarnych: %d, białych: %d' % (
+        stats['winsPlayer0'], stats['winsPlayer1']
+    ))
+    print('Długość gry: średnio %.1f, min %d, max %d ruchów' % (
+        stats['meanPlies'], stats['minPlies'], stats['maxPlies']
+    ))
+    print('%d gier w %.2f s (%.1f gier/s)' % (
+        stats['games'], stats['seconds'], stats['gamesPerSecond']
+    ))
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    main()
+
+
+################################################################
@@ -0,0 +1,41 @@
+################################################################
+# Warcaby: "/src/Snapshot.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+from typing import NamedTuple, Tuple
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class Snapshot(NamedTuple):
+    """
+    Zwarty, niezmienny zapis pozycji w grze "Warcaby"
+    (razem z trwającym wielokrotnym biciem).
+    ----
+    Pola planszy zapisane są jako indeksy ciemnych pól
+    (patrz: `Checkers.getBitboards`), a `-1` oznacza brak pola.
+     * `masks`: cztery maski bitowe pionków (jak `Checkers.getBitboards`).
+     * `player`: gracz w obecnej turze (lub zwycięzca po końcu gry).
+     * `state`: stan rozgrywki (`Checkers.GAMESTATE_*`).
+     * `turninfo`: informacja o turze (`Checkers.TURNINFO_*`).
+     * `selected`: pole zaznaczonego pionka.
+     * `fighting`: pole, z którego zaznaczony pionek bije dalej.
+     * `frozen`: maska pól zablokowanych w trwającym biciu
+      (zbite pionki oraz pośrednie pola bicia).
+     * `path`: kolejne pola lądowania w trwającym biciu.
+     * `obligatory`: maska pionków z obowiązkowym biciem.
+    """
+
+    masks: Tuple[int, int, int, int]
+    player: int
+    state: int
+    turninfo: int
+    selected: int
+    fighting: int
+    frozen: int
+    path: Tuple[int, ...]
+    obligatory: int
+
+
+################################################################
@@ -13,6 +13,8 @@ class StrongPawn(WeakPawn):
     Pionek-Damka w grze "Warcaby".
     """
 
+    __slots__ = ()
+
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
     def pawnStr(self) -> str:
@@ -0,0 +1,525 @@
+################################################################
+# Warcaby: "/src/Tablebase.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import argparse
+import mmap
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from math import comb
+from typing import List, Tuple
+
+from Bitboard import Bitboard
+from Checkers import Checkers
+
+
+# Liczba pionków każdego rodzaju (jak maski `Checkers.getBitboards`):
+# zwykłe CZARNE, zwykłe BIAŁE, damki CZARNE, damki BIAŁE.
+Counts = Tuple[int, int, int, int]
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def expandPositions(counts: Counts, player: int, start: int, stop: int) \
+-> List[tuple]:
+    """
+    Wygenerowanie następników pozycji o indeksach `start` ... `stop - 1`
+    (w procesie roboczym). Dla każdej pozycji zwracane jest:
+     * `None` dla pozycji niemożliwej w grze,
+     * `True`, jeśli któryś ruch zbija ostatniego pionka przeciwnika,
+     * krotka par (liczby pionków, indeks) pozycji po każdym ruchu
+      (pusta, jeśli gracz nie ma żadnego ruchu).
+    """
+
+    bb = Bitboard(Checkers.BOARD_SIZE)
+    promotion = Tablebase.promotionMasks()
+    result = []
+
+    for index in range(start, stop):
+        masks = Tablebase.positionFromIndex(counts, index)
+
+        if not Tablebase.isValid(masks):
+            result.append(None)
+            continue
+
+        bb.masks = list(masks)
+        successors = set()
+        win = False
+
+        for src, landings, captured in bb.generateMoves(player):
+            bb.masks = list(masks)
+            for square in captured:
+                bb.removePiece(square)
+            dst = landings[-1]
+            bb.movePiece(src, dst)
+            if (promotion[player] >> dst) & 1:
+                bb.promotePiece(dst)
+
+            if 0 == bb.countPieces(player ^ 1):
+                win = True
+                break
+
+            successors.add(Tablebase.indexPosition(bb.masks))
+
+        result.append(True if win else tuple(successors))
+
+    return result
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class Tablebase():
+    """
+    Tablica końcówek (wygrana / przegrana / remis) dla wszystkich pozycji
+    z niewielką liczbą pionków, zapisana w pliku i odczytywana
+    przez `mmap` (bez wczytywania całego pliku do pamięci).
+    ----
+    Tablice budowane są analizą wsteczną (`Tablebase.generate`):
+    następniki pozycji generowane są równolegle w procesach roboczych,
+    a wyniki rozchodzą się po odwróconych krawędziach grafu gry.
+    Wynik dotyczy gracza w obecnej turze. Gracz bez pionków lub bez
+    możliwego ruchu przegrywa, a remis oznacza, że żadna ze stron
+    nie może wymusić wygranej.
+    """
+
+    RESULT_UNKNOWN = 0
+    RESULT_WIN = 1
+    RESULT_LOSS = 2
+    RESULT_DRAW = 3
+
+    DEFAULT_PIECES = 3
+
+    # Liczba pozycji w jednym zadaniu procesu roboczego
+    CHUNK_SIZE = 2048
+
+    # Nagłówek pliku: znacznik, maksymalna liczba pionków, liczba bloków.
+    # Blok: liczby pionków (4), gracz, przesunięcie danych, liczba pozycji.
+    # Dane: 2 bity na pozycję, 4 pozycje w bajcie.
+    MAGIC = b'WTB1'
+    HEADER = struct.Struct('<4sBH')
+    BLOCK = struct.Struct('<BBBBBQQ')
+
+    SQUARES = Checkers.BOARD_SIZE * Checkers.BOARD_SIZE // 2
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __init__(self, path: str) -> None:
+        """
+        Otwarcie pliku z tablicą końcówek.
+        ----
+         * `path`: plik zapisany funkcją `Tablebase.generate`.
+        """
+
+        self.__file = open(path, 'rb')
+        self.__data = mmap.mmap (
+            self.__file.fileno(), 0, access = mmap.ACCESS_READ
+        )
+
+        magic, self.__maxPieces, blocks = \
+            self.HEADER.unpack_from(self.__data, 0)
+        if self.MAGIC != magic:
+            self.close()
+            raise Exception (
+                "TABLEBASE EXCEPTION: Niepoprawny plik tablicy końcówek!"
+            )
+
+        self.__blocks = {}
+        offset = self.HEADER.size
+        for _ in range(blocks):
+            a, b, c, d, player, start, size = \
+                self.BLOCK.unpack_from(self.__data, offset)
+            self.__blocks[(a, b, c, d), player] = (start, size)
+            offset += self.BLOCK.size
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def close(self) -> None:
+        """
+        Zamknięcie pliku z tablicą końcówek.
+        """
+
+        self.__data.close()
+        self.__file.close()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getMaxPieces(self) -> int:
+        """
+        Zwraca maksymalną łączną liczbę pionków w pozycjach tablicy.
+        """
+
+        return self.__maxPieces
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def probe(self, masks: Tuple[int, int, int, int], player: int) -> int:
+        """
+        Zwraca wynik pozycji dla gracza w obecnej turze
+        (`RESULT_WIN`, `RESULT_LOSS`, `RESULT_DRAW`) albo
+        `RESULT_UNKNOWN`, jeśli pozycji nie ma w tablicy.
+        ----
+         * `masks`: maski bitowe planszy (`Checkers.getBitboards`).
+         * `player`: gracz w obecnej turze.
+        """
+
+        counts, index = self.indexPosition(masks)
+
+        block = self.__blocks.get((counts, player))
+        if block is None:
+            return self.RESULT_UNKNOWN
+
+        start, size = block
+        byte = self.__data[start + (index >> 2)]
+
+        return (byte >> ((index & 3) << 1)) & 3
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def probeCheckers(self, checkers: Checkers) -> int:
+        """
+        Wynik pozycji z początku obecnej tury w danej grze,
+        patrz: `Tablebase.probe`.
+        """
+
+        _, _, player = checkers.getGameState()
+
+        return self.probe(checkers.getBitboards(), player)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def promotionMasks(cls) -> Tuple[int, int]:
+        """
+        Maski pól awansu zwykłych pionków gracza 0 i gracza 1.
+        """
+
+        row = (1 << (Checkers.BOARD_SIZE // 2)) - 1
+
+        return row, row << (cls.SQUARES - Checkers.BOARD_SIZE // 2)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def isValid(cls, masks: Tuple[int, int, int, int]) -> bool:
+        """
+        Czy pozycja jest możliwa w grze? Zwykły pionek nie może stać
+        w wierszu awansu (awans następuje na końcu ruchu).
+        """
+
+        promotion = cls.promotionMasks()
+
+        return not ((masks[Bitboard.MASK_MEN] & promotion[0])
+            or (masks[Bitboard.MASK_MEN + 1] & promotion[1]))
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def tableSize(cls, counts: Counts) -> int:
+        """
+        Liczba indeksów pozycji o danych liczbach pionków.
+        """
+
+        size, free = 1, cls.SQUARES
+        for k in counts:
+            size *= comb(free, k)
+            free -= k
+
+        return size
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def indexPosition(cls, masks: List[int]) -> Tuple[Counts, int]:
+        """
+        Zwraca liczby pionków każdego rodzaju oraz indeks pozycji.
+        ----
+        Pionki kolejnych rodzajów rozkładane są na pozostałych wolnych
+        polach, a indeks łączy numery kombinacji (w porządku
+        koleksykograficznym) w systemie o mieszanych podstawach.
+        """
+
+        free = (1 << cls.SQUARES) - 1
+        counts = []
+        index = 0
+
+        for mask in masks:
+            k, rank, total = 0, 0, free.bit_count()
+            m = mask
+            while m:
+                low = m & (-m)
+                k += 1
+                rank += comb((free & (low - 1)).bit_count(), k)
+                m ^= low
+
+            index = index * comb(total, k) + rank
+            counts.append(k)
+            free &= ~mask
+
+        return tuple(counts), index
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def positionFromIndex(cls, counts: Counts, index: int) \
+    -> Tuple[int, int, int, int]:
+        """
+        Odtworzenie masek bitowych planszy z indeksu pozycji,
+        patrz: `Tablebase.indexPosition`.
+        """
+
+        sizes, free = [], cls.SQUARES
+        for k in counts:
+            sizes.append(comb(free, k))
+            free -= k
+
+        ranks = []
+        for size in reversed(sizes):
+            ranks.append(index % size)
+            index //= size
+        ranks.reverse()
+
+        free = [s for s in range(cls.SQUARES)]
+        masks = []
+
+        for k, rank in zip(counts, ranks):
+            mask = 0
+            r = len(free)
+            for i in range(k, 0, -1):
+                r -= 1
+                while comb(r, i) > rank:
+                    r -= 1
+                rank -= comb(r, i)
+                mask |= 1 << free[r]
+            masks.append(mask)
+            free = [s for s in free if not (mask >> s) & 1]
+
+        return tuple(masks)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @staticmethod
+    def signatures(maxPieces: int) -> List[Counts]:
+        """
+        Wszystkie liczby pionków (rodzajami) z co najmniej jednym
+        pionkiem każdego gracza i co najwyżej `maxPieces` pionkami,
+        uporządkowane rosnąco według łącznej liczby pionków.
+        """
+
+        result = []
+
+        for total in range(2, maxPieces + 1):
+            for a in range(total + 1):
+                for b in range(total + 1 - a):
+                    for c in range(total + 1 - a - b):
+                        d = total - a - b - c
+                        if (a + c > 0) and (b + d > 0):
+                            result.append((a, b, c, d))
+
+        return result
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def generate(cls, path: str, maxPieces: int = DEFAULT_PIECES, \
+    workers: int = None) -> dict:
+        """
+        Zbudowanie tablicy końcówek i zapisanie jej do pliku.
+        Zwraca słownik z liczbą wygranych, przegranych i remisów.
+        ----
+         * `path`: plik wynikowy.
+         * `maxPieces`: maksymalna łączna liczba pionków.
+         * `workers`: liczba procesów roboczych
+          (domyślnie liczba rdzeni procesora).
+        """
+
+        workers = workers or os.cpu_count() or 1
+        values = {}
+
+        signatures = cls.signatures(maxPieces)
+
+        with ProcessPoolExecutor(workers) as pool:
+            for total in range(2, maxPieces + 1):
+                layer = [
+                    (counts, player)
+                    for counts in signatures if sum(counts) == total
+                    for player in range(2)
+                ]
+                values.update(cls.__solveLayer(pool, layer, values))
+
+        stats = {'win': 0, 'loss': 0, 'draw': 0}
+        names = {
+            cls.RESULT_WIN: 'win',
+            cls.RESULT_LOSS: 'loss',
+            cls.RESULT_DRAW: 'draw'
+        }
+        for table in values.values():
+            for v in table:
+                if v in names:
+                    stats[names[v]] += 1
+
+        cls.__write(path, maxPieces, values)
+
+        return stats
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def __solveLayer(cls, pool: ProcessPoolExecutor, \
+    layer: List[Tuple[Counts, int]], solved: dict) -> dict:
+        """
+        Analiza wsteczna wszystkich pozycji z tą samą łączną liczbą
+        pionków (awans nie zmienia liczby pionków, więc pozycje
+        różnych rodzajów w jednej warstwie mogą się przeplatać).
+        Pozycje po biciu należą do rozwiązanych już warstw `solved`.
+        """
+
+        WIN, LOSS, DRAW = cls.RESULT_WIN, cls.RESULT_LOSS, cls.RESULT_DRAW
+
+        offsets, total = {}, 0
+        for key in layer:
+            offsets[key] = total
+            total += cls.tableSize(key[0])
+
+        futures = []
+        for counts, player in layer:
+            size = cls.tableSize(counts)
+            for start in range(0, size, cls.CHUNK_SIZE):
+                futures.append((
+                    offsets[counts, player] + start,
+                    player,
+                    pool.submit (
+                        expandPositions, counts, player,
+                        start, min(size, start + cls.CHUNK_SIZE)
+                    )
+                ))
+
+        value = bytearray(total)
+        remaining = [0] * total
+        preds = [None] * total
+        queue = []
+
+        for base, player, future in futures:
+            for i, entry in enumerate(future.result()):
+                node = base + i
+
+                if entry is None:
+                    continue
+
+                if entry is True:
+                    value[node] = WIN
+                    queue.append(node)
+                    continue
+
+                # Ruchy do rozwiązanych warstw (po biciu)
+                lower, same = [], []
+                for counts, index in entry:
+                    key = (counts, player ^ 1)
+                    if key in offsets:
+                        same.append(offsets[key] + index)
+                    else:
+                        lower.append(solved[key][index])
+
+                if LOSS in lower:
+                    value[node] = WIN
+                    queue.append(node)
+                    continue
+
+                remaining[node] = len(same) + lower.count(DRAW)
+                for s in same:
+                    if preds[s] is None:
+                        preds[s] = [node]
+                    else:
+                        preds[s].append(node)
+
+                if 0 == remaining[node]:
+                    value[node] = LOSS
+                    queue.append(node)
+
+        while queue:
+            node = queue.pop()
+            if preds[node] is None:
+                continue
+
+            for p in preds[node]:
+                if value[p]:
+                    continue
+                if LOSS == value[node]:
+                    value[p] = WIN
+                    queue.append(p)
+                else:
+                    remaining[p] -= 1
+                    if 0 == remaining[p]:
+                        value[p] = LOSS
+                        queue.append(p)
+
+        result = {}
+        for key in layer:
+            start = offsets[key]
+            table = value[start : start + cls.tableSize(key[0])]
+            for i, v in enumerate(table):
+                if (not v) and (remaining[start + i] > 0):
+                    table[i] = DRAW
+            result[key] = table
+
+        return result
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def __write(cls, path: str, maxPieces: int, values: dict) -> None:
+        """
+        Zapisanie tablic (2 bity na pozycję) do pliku.
+        """
+
+        keys = sorted(values)
+        offset = cls.HEADER.size + len(keys) * cls.BLOCK.size
+
+        with open(path, 'wb') as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, maxPieces, len(keys)))
+
+            for counts, player in keys:
+                size = len(values[counts, player])
+                f.write(cls.BLOCK.pack(*counts, player, offset, size))
+                offset += (size + 3) >> 2
+
+            for key in keys:
+                table = values[key]
+                packed = bytearray((len(table) + 3) >> 2)
+                for i, v in enumerate(table):
+                    packed[i >> 2] |= v << ((i & 3) << 1)
+                f.write(packed)
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def main() -> None:
+    """
+    Uruchomienie z wiersza poleceń, np.:
+    `python Tablebase.py koncowki.bin --pieces 3`.
+    """
+
+    parser = argparse.ArgumentParser (
+        description = 'Warcaby: tablica końcówek'
+    )
+    parser.add_argument('path', metavar = 'PLIK')
+    parser.add_argument('--pieces', type = int,
+        default = Tablebase.DEFAULT_PIECES)
+    parser.add_argument('--workers', type = int, default = None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = Tablebase.generate(args.path, args.pieces, args.workers)
+
+    print('Wygrane: %d, przegrane: %d, remisy: %d (%.1f s)' % (
+        stats['win'], stats['loss'], stats['draw'],
+        time.perf_counter() - start
+    ))
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    main()
+
+
+################################################################
@@ -0,0 +1,329 @@
+################################################################
+# Warcaby: "/src/TkinterCanvasUi.py"
+################################################################
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import tkinter
+from typing import List, Tuple
+
+from AbstractUi import AbstractUi
+from Checkers import Checkers
+from CheckersEvent import CheckersEvent
+from ComputerPlayer import ComputerPlayer
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class TkinterCanvasUi(AbstractUi):
+    """
+    Graficzny interfejs do gry "Warcaby" rysowany na jednym
+    obiekcie `tkinter.Canvas` (zamiast 64 przycisków).
+    ----
+    Wskazane pole wyznaczane jest arytmetycznie z pozycji kliknięcia,
+    a po każdej zmianie przerysowywane są tylko pionki na zmienionych
+    polach (elementy oznaczone etykietą pola). Plansza skaluje się
+    razem z oknem.
+    """
+
+    WINDOW_TITLE = "WARCABY"
+    WINDOW_WIDTH = 640
+    WINDOW_HEIGHT = 480
+
+    FONT = ('Courier New', 12)
+
+    LABEL_HEIGHT = 32
+    MARGIN = 16
+
+    SQUARE_DARKCOLOR = '#A4795D'
+    SQUARE_LIGHTCOLOR = '#DBCCA3'
+
+    # Kolory pionków gracza 0 (CZARNE) oraz gracza 1 (BIAŁE)
+    PAWN_COLORS = ('#202020', '#F0F0F0')
+    PAWN_OUTLINES = ('#F0F0F0', '#202020')
+    SELECTED_COLOR = '#FFD700'
+    MARKER_COLOR = '#C00000'
+
+    RESETBTN_WIDTH = 128
+    RESETBTN_HEIGHT = 64
+
+    # Opóźnienie ruchu komputera (w milisekundach),
+    # aby plansza zdążyła się odświeżyć po ruchu człowieka.
+    COMPUTER_DELAY = 50
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __init__(self, checkers: Checkers, \
+    computer: ComputerPlayer = None) -> None:
+        """
+        Inicjalizacja klasy `TkinterCanvasUi`.
+        ----
+         * checkers: instancja Warcabów obsługiwana przez nowy interfejs.
+         * computer: opcjonalny komputerowy przeciwnik.
+        """
+
+        super().__init__(checkers, computer)
+
+        # Główne okno Tkinter
+
+        self.__master = tkinter.Tk()
+
+        self.__master.title(self.WINDOW_TITLE)
+        self.__master.geometry(f"{self.WINDOW_WIDTH}x{self.WINDOW_HEIGHT}")
+
+        # Etykieta na komunikaty
+
+        self.__msgLabel = tkinter.Label (
+            self.__master, text = 'Rozpocznij nową grę!',
+            font = self.FONT, bg = '#FFFFFF',
+            borderwidth = 2, relief = tkinter.SUNKEN,
+            height = 1
+        )
+
+        self.__msgLabel.pack (
+            side = tkinter.TOP, fill = tkinter.X,
+            padx = self.MARGIN, pady = self.MARGIN
+        )
+
+        # Przycisk resetujący grę
+
+        resetFrame = tkinter.Frame (
+            self.__master,
+            width = self.RESETBTN_WIDTH,
+            height = self.RESETBTN_HEIGHT,
+        )
+
+        resetButton = tkinter.Button (
+            resetFrame, text = 'Nowa gra',
+            font = self.FONT, bg = '#000000', fg = '#FFFFFF',
+            command = lambda: self.processResetButton()
+        )
+
+        resetButton.pack(fill = tkinter.BOTH, expand = True)
+
+        resetFrame.pack_propagate(False)
+        resetFrame.pack (
+            side = tkinter.RIGHT, anchor = tkinter.SE,
+            padx = self.MARGIN, pady = self.MARGIN
+        )
+
+        # Plansza
+
+        self.__canvas = tkinter.Canvas (
+            self.__master, bg = '#000000', highlightthickness = 0
+        )
+
+        self.__canvas.pack (
+            side = tkinter.LEFT, fill = tkinter.BOTH, expand = True,
+            padx = (self.MARGIN, 0), pady = (0, self.MARGIN)
+        )
+
+        self.__canvas.bind('<Configure>', self.__processResize)
+        self.__canvas.bind('<Button-1>', self.__processClick)
+
+        # Rozmiar pola (w pikselach) i ostatnio narysowane pionki
+
+        self.__squareSize = 0
+        self.__renderedBoard = [
+            [None] * Checkers.BOARD_SIZE
+            for _ in range(Checkers.BOARD_SIZE)
+        ]
+        self.__renderedMessage = None
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def enable(self, state: bool) -> None:
+        """Patrz: `AbstractUi.enable`."""
+
+        if state:
+            self.__master.mainloop()
+
+        else:
+            self.__master.destroy()
+            self.close()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def updateBoard(self) -> None:
+        """Patrz: `AbstractUi.updateBoard`."""
+
+        self.__updateSquares(self.takeDirtySquares())
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def drawBoard(self) -> None:
+        """Patrz: `AbstractUi.drawBoard`."""
+
+        canvas = self.__canvas
+        size = self.__squareSize
+
+        canvas.delete(tkinter.ALL)
+
+        for y in range(Checkers.BOARD_SIZE):
+            for x in range(Checkers.BOARD_SIZE):
+                color = self.SQUARE_DARKCOLOR if ((x & 1) ^ (y & 1)) \
+                    else self.SQUARE_LIGHTCOLOR
+                canvas.create_rectangle (
+                    x * size, y * size, (x + 1) * size, (y + 1) * size,
+                    fill = color, width = 0, tags = ('square',)
+                )
+
+        # Wszystkie pionki należy narysować od nowa.
+        for row in self.__renderedBoard:
+            for x in range(len(row)):
+                row[x] = None
+
+        self.processEvent(CheckersEvent(CheckersEvent.EVENT_RESET, -1, ()))
+        self.updateBoard()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __updateSquares(self, squares: List[Tuple[int, int]]) -> None:
+        """
+        Przerysowanie pionków na wybranych polach oraz etykiety.
+        Zmieniane są wyłącznie pola, których zawartość się zmieniła.
+        ----
+         * `squares`: pozycje [X, Y] sprawdzanych pól.
+        """
+
+        for x, y in squares:
+            text = self._checkers.getTextSquare(x, y)
+            if text != self.__renderedBoard[y][x]:
+                self.__drawPawn(x, y, text)
+                self.__renderedBoard[y][x] = text
+
+        message = self._checkers.getTextState()
+        if message != self.__renderedMessage:
+            self.__msgLabel['text'] = message
+            self.__renderedMessage = message
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __drawPawn(self, x: int, y: int, text: str) -> None:
+        """
+        Narysowanie pionka na danym polu (elementy z etykietą pola).
+        ----
+         * `text`: tekstowa reprezentacja pola
+          (patrz: `Checkers.getTextBoard`).
+        """
+
+        canvas = self.__canvas
+        tag = f'pawn{x}_{y}'
+        size = self.__squareSize
+
+        canvas.delete(tag)
+
+        if (not text) or (size <= 0):
+            return
+
+        selected = text.startswith('[')
+        text = text.strip('[]')
+
+        pad = max(2, size // 8)
+        left, top = x * size + pad, y * size + pad
+        right, bottom = (x + 1) * size - pad, (y + 1) * size - pad
+
+        if 'x' == text:
+            canvas.create_line (
+                left, top, right, bottom,
+                fill = self.MARKER_COLOR, width = 3, tags = (tag,)
+            )
+            canvas.create_line (
+                left, bottom, right, top,
+                fill = self.MARKER_COLOR, width = 3, tags = (tag,)
+            )
+            return
+
+        player = Checkers.PLAYER_ICONS.index(text[0])
+
+        canvas.create_oval (
+            left, top, right, bottom,
+            fill = self.PAWN_COLORS[player],
+            outline = self.SELECTED_COLOR if selected \
+                else self.PAWN_OUTLINES[player],
+            width = 4 if selected else 2,
+            tags = (tag,)
+        )
+
+        # Damka: dodatkowy napis na pionku
+        if len(text) > 1:
+            canvas.create_text (
+                (left + right) // 2, (top + bottom) // 2,
+                text = 'D', fill = self.PAWN_OUTLINES[player],
+                font = (self.FONT[0], max(6, size // 3), 'bold'),
+                tags = (tag,)
+            )
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __processResize(self, event: tkinter.Event) -> None:
+        """
+        Dopasowanie rozmiaru pól do nowego rozmiaru planszy.
+        """
+
+        size = min(event.width, event.height) // Checkers.BOARD_SIZE
+
+        if size != self.__squareSize:
+            self.__squareSize = size
+            self.drawBoard()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __processClick(self, event: tkinter.Event) -> None:
+        """
+        Wyznaczenie wskazanego pola na podstawie pozycji kliknięcia.
+        """
+
+        size = self.__squareSize
+        if size <= 0:
+            return
+
+        x, y = event.x // size, event.y // size
+
+        if (0 <= x < Checkers.BOARD_SIZE) and (0 <= y < Checkers.BOARD_SIZE):
+            self.processBoardSquare(x, y)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def processBoardSquare(self, x: int, y: int) -> None:
+        """
+        Przetwarzanie po wskazaniu pola na planszy.
+        ----
+         * `x`: indeks kolumny, od lewej do prawej [0-7].
+         * `y`: indeks wiersza, od góry do dołu [0-7].
+        """
+
+        # Pionki komputera nie są przesuwane przez człowieka.
+        if self.isComputerTurn():
+            return
+
+        if self._checkers.processInput(x, y):
+            self.updateBoard()
+            self.scheduleComputerTurn()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def scheduleComputerTurn(self) -> None:
+        """
+        Zaplanowanie ruchu komputera po odświeżeniu okna.
+        """
+
+        def computerTurn() -> None:
+            if self.playComputerTurn():
+                self.updateBoard()
+
+        if self.isComputerTurn():
+            self.__master.after(self.COMPUTER_DELAY, computerTurn)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def processResetButton(self) -> None:
+        """
+        Wciśnięcie przycisku do uruchomienia nowej gry.
+        """
+
+        self._checkers.newGame()
+
+        self.updateBoard()
+        self.scheduleComputerTurn()
+
+
+################################################################
@@ -4,9 +4,11 @@
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
 import tkinter
+from typing import List, Tuple
 
 from AbstractUi import AbstractUi
 from Checkers import Checkers
+from ComputerPlayer import ComputerPlayer
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -41,16 +43,22 @@ class TkinterUi(AbstractUi):
     RESETBTN_X = WINDOW_WIDTH - 16 - RESETBTN_WIDTH
     RESETBTN_Y = WINDOW_HEIGHT - 16 - RESETBTN_HEIGHT
 
+    # Opóźnienie ruchu komputera (w milisekundach),
+    # aby plansza zdążyła się odświeżyć po ruchu człowieka.
+    COMPUTER_DELAY = 50
+
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-    def __init__(self, checkers: Checkers) -> None:
+    def __init__(self, checkers: Checkers, \
+    computer: ComputerPlayer = None) -> None:
         """
         Inicjalizacja klasy `TkinterUi`.
         ----
          * checkers: instancja Warcabów obsługiwana przez nowy interfejs.
+         * computer: opcjonalny komputerowy przeciwnik.
         """
 
-        super().__init__(checkers)
+        super().__init__(checkers, computer)
 
         # Główne okno Tkinter
 
@@ -88,6 +96,15 @@ class TkinterUi(AbstractUi):
 
         self.__boardButtons = []
 
+        # Ostatnio wyświetlone teksty przycisków i etykiety
+        # (zmieniane są tylko różniące się przyciski).
+
+        self.__renderedBoard = [
+            [None] * Checkers.BOARD_SIZE
+            for _ in range(Checkers.BOARD_SIZE)
+        ]
+        self.__renderedMessage = None
+
         for y in range(Checkers.BOARD_SIZE):
             rowOfButtons = []
 
@@ -152,20 +169,35 @@ class TkinterUi(AbstractUi):
 
         else:
             self.__master.destroy()
+            self.close()
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
     def updateBoard(self) -> None:
         """Patrz: `AbstractUi.updateBoard`."""
 
-        textBoard = self._checkers.getTextBoard()
+        self.__updateSquares(self.takeDirtySquares())
 
-        for y in range(Checkers.BOARD_SIZE):
-            for x in range(Checkers.BOARD_SIZE):
-                if (x & 1) ^ (y & 1):
-                    self.__boardButtons[y][x]['text'] = textBoard[y][x]
 
-        self.__msgLabel['text'] = self._checkers.getTextState()
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __updateSquares(self, squares: List[Tuple[int, int]]) -> None:
+        """
+        Odświeżenie wybranych przycisków planszy oraz etykiety.
+        Konfigurowane są wyłącznie przyciski, których tekst się zmienił.
+        ----
+         * `squares`: pozycje [X, Y] sprawdzanych pól.
+        """
+
+        for x, y in squares:
+            text = self._checkers.getTextSquare(x, y)
+            if text != self.__renderedBoard[y][x]:
+                self.__boardButtons[y][x]['text'] = text
+                self.__renderedBoard[y][x] = text
+
+        message = self._checkers.getTextState()
+        if message != self.__renderedMessage:
+            self.__msgLabel['text'] = message
+            self.__renderedMessage = message
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -177,8 +209,27 @@ class TkinterUi(AbstractUi):
          * `y`: indeks wiersza, od góry do dołu [0-7].
         """
 
+        # Pionki komputera nie są przesuwane przez człowieka.
+        if self.isComputerTurn():
+            return
+
         if self._checkers.processInput(x, y):
             self.updateBoard()
+            self.scheduleComputerTurn()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def scheduleComputerTurn(self) -> None:
+        """
+        Zaplanowanie ruchu komputera po odświeżeniu okna.
+        """
+
+        def computerTurn() -> None:
+            if self.playComputerTurn():
+                self.updateBoard()
+
+        if self.isComputerTurn():
+            self.__master.after(self.COMPUTER_DELAY, computerTurn)
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -190,6 +241,7 @@ class TkinterUi(AbstractUi):
         self._checkers.newGame()
 
         self.updateBoard()
+        self.scheduleComputerTurn()
 
 
 ################################################################
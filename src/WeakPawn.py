@@ -11,21 +11,31 @@ from AbstractPawn import AbstractPawn
 class WeakPawn(AbstractPawn):
     """
     Zwykły pionek w grze "Warcaby".
+    ----
+    Instancje tworzone są wywołaniem `WeakPawn(player)`,
+    które zwraca współdzielony obiekt danego gracza.
     """
 
+    __slots__ = ('_player',)
+
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-    def __init__(self, player: int) -> None:
+    def _setup(self, player: int) -> None:
         """
-        Inicjalizacja klasy `WeakPawn`.
+        Jednorazowe ustawienie pól nowej instancji `WeakPawn`.
         ----
          * `player`: numer gracza (0 lub 1).
           Określa też dozwolony kierunek ruchu pionka.
         """
 
-        self._state = self.STATE_STANDBY
+        object.__setattr__(self, '_player', player)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __reduce__(self) -> tuple:
+        """Patrz: `AbstractPawn.__reduce__`."""
 
-        self._player = player
+        return (type(self), (self._player,))
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -59,16 +69,11 @@ class WeakPawn(AbstractPawn):
         """
         Tekstowa reprezentacja pionka.
         ----
-        Jeśli pionek jest zaznaczony, to zwracany tekst
-        jest objęty w nawiasy kwadratowe.
+        Zaznaczenie pionka (nawiasy kwadratowe) dodaje plansza,
+        patrz: `Checkers.getTextBoard`.
         """
 
-        t = self.playerStr() + self.pawnStr()
-
-        if self.STATE_SELECTED == self._state:
-            t = '[' + t + ']'
-
-        return t
+        return self.playerStr() + self.pawnStr()
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
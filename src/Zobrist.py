@@ -0,0 +1,78 @@
+################################################################
+# Warcaby: "/src/Zobrist.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import random
+from typing import List
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class Zobrist():
+    """
+    Klucze haszowania Zobrista dla planszy w grze "Warcaby".
+    ----
+    Hasz pozycji to XOR kluczy wszystkich pionków (rodzaj pionka
+    i indeks ciemnego pola, jak w klasie `Bitboard`) oraz klucza
+    strony grającej, jeżeli ruch należy do gracza drugiego.
+    ----
+    Klucze losowane są ze stałego ziarna, więc hasze są takie same
+    we wszystkich procesach i przy każdym uruchomieniu programu.
+    """
+
+    SEED = 2021
+
+    # Klucze losowane raz dla każdej liczby pól
+    __keys = {}
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __init__(self, squares: int) -> None:
+        """
+        Inicjalizacja klasy `Zobrist`.
+        ----
+         * `squares`: liczba ciemnych pól na planszy.
+        """
+
+        if squares not in self.__keys:
+            rng = random.Random(self.SEED)
+            self.__keys[squares] = (
+                [
+                    [rng.getrandbits(64) for _ in range(squares)]
+                    for _ in range(4)
+                ],
+                rng.getrandbits(64)
+            )
+
+        self.pieceKeys, self.sideKey = self.__keys[squares]
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __deepcopy__(self, memo: dict) -> 'Zobrist':
+        """
+        Klucze są niezmienne, więc kopia jest tym samym obiektem.
+        """
+
+        return self
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def hashMasks(self, masks: List[int], player: int) -> int:
+        """
+        Obliczenie hasza od podstaw na podstawie czterech masek
+        (jak w `Bitboard.masks`) oraz gracza w obecnej turze.
+        """
+
+        result = self.sideKey if (1 == player) else 0
+
+        for keys, mask in zip(self.pieceKeys, masks):
+            while mask:
+                low = mask & (-mask)
+                result ^= keys[low.bit_length() - 1]
+                mask ^= low
+
+        return result
+
+
+################################################################
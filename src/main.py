@@ -4,31 +4,261 @@
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-from Checkers import Checkers
-from TkinterUi import TkinterUi
-from ConsoleUi import ConsoleUi
+# Moduły interfejsów (oraz `tkinter`) importowane są dopiero
+# po wybraniu interfejsu, aby tryby bez okna startowały szybko.
+import argparse
+import sys
+from typing import TYPE_CHECKING, List, Optional
+
+# Tylko dla adnotacji typów (bez importu w trakcie działania)
+if TYPE_CHECKING:
+    from ComputerPlayer import ComputerPlayer
+    from Move import Move
+
+
+# Maksymalny czas uruchomienia trybów bez okna (w sekundach),
+# sprawdzany w `test_main.py`.
+COLD_START_BUDGET = 0.5
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-if '__main__' == __name__:
+def parseArguments(argv: List[str]) -> argparse.Namespace:
+    """
+    Odczytanie argumentów wiersza poleceń.
+    """
+
+    parser = argparse.ArgumentParser(description = 'Warcaby')
+    parser.add_argument('--ui', default = 'demo',
+        choices = ('demo', 'tk', 'canvas', 'console', 'engine', 'batch'),
+        help = 'interfejs: demo (okno, a potem konsola), tk, canvas, '
+            'console, engine (protokół tekstowy), batch (gry komputera)')
+    parser.add_argument('--computer', default = '1',
+        choices = ('none', '0', '1'),
+        help = 'gracz prowadzony przez komputer')
+    parser.add_argument('--time', type = float, default = None,
+        help = 'limit czasu komputera na ruch (w sekundach)')
+    parser.add_argument('--nodes', type = int, default = None,
+        help = 'limit węzłów komputera na ruch')
+    parser.add_argument('--ansi', action = 'store_true',
+        help = 'konsola: przerysowywanie tylko zmienionych pól')
+    parser.add_argument('--games', type = int, default = 100,
+        help = 'batch: liczba gier')
+    parser.add_argument('--policies', nargs = 2, default = None,
+        metavar = ('A', 'B'), help = 'batch: strategie obu stron')
+    parser.add_argument('--workers', type = int, default = None,
+        help = 'batch: liczba procesów roboczych')
+    parser.add_argument('--max-plies', type = int, default = 200,
+        help = 'batch: limit ruchów w grze (remis)')
+    parser.add_argument('--seed', type = int, default = 0,
+        help = 'batch: ziarno pierwszej gry')
+
+    return parser.parse_args(argv)
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def createComputer(args: argparse.Namespace) -> Optional['ComputerPlayer']:
+    """
+    Utworzenie komputerowego przeciwnika (lub `None`).
+    """
+
+    if 'none' == args.computer:
+        return None
+
+    from ComputerPlayer import ComputerPlayer
+
+    return ComputerPlayer(int(args.computer), args.nodes, args.time)
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def runInteractive(args: argparse.Namespace) -> int:
+    """
+    Gra z interfejsem okienkowym i/lub konsolowym.
+    """
+
+    from Checkers import Checkers
 
     x = '-' * 64
 
     print(x, 'Witaj w grze WARCABY!', x, sep = '\n')
 
     checkers = Checkers()
+    computer = createComputer(args)
 
-    print(x, 'Wypróbuj interfejs \"Tkinter\" :)', x, sep = '\n')
+    if args.ui in ('demo', 'tk'):
+        from TkinterUi import TkinterUi
 
-    ui = TkinterUi(checkers)
-    ui.enable(True)
+        print(x, 'Wypróbuj interfejs \"Tkinter\" :)', x, sep = '\n')
 
-    print(x, 'Wypróbuj interfejs \"Console\" :)', x, sep = '\n')
+        ui = TkinterUi(checkers, computer)
+        ui.enable(True)
+        ui.close()
 
-    ui = ConsoleUi(checkers)
-    ui.enable(True)
+    if 'canvas' == args.ui:
+        from TkinterCanvasUi import TkinterCanvasUi
+
+        ui = TkinterCanvasUi(checkers, computer)
+        ui.enable(True)
+        ui.close()
+
+    if args.ui in ('demo', 'console'):
+        from ConsoleUi import ConsoleUi
+
+        print(x, 'Wypróbuj interfejs \"Console\" :)', x, sep = '\n')
+
+        ui = ConsoleUi(checkers, computer, ansi = args.ansi)
+        ui.enable(True)
+        ui.close()
 
     print(x, 'Dziękuję za grę!', x, sep = '\n')
 
+    return 0
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def runEngine(args: argparse.Namespace) -> int:
+    """
+    Tekstowy protokół dla innych programów: jedno polecenie w wierszu
+    na standardowym wejściu, jedna odpowiedź w wierszu na wyjściu.
+    ----
+    Pole zapisywane jest jako `x,y`, a ruch jako kolejne wskazywane
+    pola połączone znakiem `-` (np. `0,5-1,4`). Polecenia:
+     * `new`: nowa gra (`ok`).
+     * `board`: plansza, wiersze oddzielone `/`, pola `,` (`_` = puste).
+     * `state`: stan gry, informacja o turze i gracz.
+     * `hash`: hasz pozycji (szesnastkowo).
+     * `moves`: dozwolone ruchy.
+     * `play RUCH`: wykonanie ruchu (`ok` lub `error`).
+     * `undo`: cofnięcie ostatniego ruchu.
+     * `go [nodes N | time T]`: najlepszy ruch według komputera
+      (`bestmove RUCH` lub `bestmove none`).
+     * `quit`: zakończenie programu.
+    """
+
+    from Checkers import Checkers
+    from ComputerPlayer import ComputerPlayer
+
+    checkers = Checkers(Checkers.BACKEND_BITBOARDS)
+    checkers.newGame()
+
+    def moveText(move: 'Move') -> str:
+        return '-'.join('%d,%d' % xy for xy in move.getClicks())
+
+    def reply(text: str) -> None:
+        sys.stdout.write(text + '\n')
+        sys.stdout.flush()
+
+    for line in sys.stdin:
+        words = line.split()
+        if not words:
+            continue
+
+        command, params = words[0], words[1:]
+
+        if 'quit' == command:
+            break
+
+        elif 'new' == command:
+            checkers.newGame()
+            reply('ok')
+
+        elif 'board' == command:
+            reply('board ' + '/'.join (
+                ','.join(t or '_' for t in row)
+                for row in checkers.getTextBoard()
+            ))
+
+        elif 'state' == command:
+            reply('state %d %d %d' % checkers.getGameState())
+
+        elif 'hash' == command:
+            reply('hash %016x' % checkers.getPositionHash())
+
+        elif 'moves' == command:
+            reply(' '.join(['moves'] + [
+                moveText(m) for m in checkers.generateMoves()
+            ]))
+
+        elif 'play' == command:
+            moves = {moveText(m): m for m in checkers.generateMoves()}
+            if params and (params[0] in moves):
+                checkers.makeMove(moves[params[0]])
+                reply('ok')
+            else:
+                reply('error illegal move')
+
+        elif 'undo' == command:
+            if checkers.unmakeMove() is None:
+                reply('error nothing to undo')
+            else:
+                reply('ok')
+
+        elif 'go' == command:
+            nodes, limit = args.nodes, args.time
+            try:
+                if 2 == len(params) and 'nodes' == params[0]:
+                    nodes, limit = int(params[1]), None
+                elif 2 == len(params) and 'time' == params[0]:
+                    nodes, limit = None, float(params[1])
+            except ValueError:
+                reply('error invalid limit')
+                continue
+
+            player = checkers.getGameState()[2]
+            move = ComputerPlayer(player, nodes, limit).chooseMove(checkers)
+            reply('bestmove ' + ('none' if move is None else moveText(move)))
+
+        else:
+            reply('error unknown command')
+
+    return 0
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def runBatch(args: argparse.Namespace) -> int:
+    """
+    Rozegranie serii gier komputera bez interfejsu
+    (wynik w formacie JSON w jednym wierszu).
+    """
+
+    import json
+    from SelfPlay import SelfPlay
+
+    names = args.policies or ('greedy', 'random')
+    for name in names:
+        if name not in SelfPlay.POLICIES:
+            sys.stderr.write('Nieznana strategia: %s\n' % name)
+            return 2
+
+    selfPlay = SelfPlay (
+        SelfPlay.POLICIES[names[0]], SelfPlay.POLICIES[names[1]],
+        args.workers, args.max_plies
+    )
+
+    print(json.dumps(selfPlay.run(args.games, args.seed)))
+
+    return 0
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def main(argv: List[str] = None) -> int:
+    """
+    Uruchomienie gry z wybranym interfejsem.
+    """
+
+    args = parseArguments(sys.argv[1:] if argv is None else argv)
+
+    if 'engine' == args.ui:
+        return runEngine(args)
+
+    if 'batch' == args.ui:
+        return runBatch(args)
+
+    return runInteractive(args)
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    sys.exit(main())
+
 
 ################################################################
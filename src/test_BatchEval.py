@@ -0,0 +1,77 @@
+################################################################
+# Warcaby: "/src/test_BatchEval.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import random
+import unittest
+
+from BatchEval import BatchEval, numpy
+from Checkers import Checkers
+from ComputerPlayer import ComputerPlayer
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+@unittest.skipIf(numpy is None, 'brak biblioteki numpy')
+class test_BatchEval(unittest.TestCase):
+    """
+    Testy oceny pozycji w partiach w grze "Warcaby"
+    """
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_MatchesComputerPlayer(self) -> None:
+        """
+        Oceny obu reprezentacji pozycji są zgodne
+        z `ComputerPlayer.evaluate`.
+        """
+
+        rng = random.Random(7)
+        checkers = Checkers(Checkers.BACKEND_BITBOARDS)
+        computer = ComputerPlayer(0, maxNodes = 1)
+        batch = BatchEval()
+
+        masks, players, expected = [], [], []
+
+        for _ in range(20):
+            checkers.newGame()
+            for _ in range(rng.randrange(60)):
+                moves = checkers.generateMoves()
+                if not moves:
+                    break
+                checkers.makeMove(rng.choice(moves))
+
+            masks.append(checkers.getBitboards())
+            players.append(checkers.getGameState()[2])
+            expected.append(computer.evaluate(checkers))
+
+        positions = numpy.array(masks, dtype = numpy.uint32)
+        squares = batch.squaresFromBitboards(positions)
+
+        self.assertEqual(squares.shape, (20, 32))
+        self.assertEqual(squares.dtype, numpy.int8)
+        self.assertEqual (
+            batch.evaluate(positions, players).tolist(), expected
+        )
+        self.assertEqual (
+            batch.evaluate(squares, numpy.array(players)).tolist(), expected
+        )
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_InvalidShape(self) -> None:
+        """
+        Tablica o niewłaściwej liczbie kolumn.
+        """
+
+        with self.assertRaises(ValueError):
+            BatchEval().evaluate(numpy.zeros((3, 5), dtype = numpy.int8))
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    unittest.main()
+
+
+################################################################
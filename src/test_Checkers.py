@@ -6,9 +6,15 @@
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
 import unittest
 import copy
+import pickle
+import random
 from typing import List, Tuple
 
 from Checkers import Checkers
+from CheckersEvent import CheckersEvent
+from AbstractPawn import AbstractPawn
+from WeakPawn import WeakPawn
+from StrongPawn import StrongPawn
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -37,6 +43,54 @@ def multilineBoardTextToList(textBoard: str) -> List[List[str]]:
     return result
 
 
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+def clickedMoves(checkers: Checkers) -> set:
+    """
+    Wyszukanie wszystkich ruchów gracza poprzez wskazywanie kolejnych pól
+     (`Checkers.processInput`). Po każdej próbie ruch jest anulowany
+     lub cofany (`Checkers.unmakeMove`). Zwraca zbiór par:
+     pole startowe oraz krotka kolejnych pól lądowania.
+    ----
+        * `checkers`: Warcaby w stanie podnoszenia pionka.
+    """
+
+    darkSquares = [
+        (x, y)
+        for y in range(Checkers.BOARD_SIZE)
+        for x in range(Checkers.BOARD_SIZE)
+        if (x & 1) ^ (y & 1)
+    ]
+
+    _, _, player = checkers.getGameState()
+    result = set()
+
+    def walk(start: tuple, path: tuple) -> None:
+        for x, y in darkSquares:
+            if (x, y) == start:
+                continue
+
+            for px, py in (start,) + path:
+                checkers.processInput(px, py)
+            checkers.processInput(x, y)
+
+            state, turnInfo, nextPlayer = checkers.getGameState()
+            if Checkers.TURNINFO_FIGHT_AGAIN == turnInfo:
+                checkers.processInput(start[0], start[1])
+                walk(start, path + ((x, y),))
+            elif (nextPlayer != player) \
+            or (Checkers.GAMESTATE_END == state):
+                result.add((start, path + ((x, y),)))
+                checkers.unmakeMove()
+
+    for x, y in darkSquares:
+        checkers.processInput(x, y)
+        if Checkers.GAMESTATE_PUT == checkers.getGameState()[0]:
+            checkers.processInput(x, y)
+            walk((x, y), ())
+
+    return result
+
+
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
 class test_Checkers(unittest.TestCase):
     """
@@ -48,6 +102,9 @@ class test_Checkers(unittest.TestCase):
     TESTMOVES_MULTIFIGHT  = 2
     TESTMOVES_PAWNPUTBACK = 3
 
+    # Sposób sprawdzania zasad gry w testowanej instancji Warcabów
+    BACKEND = Checkers.BACKEND_OBJECTS
+
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
     @classmethod
@@ -57,7 +114,7 @@ class test_Checkers(unittest.TestCase):
         """
 
         # Instancja klasy Warcabowej
-        cls.__checkers = Checkers()
+        cls.__checkers = Checkers(cls.BACKEND)
 
         # Układ pionków w nowej grze
         cls.__newGameBoard = multilineBoardTextToList (
@@ -782,6 +839,631 @@ class test_Checkers(unittest.TestCase):
         self.__printTestFooter()
 
 
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_BackendsAgree(self) -> None:
+        """
+        Testowanie zgodności obu sposobów sprawdzania zasad gry
+        (obiekty pionków oraz maski bitowe) w losowych rozgrywkach.
+        """
+
+        self.__printTestHeader (
+            "test_BackendsAgree",
+            self.test_BackendsAgree.__doc__
+        )
+
+        rng = random.Random(2021)
+
+        darkSquares = [
+            (x, y)
+            for y in range(Checkers.BOARD_SIZE)
+            for x in range(Checkers.BOARD_SIZE)
+            if (x & 1) ^ (y & 1)
+        ]
+
+        for _ in range(20):
+            games = [
+                Checkers(Checkers.BACKEND_OBJECTS),
+                Checkers(Checkers.BACKEND_BITBOARDS)
+            ]
+            for game in games:
+                game.newGame()
+
+            x, y = 0, 0
+            for _ in range(600):
+                state, _, player = games[0].getGameState()
+                if Checkers.GAMESTATE_END == state:
+                    break
+
+                # Najczęściej wybierane są pionki gracza w danej turze,
+                # aby rozgrywka posuwała się do przodu.
+                board = games[0].getTextBoard()
+                icon = Checkers.PLAYER_ICONS[player]
+                own = [
+                    (x, y) for (x, y) in darkSquares
+                    if board[y][x].startswith(icon)
+                ]
+                # Po podniesieniu pionka wybierane są wolne pola na jego
+                # przekątnych (przeważnie najbliższe).
+                if (Checkers.GAMESTATE_TAKE == state) and own:
+                    x, y = rng.choice(own)
+                else:
+                    reach = 2 if (rng.random() < 0.7) else 7
+                    diagonal = [
+                        (dx, dy) for (dx, dy) in darkSquares
+                        if (0 < abs(dx - x) == abs(dy - y) <= reach)
+                        and not board[dy][dx]
+                    ]
+                    if diagonal:
+                        x, y = rng.choice(diagonal)
+
+                results = [game.processInput(x, y) for game in games]
+
+                self.assertEqual(results[0], results[1])
+                self.assertEqual (
+                    games[0].getTextBoard(), games[1].getTextBoard()
+                )
+                self.assertEqual (
+                    games[0].getGameState(), games[1].getGameState()
+                )
+                self.assertEqual (
+                    games[0].getBitboards(), games[1].getBitboards()
+                )
+
+        self.__printTestFooter()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_GenerateMoves(self) -> None:
+        """
+        Testowanie generowania pełnych ruchów (z sekwencjami bić).
+        """
+
+        self.__printTestHeader (
+            "test_GenerateMoves",
+            self.test_GenerateMoves.__doc__
+        )
+
+        self.__checkers.newGame()
+        moves = self.__checkers.generateMoves()
+        self.assertEqual(len(moves), 7)
+        for move in moves:
+            self.assertEqual(len(move.path), 1)
+            self.assertEqual(move.captured, ())
+
+        self.__checkers.setTextBoard(multilineBoardTextToList (
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ B _ B _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ B _ _ _ B _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ B _ B _ B _ _ \n"
+            " C _ _ _ _ _ _ _ \n"
+        ))
+        self.__checkers.setCurrentPlayer(0)
+
+        # Pętla bić może zostać obiegnięta w obu kierunkach.
+        moves = self.__checkers.generateMoves()
+        self.assertEqual (
+            {m.path for m in moves},
+            {
+                ((2, 5), (4, 7), (6, 5), (4, 3), (2, 1), (0, 3)),
+                ((2, 5), (0, 3), (2, 1), (4, 3), (6, 5), (4, 7))
+            }
+        )
+        for move in moves:
+            self.assertEqual(move.start, (0, 7))
+            steps = ((move.start,) + move.path[:-1], move.path)
+            self.assertEqual (
+                move.captured,
+                tuple(
+                    ((x0 + x1) // 2, (y0 + y1) // 2)
+                    for (x0, y0), (x1, y1) in zip(*steps)
+                )
+            )
+
+        # Porównanie z ruchami wyszukanymi poprzez wskazywanie pól
+        # w pozycjach z losowych rozgrywek.
+
+        rng = random.Random(7)
+
+        for _ in range(3):
+            self.__checkers.newGame()
+
+            for turn in range(80):
+                moves = self.__checkers.generateMoves()
+                if not moves:
+                    break
+
+                if 0 == (turn % 8):
+                    self.assertEqual (
+                        {(m.start, m.path) for m in moves},
+                        clickedMoves(self.__checkers)
+                    )
+
+                move = rng.choice(moves)
+                board = self.__checkers.getTextBoard()
+
+                for x, y in move.getClicks():
+                    self.assertTrue(self.__checkers.processInput(x, y))
+
+                after = self.__checkers.getTextBoard()
+                for x, y in move.captured:
+                    self.assertTrue(board[y][x])
+                    self.assertFalse(after[y][x])
+
+        self.__printTestFooter()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_MakeUnmakeMove(self) -> None:
+        """
+        Testowanie wykonywania i cofania pełnych ruchów.
+        """
+
+        self.__printTestHeader (
+            "test_MakeUnmakeMove",
+            self.test_MakeUnmakeMove.__doc__
+        )
+
+        rng = random.Random(5)
+
+        for game in range(4):
+            self.__checkers.newGame()
+            self.assertIsNone(self.__checkers.unmakeMove())
+
+            history = []
+
+            for turn in range(120):
+                moves = self.__checkers.generateMoves()
+                if not moves:
+                    break
+
+                history.append ((
+                    self.__checkers.getTextBoard(),
+                    self.__checkers.getGameState(),
+                    moves
+                ))
+
+                # Co drugi ruch wykonywany jest poprzez wskazywanie pól.
+                move = rng.choice(moves)
+                if turn & 1:
+                    self.__checkers.makeMove(move)
+                else:
+                    for x, y in move.getClicks():
+                        self.__checkers.processInput(x, y)
+
+            for turn in range(len(history) - 1, (-1), (-1)):
+                board, state, moves = history[turn]
+
+                self.assertIsNotNone(self.__checkers.unmakeMove())
+                self.assertEqual(self.__checkers.getTextBoard(), board)
+                self.assertEqual(self.__checkers.getGameState(), state)
+                self.assertEqual(self.__checkers.generateMoves(), moves)
+
+                # Obowiązkowe bicia również muszą zostać przywrócone.
+                if 0 == (turn % 20):
+                    self.assertEqual (
+                        {(m.start, m.path) for m in moves},
+                        clickedMoves(self.__checkers)
+                    )
+
+                # Gra po cofnięciu ruchów: śledzone bicia i liczba pionków
+                # muszą zgadzać się z planszą odczytaną od nowa.
+                if (0 == (turn % 15)) and moves:
+                    self.__checkers.makeMove(rng.choice(moves))
+
+                    fresh = Checkers()
+                    fresh.setFen(self.__checkers.getFen())
+                    self.assertEqual (
+                        self.__checkers.generateMoves(),
+                        fresh.generateMoves()
+                    )
+                    self.assertEqual (
+                        self.__checkers.getGameState()[0],
+                        fresh.getGameState()[0]
+                    )
+
+                    self.assertIsNotNone(self.__checkers.unmakeMove())
+
+            self.assertIsNone(self.__checkers.unmakeMove())
+
+        self.__printTestFooter()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_PositionHash(self) -> None:
+        """
+        Testowanie przyrostowej aktualizacji hasza pozycji.
+        """
+
+        self.__printTestHeader (
+            "test_PositionHash",
+            self.test_PositionHash.__doc__
+        )
+
+        rng = random.Random(3)
+        fresh = Checkers(self.BACKEND)
+        seen = {}
+
+        for game in range(4):
+            self.__checkers.newGame()
+            hashes = []
+
+            for turn in range(120):
+                h = self.__checkers.getPositionHash()
+                board = self.__checkers.getTextBoard()
+                _, _, player = self.__checkers.getGameState()
+
+                # Hasz zależy wyłącznie od pozycji i strony grającej.
+                fresh.setTextBoard(board)
+                fresh.setCurrentPlayer(player)
+                self.assertEqual(fresh.getPositionHash(), h)
+
+                key = (str(board), player)
+                self.assertEqual(seen.setdefault(h, key), key)
+
+                moves = self.__checkers.generateMoves()
+                if not moves:
+                    break
+
+                hashes.append(h)
+
+                move = rng.choice(moves)
+                if turn & 1:
+                    self.__checkers.makeMove(move)
+                else:
+                    for x, y in move.getClicks():
+                        self.__checkers.processInput(x, y)
+
+            while hashes:
+                self.__checkers.unmakeMove()
+                self.assertEqual (
+                    self.__checkers.getPositionHash(), hashes.pop()
+                )
+
+        self.__printTestFooter()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_SharedPawns(self) -> None:
+        """
+        Testowanie współdzielonych (niezmiennych) pionków
+        oraz stanu pionków przechowywanego przez planszę.
+        """
+
+        self.__printTestHeader (
+            "test_SharedPawns",
+            self.test_SharedPawns.__doc__
+        )
+
+        self.assertIs(WeakPawn(0), WeakPawn(0))
+        self.assertIsNot(WeakPawn(0), WeakPawn(1))
+        self.assertIsNot(WeakPawn(1), StrongPawn(1))
+        self.assertIs(copy.deepcopy(StrongPawn(1)), StrongPawn(1))
+        self.assertFalse(hasattr(WeakPawn(0), '__dict__'))
+
+        with self.assertRaises(AttributeError):
+            WeakPawn(0)._player = 1
+
+        self.__checkers.newGame()
+        self.__checkers.setTextBoard(multilineBoardTextToList (
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ B _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ B _ B _ _ _ _ \n"
+            " C _ _ _ _ _ _ _ \n"
+        ))
+
+        state = self.__checkers.getPawnState
+        self.__checkers.processInput(0, 7)
+        self.__checkers.processInput(2, 5)
+
+        self.assertEqual(state(0, 7), AbstractPawn.STATE_SELECTED)
+        self.assertEqual(state(1, 6), AbstractPawn.STATE_GONE)
+        self.assertEqual(state(2, 5), AbstractPawn.STATE_MARKED)
+        self.assertEqual(state(1, 4), AbstractPawn.STATE_STANDBY)
+        self.assertEqual(state(3, 6), AbstractPawn.STATE_STANDBY)
+        self.assertIsNone(state(4, 5))
+
+        # Anulowanie bicia przywraca stan wszystkich pionków.
+        self.__checkers.processInput(0, 7)
+
+        self.assertEqual(state(0, 7), AbstractPawn.STATE_STANDBY)
+        self.assertEqual(state(1, 6), AbstractPawn.STATE_STANDBY)
+        self.assertIsNone(state(2, 5))
+
+        self.__printTestFooter()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_Snapshot(self) -> None:
+        """
+        Testowanie zapisu i odtwarzania pozycji, również w trakcie
+        wielokrotnego bicia.
+        """
+
+        self.__printTestHeader (
+            "test_Snapshot",
+            self.test_Snapshot.__doc__
+        )
+
+        self.__checkers.newGame()
+        self.__checkers.setTextBoard(multilineBoardTextToList (
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ B _ B _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ B _ _ _ B _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ B _ B _ B _ _ \n"
+            " C _ _ _ _ _ _ _ \n"
+        ))
+
+        for x, y in ((0, 7), (2, 5), (4, 7)):
+            self.__checkers.processInput(x, y)
+
+        snapshot = self.__checkers.snapshot()
+
+        self.assertEqual(pickle.loads(pickle.dumps(snapshot)), snapshot)
+        self.assertEqual(hash(copy.copy(snapshot)), hash(snapshot))
+
+        other = Checkers(self.BACKEND)
+        other.restore(snapshot)
+
+        self.assertEqual(other.snapshot(), snapshot)
+        self.assertEqual(other.getTextBoard(), self.__checkers.getTextBoard())
+        self.assertEqual(other.getGameState(), self.__checkers.getGameState())
+        self.assertEqual (
+            other.getPositionHash(), self.__checkers.getPositionHash()
+        )
+
+        # Dokończenie bicia na obu planszach.
+        for x, y in ((6, 5), (4, 3), (2, 1), (0, 3)):
+            self.__checkers.processInput(x, y)
+            other.processInput(x, y)
+            self.assertEqual (
+                other.getTextBoard(), self.__checkers.getTextBoard()
+            )
+
+        self.assertEqual(other.snapshot(), self.__checkers.snapshot())
+        self.assertEqual(Checkers.GAMESTATE_TAKE, other.getGameState()[0])
+
+        self.__printTestFooter()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_ChangedSquares(self) -> None:
+        """
+        Testowanie listy pól zmienionych przez ostatnie wskazanie pola:
+        lista musi zawierać dokładnie pola o zmienionym tekście.
+        """
+
+        self.__printTestHeader (
+            "test_ChangedSquares",
+            self.test_ChangedSquares.__doc__
+        )
+
+        rng = random.Random(5)
+
+        for _ in range(3):
+            self.__checkers.newGame()
+
+            for _ in range(60):
+                moves = self.__checkers.generateMoves()
+                if not moves:
+                    break
+
+                # Pojedyncze kliknięcia, również niepoprawne.
+                clicks = list(rng.choice(moves).getClicks())
+                if rng.random() < 0.2:
+                    clicks.insert(1, (rng.randrange(8), rng.randrange(8)))
+
+                for x, y in clicks:
+                    before = self.__checkers.getTextBoard()
+                    self.__checkers.processInput(x, y)
+                    after = self.__checkers.getTextBoard()
+
+                    self.assertEqual (
+                        self.__checkers.getChangedSquares(),
+                        [
+                            (cx, cy)
+                            for cy in range(8) for cx in range(8)
+                            if before[cy][cx] != after[cy][cx]
+                        ]
+                    )
+
+                if Checkers.GAMESTATE_PUT == \
+                self.__checkers.getGameState()[0]:
+                    self.__checkers.processInput(*clicks[0])
+
+        self.__printTestFooter()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_Events(self) -> None:
+        """
+        Testowanie zdarzeń gry: plansza odtwarzana wyłącznie
+        ze zmienionych pól musi być zgodna z `getTextBoard`.
+        """
+
+        self.__printTestHeader (
+            "test_Events",
+            self.test_Events.__doc__
+        )
+
+        checkers = self.__checkers
+        mirror = [[''] * 8 for _ in range(8)]
+        events = []
+
+        def apply(event: CheckersEvent) -> None:
+            events.append(event)
+            squares = event.squares
+            if CheckersEvent.EVENT_RESET == event.kind:
+                squares = [(x, y) for y in range(8) for x in range(8)]
+            for x, y in squares:
+                mirror[y][x] = checkers.getTextSquare(x, y)
+
+        checkers.subscribe(apply)
+
+        rng = random.Random(9)
+
+        for _ in range(3):
+            checkers.newGame()
+            self.assertEqual(CheckersEvent.EVENT_RESET, events[-1].kind)
+
+            for _ in range(80):
+                moves = checkers.generateMoves()
+                if (not moves) or (Checkers.GAMESTATE_END == \
+                checkers.getGameState()[0]):
+                    break
+
+                # Pojedyncze kliknięcia, również niepoprawne.
+                clicks = list(rng.choice(moves).getClicks())
+                if rng.random() < 0.2:
+                    clicks.insert(1, (rng.randrange(8), rng.randrange(8)))
+
+                for x, y in clicks:
+                    checkers.processInput(x, y)
+                    self.assertEqual(mirror, checkers.getTextBoard())
+
+                if Checkers.GAMESTATE_PUT == checkers.getGameState()[0]:
+                    checkers.processInput(*clicks[0])
+
+                # Ruch wykonany i cofnięty bez wskazywania pól
+                if rng.random() < 0.2:
+                    moves = checkers.generateMoves()
+                    if moves:
+                        checkers.makeMove(rng.choice(moves))
+                        self.assertEqual(mirror, checkers.getTextBoard())
+                        checkers.unmakeMove()
+                        self.assertEqual(mirror, checkers.getTextBoard())
+
+        kinds = set(e.kind for e in events)
+        for kind in (CheckersEvent.EVENT_SELECTED, CheckersEvent.EVENT_MOVED,
+        CheckersEvent.EVENT_CAPTURED, CheckersEvent.EVENT_TURN,
+        CheckersEvent.EVENT_UNDONE, CheckersEvent.EVENT_INFO):
+            self.assertIn(kind, kinds)
+
+        # Awans na damkę i koniec gry
+        checkers.newGame()
+        checkers.setTextBoard(multilineBoardTextToList (
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ B _ _ _ _ _ \n"
+            " _ C _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+        ))
+        checkers.setCurrentPlayer(0)
+        events.clear()
+
+        checkers.processInput(1, 2)
+        checkers.processInput(3, 0)
+        self.assertEqual(mirror, checkers.getTextBoard())
+
+        self.assertEqual (
+            [e.kind for e in events], [
+                CheckersEvent.EVENT_SELECTED, CheckersEvent.EVENT_MOVED,
+                CheckersEvent.EVENT_CAPTURED, CheckersEvent.EVENT_PROMOTED,
+                CheckersEvent.EVENT_TURN, CheckersEvent.EVENT_GAME_OVER
+            ]
+        )
+        self.assertEqual(events[2].squares, ((2, 1),))
+        self.assertEqual(events[-1].player, 0)
+
+        checkers.unsubscribe(apply)
+        events.clear()
+        checkers.newGame()
+        self.assertEqual(events, [])
+
+        self.__printTestFooter()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_Versions(self) -> None:
+        """
+        Testowanie liczników zmian: zapamiętany tekst planszy
+        i komunikatu musi odpowiadać aktualnemu stanowi gry.
+        """
+
+        self.__printTestHeader (
+            "test_Versions",
+            self.test_Versions.__doc__
+        )
+
+        checkers = self.__checkers
+        checkers.newGame()
+
+        # Wskazanie pionka przeciwnika zmienia tylko komunikat.
+        version = checkers.getVersion()
+        boardVersion = checkers.getBoardVersion()
+        board = checkers.getTextBoard()
+        message = checkers.getTextState()
+
+        checkers.processInput(1, 0)
+
+        self.assertGreater(checkers.getVersion(), version)
+        self.assertEqual(checkers.getBoardVersion(), boardVersion)
+        self.assertEqual(checkers.getTextBoard(), board)
+        self.assertNotEqual(checkers.getTextState(), message)
+
+        # Zwracana plansza jest kopią zapamiętanego tekstu.
+        board[0][1] = 'X'
+        self.assertNotEqual(checkers.getTextBoard(), board)
+        self.assertIs(checkers.getTextState(), checkers.getTextState())
+
+        rng = random.Random(11)
+
+        for _ in range(100):
+            moves = checkers.generateMoves()
+            if (not moves) or (Checkers.GAMESTATE_END == \
+            checkers.getGameState()[0]):
+                break
+
+            clicks = list(rng.choice(moves).getClicks())
+            if rng.random() < 0.3:
+                clicks.insert(1, (rng.randrange(8), rng.randrange(8)))
+
+            for x, y in clicks:
+                version = checkers.getVersion()
+                checkers.processInput(x, y)
+
+                self.assertGreaterEqual(checkers.getVersion(), version)
+                self.assertEqual (
+                    checkers.getTextBoard(), [
+                        [checkers.getTextSquare(cx, cy) for cx in range(8)]
+                        for cy in range(8)
+                    ]
+                )
+
+            if Checkers.GAMESTATE_PUT == checkers.getGameState()[0]:
+                checkers.processInput(*clicks[0])
+
+        # Cofnięcie ruchu zmienia planszę.
+        boardVersion = checkers.getBoardVersion()
+        board = checkers.getTextBoard()
+        if checkers.unmakeMove() is not None:
+            self.assertGreater(checkers.getBoardVersion(), boardVersion)
+            self.assertNotEqual(checkers.getTextBoard(), board)
+
+        self.__printTestFooter()
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class test_CheckersBitboards(test_Checkers):
+    """
+    Testy jednostkowe gry "Warcaby" (zasady sprawdzane maskami bitowymi)
+    """
+
+    BACKEND = Checkers.BACKEND_BITBOARDS
+
+
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
 def runTests() -> None:
     unittest.main()
@@ -0,0 +1,168 @@
+################################################################
+# Warcaby: "/src/test_ComputerPlayer.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import unittest
+
+from Checkers import Checkers
+from ComputerPlayer import ComputerPlayer
+from ParallelComputerPlayer import ParallelComputerPlayer
+from test_Checkers import multilineBoardTextToList
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class test_ComputerPlayer(unittest.TestCase):
+    """
+    Testy jednostkowe komputerowego przeciwnika w grze "Warcaby"
+    """
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_SearchKeepsGameUntouched(self) -> None:
+        """
+        Przeszukiwanie nie może zmienić stanu rozgrywanej gry,
+        a limit węzłów musi być przestrzegany.
+        """
+
+        checkers = Checkers()
+        checkers.newGame()
+
+        board = checkers.getTextBoard()
+        state = checkers.getGameState()
+        h = checkers.getPositionHash()
+
+        computer = ComputerPlayer(0, maxNodes = 500)
+        move = computer.chooseMove(checkers)
+
+        self.assertIn(move, checkers.generateMoves())
+        self.assertLessEqual(computer.getSearchInfo()['nodes'], 500)
+
+        self.assertEqual(checkers.getTextBoard(), board)
+        self.assertEqual(checkers.getGameState(), state)
+        self.assertEqual(checkers.getPositionHash(), h)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_FindsWinningMove(self) -> None:
+        """
+        Komputer wybiera ruch wygrywający grę w dwóch turach
+        (zamiast ruchu oddającego pionka).
+        """
+
+        checkers = Checkers()
+        checkers.newGame()
+        checkers.setTextBoard(multilineBoardTextToList (
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ B _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ C _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+        ))
+        checkers.setCurrentPlayer(1)
+
+        # Po ruchu BIAŁEGO pionka na (5, 4) każdy ruch CZARNEGO
+        # pionka kończy się jego zbiciem (ruch na (3, 4) nie wygrywa
+        # po odpowiedzi na (6, 5)).
+        computer = ComputerPlayer(1, maxDepth = 6)
+
+        self.assertTrue(computer.playTurn(checkers))
+        self.assertEqual(checkers.getTextBoard()[4][5], 'B')
+        self.assertGreater (
+            computer.getSearchInfo()['score'],
+            ComputerPlayer.SCORE_WIN - 1000
+        )
+
+        # Każda odpowiedź CZARNYCH przegrywa w następnym ruchu.
+        reply = checkers.generateMoves()[0]
+        checkers.makeMove(reply)
+        self.assertTrue(computer.playTurn(checkers))
+        self.assertEqual (
+            checkers.getGameState(),
+            (Checkers.GAMESTATE_END, Checkers.TURNINFO_NOTHING, 1)
+        )
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_ParallelSearch(self) -> None:
+        """
+        Przeszukiwanie na wielu procesach wybiera ten sam
+        wygrywający ruch co przeszukiwanie w jednym procesie.
+        """
+
+        checkers = Checkers()
+        checkers.newGame()
+        checkers.setTextBoard(multilineBoardTextToList (
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ B _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ C _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+        ))
+        checkers.setCurrentPlayer(1)
+
+        with ParallelComputerPlayer(1, workers = 2, maxDepth = 6) as computer:
+            move = computer.chooseMove(checkers)
+
+        self.assertEqual(move.path, ((5, 4),))
+        self.assertGreater (
+            computer.getSearchInfo()['score'],
+            ComputerPlayer.SCORE_WIN - 1000
+        )
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_ParallelSearchBudget(self) -> None:
+        """
+        Przy bardzo małym limicie węzłów ruchy niesprawdzone są pomijane,
+        nawet jeśli jedyny sprawdzony ruch ma ujemną ocenę.
+        """
+
+        checkers = Checkers()
+        checkers.newGame()
+        checkers.setTextBoard(multilineBoardTextToList (
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ B _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ C _ _ \n"
+            " C _ C _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ C \n"
+            " _ _ _ _ _ _ _ _ \n"
+        ))
+        checkers.setCurrentPlayer(1)
+
+        # Po 3 węzły na ruch: tylko ruch pod bicie (jedyna odpowiedź
+        # przeciwnika) zostaje sprawdzony.
+        with ParallelComputerPlayer(1, workers = 2, maxNodes = 6) as computer:
+            move = computer.chooseMove(checkers)
+
+        info = computer.getSearchInfo()
+        self.assertEqual(move.path, ((4, 3),))
+        self.assertGreater(info['depth'], 0)
+        self.assertLess(info['score'], 0)
+
+        # Żaden ruch nie został sprawdzony: pierwszy uporządkowany.
+        checkers.newGame()
+        with ParallelComputerPlayer(0, workers = 2, maxNodes = 1) as computer:
+            move = computer.chooseMove(checkers)
+
+        self.assertEqual (
+            move, computer.orderMoves(checkers.generateMoves(), None, 0)[0]
+        )
+        self.assertEqual(computer.getSearchInfo()['depth'], 0)
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    unittest.main()
+
+
+################################################################
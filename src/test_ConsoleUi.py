@@ -0,0 +1,119 @@
+################################################################
+# Warcaby: "/src/test_ConsoleUi.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import io
+import unittest
+
+from Checkers import Checkers
+from ConsoleUi import ConsoleUi
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class CountingOutput(io.StringIO):
+    """
+    Strumień tekstowy zliczający wywołania `write`.
+    """
+
+    writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class test_ConsoleUi(unittest.TestCase):
+    """
+    Testy konsolowego interfejsu do gry "Warcaby"
+    """
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_SingleWrite(self) -> None:
+        """
+        Cała klatka wypisywana jest jednym wywołaniem.
+        """
+
+        checkers = Checkers()
+        checkers.newGame()
+        output = CountingOutput()
+        ui = ConsoleUi(checkers, output = output)
+
+        ui.updateBoard()
+        ui.drawBoard()
+
+        self.assertEqual(output.writes, 1)
+        self.assertEqual(output.getvalue(), '\n'.join(ui.renderFrame()) + '\n')
+        self.assertEqual(len(ui.renderFrame()), 6 + Checkers.BOARD_SIZE)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_AnsiRedraw(self) -> None:
+        """
+        W trybie ANSI po ruchu wysyłane są tylko zmienione pola
+        i komunikat.
+        """
+
+        checkers = Checkers()
+        checkers.newGame()
+        output = CountingOutput()
+        ui = ConsoleUi(checkers, output = output, ansi = True)
+
+        ui.updateBoard()
+        ui.drawBoard()
+        self.assertTrue(output.getvalue().startswith(ui.ANSI_CLEAR_SCREEN))
+
+        checkers.processInput(0, 5)
+        checkers.processInput(1, 4)
+
+        output.seek(0)
+        output.truncate()
+        ui.updateBoard()
+        ui.drawBoard()
+        text = output.getvalue()
+
+        self.assertEqual(output.writes, 2)
+        self.assertNotIn(ui.ANSI_CLEAR_SCREEN, text)
+        self.assertIn(' C  ', text)
+        self.assertIn('BIAŁE', text)
+        self.assertLess(len(text), 100)
+
+        # Bez zmian wysyłane jest jedynie przesunięcie kursora.
+        output.seek(0)
+        output.truncate()
+        ui.drawBoard()
+
+        self.assertEqual (
+            output.getvalue(),
+            f'\x1b[{len(ui.renderFrame()) + 1};1H' + ui.ANSI_CLEAR_BELOW
+        )
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_Close(self) -> None:
+        """
+        Zamknięty interfejs nie odbiera już zdarzeń gry.
+        """
+
+        checkers = Checkers()
+        checkers.newGame()
+        ui = ConsoleUi(checkers, output = CountingOutput())
+        ui.takeDirtySquares()
+
+        checkers.processInput(0, 5)
+        self.assertEqual(ui.takeDirtySquares(), [(0, 5)])
+
+        ui.enable(False)
+        checkers.processInput(1, 4)
+        self.assertEqual(ui.takeDirtySquares(), [])
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    unittest.main()
+
+
+################################################################
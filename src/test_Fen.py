@@ -0,0 +1,178 @@
+################################################################
+# Warcaby: "/src/test_Fen.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import io
+import random
+import unittest
+
+from Checkers import Checkers
+from Fen import Fen
+from Pdn import Pdn, PdnGame
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class test_Fen(unittest.TestCase):
+    """
+    Testy zapisu pozycji w formacie FEN w grze "Warcaby"
+    """
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_NewGame(self) -> None:
+        """
+        Zapis pozycji początkowej.
+        """
+
+        checkers = Checkers()
+        checkers.newGame()
+
+        self.assertEqual (
+            checkers.getFen(),
+            'B:W' + ','.join(str(n) for n in range(1, 13))
+            + ':B' + ','.join(str(n) for n in range(21, 33))
+        )
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_RoundTrip(self) -> None:
+        """
+        Pozycje z losowych gier odtworzone z zapisu FEN są identyczne
+        (pionki, gracz, hasz, dozwolone ruchy).
+        """
+
+        rng = random.Random(4)
+        checkers = Checkers(Checkers.BACKEND_BITBOARDS)
+        other = Checkers()
+        kings = 0
+
+        for _ in range(10):
+            checkers.newGame()
+            for _ in range(rng.randrange(120)):
+                moves = checkers.generateMoves()
+                if (not moves) or (Checkers.GAMESTATE_END == \
+                checkers.getGameState()[0]):
+                    break
+                checkers.makeMove(rng.choice(moves))
+
+            fen = checkers.getFen()
+            kings += fen.count(Fen.KING)
+
+            other.setFen(fen)
+            self.assertEqual(other.getFen(), fen)
+            self.assertEqual(other.getBitboards(), checkers.getBitboards())
+            self.assertEqual(other.getGameState(), checkers.getGameState())
+            self.assertEqual (
+                other.getPositionHash(), checkers.getPositionHash()
+            )
+            self.assertEqual (
+                sorted(other.generateMoves()), sorted(checkers.generateMoves())
+            )
+
+        self.assertGreater(kings, 0)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_Parse(self) -> None:
+        """
+        Odczyt damek, pustego koloru i obowiązkowego bicia,
+        a także zgłaszanie niepoprawnych zapisów.
+        """
+
+        checkers = Checkers()
+        checkers.newGame()
+        checkers.setFen('W:WK14,18:B23')
+
+        board = checkers.getTextBoard()
+        self.assertEqual(board[3][2], 'Bd')
+        self.assertEqual(board[4][3], 'B')
+        self.assertEqual(board[5][4], 'C')
+
+        # Biały pionek musi bić (18x27).
+        state, _, player = checkers.getGameState()
+        self.assertEqual((state, player), (Checkers.GAMESTATE_TAKE, 1))
+        checkers.processInput(2, 3)
+        self.assertEqual (
+            checkers.getGameState()[1], Checkers.TURNINFO_OBLIG_FIGHT
+        )
+
+        self.assertEqual(Fen.parse('B:W:B5'), ((1 << 4, 0, 0, 0), 0))
+        self.assertEqual(Fen.parse('B:WK29:BK1'), ((0, 0, 1, 1 << 28), 0))
+
+        # Pionki w rzędzie awansu (gracz 0: pola 1-4, gracz 1: 29-32)
+        # są niepoprawne, damki już nie.
+        for text in ('', 'B:W1', 'X:W1:B2', 'B:W1:W2', 'B:W1:B1',
+        'B:W33:B1', 'B:W1,:B2', 'B:WKK1:B2', 'B:W5:B4', 'W:W29:B5'):
+            with self.assertRaises(ValueError):
+                Fen.parse(text)
+
+        # Plansza pozostaje bez zmian po niepoprawnym zapisie.
+        fen = checkers.getFen()
+        with self.assertRaises(ValueError):
+            checkers.setFen('B:W1')
+        self.assertEqual(checkers.getFen(), fen)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_Load(self) -> None:
+        """
+        Odczyt wielu pozycji: niepoprawne wiersze są zgłaszane,
+        ale nie przerywają odczytu.
+        """
+
+        lines = io.StringIO (
+            '# pozycje testowe\n'
+            'B:W1,2:B31,K32\n'
+            '\n'
+            'W:W5:B\n'
+            'B:W1:B1\n'
+            'W:WK9:B13  # komentarz\n'
+            'nie fen\n'
+        )
+
+        errors = []
+        positions = list(Fen.load(lines, errors))
+
+        self.assertEqual (
+            positions, [
+                ((1 << 30, 0b11, 1 << 31, 0), 0),
+                ((0, 1 << 4, 0, 0), 1),
+                ((1 << 12, 0, 0, 1 << 8), 1),
+            ]
+        )
+        self.assertEqual([n for n, _ in errors], [5, 7])
+
+        # Lista błędów jest ograniczona, ale licznik obejmuje wszystkie
+        # (także pionek w rzędzie awansu).
+        errors, stats = [], {}
+        lines = ['x\n'] * (Fen.MAX_ERRORS + 5) + ['B:W1:B5\n', 'W:W32:B5\n']
+        self.assertEqual (
+            len(list(Fen.load(lines, errors, stats = stats))), 1
+        )
+        self.assertEqual(len(errors), Fen.MAX_ERRORS)
+        self.assertEqual(stats, {'valid': 1, 'invalid': Fen.MAX_ERRORS + 6})
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_PdnSetup(self) -> None:
+        """
+        Gra w formacie PDN rozpoczęta od pozycji ze znacznika `FEN`.
+        """
+
+        game = PdnGame (
+            {'FEN': 'W:W18:B23'}, ['18x27'], Pdn.RESULT_SECOND_WINS
+        )
+        stats = Pdn.replay([game, game._replace(result = Pdn.RESULT_DRAW)])
+
+        self.assertEqual(stats['valid'], 1)
+        self.assertEqual([n for n, _ in stats['errors']], [2])
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    unittest.main()
+
+
+################################################################
@@ -0,0 +1,209 @@
+################################################################
+# Warcaby: "/src/test_GameServer.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import asyncio
+import json
+import unittest
+
+from Checkers import Checkers
+from GameServer import GameServer
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class test_GameServer(unittest.IsolatedAsyncioTestCase):
+    """
+    Testy serwera gier "Warcaby" (połączenia lokalne)
+    """
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    async def __connect(self, address: tuple) -> tuple:
+        """
+        Połączenie klienta z serwerem.
+        """
+
+        reader, writer = await asyncio.open_connection(*address)
+        self.addAsyncCleanup(self.__disconnect, writer)
+        return reader, writer
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @staticmethod
+    async def __disconnect(writer: asyncio.StreamWriter) -> None:
+        """
+        Rozłączenie klienta.
+        """
+
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @staticmethod
+    async def __request(client: tuple, request: dict) -> dict:
+        """
+        Wysłanie polecenia i odczyt jednej odpowiedzi.
+        """
+
+        reader, writer = client
+        writer.write(json.dumps(request).encode('utf-8') + b'\n')
+        await writer.drain()
+        return await test_GameServer.__receive(client)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @staticmethod
+    async def __receive(client: tuple) -> dict:
+        """
+        Odczyt jednej wiadomości od serwera.
+        """
+
+        line = await asyncio.wait_for(client[0].readline(), 5)
+        return json.loads(line) if line else None
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    async def test_Session(self) -> None:
+        """
+        Ruch jednego klienta trafia do wszystkich klientów gry.
+        """
+
+        server = GameServer(port = 0)
+        address = await server.start()
+        self.addAsyncCleanup(server.close)
+
+        first = await self.__connect(address)
+        second = await self.__connect(address)
+
+        state = await self.__request(first, {'cmd': 'new'})
+        self.assertEqual(state['type'], 'state')
+        self.assertEqual(len(state['squares']), 32)
+        self.assertEqual(state['player'], 0)
+
+        joined = await self.__request (
+            second, {'cmd': 'join', 'session': state['session']}
+        )
+        self.assertEqual(joined['squares'], state['squares'])
+
+        # Wskazanie pionka, a następnie pola docelowego
+        for x, y in ((0, 5), (1, 4)):
+            update = await self.__request (
+                first, {'cmd': 'input', 'x': x, 'y': y}
+            )
+            self.assertEqual(update, await self.__receive(second))
+
+        self.assertEqual(update['type'], 'update')
+        self.assertEqual(update['player'], 1)
+        self.assertEqual (
+            sorted(map(tuple, update['squares'])),
+            [(0, 5, ''), (1, 4, Checkers.PLAYER_ICONS[0])]
+        )
+
+        # Błędy nie przerywają połączenia.
+        self.assertEqual (
+            (await self.__request(second, {'cmd': 'input', 'x': 9}))['type'],
+            'error'
+        )
+        for sessionId in (-1, [1], {}, None):
+            self.assertEqual (
+                (await self.__request (
+                    second, {'cmd': 'join', 'session': sessionId}
+                ))['type'],
+                'error'
+            )
+        first[1].write(b'{nie json\n')
+        self.assertEqual((await self.__receive(first))['type'], 'error')
+
+        self.assertEqual(server.getSessionCount(), 1)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    async def test_IdleSession(self) -> None:
+        """
+        Gra bez aktywności jest usuwana, a klient rozłączany.
+        """
+
+        server = GameServer(port = 0, idleTimeout = 0.2, reapInterval = 0.05)
+        address = await server.start()
+        self.addAsyncCleanup(server.close)
+
+        client = await self.__connect(address)
+        await self.__request(client, {'cmd': 'new'})
+        self.assertEqual(server.getSessionCount(), 1)
+
+        self.assertEqual((await self.__receive(client))['type'], 'timeout')
+        self.assertIsNone(await self.__receive(client))
+        self.assertEqual(server.getSessionCount(), 0)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    async def test_Watcher(self) -> None:
+        """
+        Klient oglądający trwającą grę nie jest rozłączany,
+        choć sam nic nie wysyła.
+        """
+
+        server = GameServer(port = 0, idleTimeout = 0.2, reapInterval = 0.05)
+        address = await server.start()
+        self.addAsyncCleanup(server.close)
+
+        player = await self.__connect(address)
+        watcher = await self.__connect(address)
+
+        state = await self.__request(player, {'cmd': 'new'})
+        await self.__request (
+            watcher, {'cmd': 'join', 'session': state['session']}
+        )
+
+        # Gracz jest aktywny dłużej niż `idleTimeout`.
+        for _ in range(6):
+            await asyncio.sleep(0.1)
+            await self.__request(player, {'cmd': 'state'})
+
+        update = await self.__request(player, {'cmd': 'input', 'x': 0, 'y': 5})
+        self.assertEqual(update, await self.__receive(watcher))
+        self.assertEqual(server.getSessionCount(), 1)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    async def test_SlowWatcher(self) -> None:
+        """
+        Klient oglądający grę, którego bufor przekroczył limit,
+        jest rozłączany, a gracz może grać dalej.
+        """
+
+        # Ujemny limit: każdy bufor oglądającego jest za duży.
+        server = GameServer(port = 0, writeBufferLimit = -1)
+        address = await server.start()
+        self.addAsyncCleanup(server.close)
+
+        player = await self.__connect(address)
+        watcher = await self.__connect(address)
+
+        state = await self.__request(player, {'cmd': 'new'})
+        await self.__request (
+            watcher, {'cmd': 'join', 'session': state['session']}
+        )
+
+        for cmd in ('reset', 'state'):
+            self.assertEqual (
+                (await self.__request(player, {'cmd': cmd}))['type'], 'state'
+            )
+
+        # Ostatnia wysłana wiadomość, a następnie rozłączenie.
+        self.assertEqual((await self.__receive(watcher))['type'], 'state')
+        self.assertIsNone(await self.__receive(watcher))
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    unittest.main()
+
+
+################################################################
@@ -0,0 +1,119 @@
+################################################################
+# Warcaby: "/src/test_OpeningBook.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import os
+import random
+import tempfile
+import unittest
+
+from Checkers import Checkers
+from ComputerPlayer import ComputerPlayer
+from OpeningBook import OpeningBook
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class test_OpeningBook(unittest.TestCase):
+    """
+    Testy księgi otwarć w grze "Warcaby"
+    """
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def setUp(self) -> None:
+        """
+        Katalog na pliki księgi.
+        """
+
+        self.__dir = tempfile.TemporaryDirectory()
+        self.__path = os.path.join(self.__dir.name, 'book.bin')
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def tearDown(self) -> None:
+        """
+        Usunięcie plików księgi.
+        """
+
+        self.__dir.cleanup()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_BuildAndLookup(self) -> None:
+        """
+        Wagi ruchów odpowiadają liczbie gier, a wybrany ruch
+        jest najczęściej granym ruchem w danej pozycji.
+        """
+
+        rng = random.Random(1)
+        checkers = Checkers()
+        games = []
+
+        for _ in range(30):
+            checkers.newGame()
+            line = []
+            for _ in range(4):
+                move = rng.choice(checkers.generateMoves())
+                line.append(move)
+                checkers.makeMove(move)
+            games.append(line)
+
+        # Najczęstszy pierwszy ruch
+        first = max (
+            set(g[0] for g in games),
+            key = lambda m: sum(1 for g in games if g[0] == m)
+        )
+
+        OpeningBook.build(self.__path, games, 3)
+        book = OpeningBook(self.__path)
+
+        checkers.newGame()
+        entries = book.lookup(checkers.getPositionHash())
+
+        self.assertEqual(sum(w for _, _, w in entries), len(games))
+        self.assertEqual(book.chooseMove(checkers), first)
+        self.assertIn (
+            book.chooseMove(checkers, rng), checkers.generateMoves()
+        )
+
+        # Pozycja po czterech ruchach nie trafiła do księgi.
+        for move in games[0]:
+            checkers.makeMove(move)
+        self.assertIsNone(book.chooseMove(checkers))
+        self.assertEqual(book.lookup(0), [])
+
+        # Komputer odpowiada z księgi bez przeszukiwania.
+        checkers.newGame()
+        computer = ComputerPlayer(0, maxNodes = 100, book = book)
+        self.assertEqual(computer.chooseMove(checkers), first)
+        self.assertEqual(computer.getSearchInfo()['nodes'], 0)
+
+        book.close()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_EmptyBook(self) -> None:
+        """
+        Pusta księga nie zawiera żadnej pozycji.
+        """
+
+        OpeningBook.build(self.__path, [])
+        book = OpeningBook(self.__path)
+
+        checkers = Checkers()
+        checkers.newGame()
+
+        self.assertEqual(len(book), 0)
+        self.assertIsNone(book.chooseMove(checkers))
+
+        book.close()
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    unittest.main()
+
+
+################################################################
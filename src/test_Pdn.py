@@ -0,0 +1,136 @@
+################################################################
+# Warcaby: "/src/test_Pdn.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import io
+import random
+import unittest
+
+from Checkers import Checkers
+from Pdn import Pdn, PdnGame
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class test_Pdn(unittest.TestCase):
+    """
+    Testy zapisu gier w formacie PDN
+    """
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __randomGames(self, count: int, seed: int) -> list:
+        """
+        Losowe gry (do 120 ruchów) zapisane jako `PdnGame`.
+        """
+
+        rng = random.Random(seed)
+        checkers = Checkers(Checkers.BACKEND_BITBOARDS)
+        games = []
+
+        for i in range(count):
+            checkers.newGame()
+            for _ in range(120):
+                moves = checkers.generateMoves()
+                if (not moves) or (Checkers.GAMESTATE_END \
+                == checkers.getGameState()[0]):
+                    break
+                checkers.makeMove(rng.choice(moves))
+            games.append (
+                Pdn.gameFromCheckers(checkers, {'Round': str(i + 1)})
+            )
+
+        return games
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_RoundTrip(self) -> None:
+        """
+        Gry zapisane i odczytane ponownie są identyczne
+        i przechodzą weryfikację zasad.
+        """
+
+        # Ziarna 1, 12 i 29 dają bicia damką zapisane dwoma polami
+        # (np. `3x21`), choć ten sam start i koniec ma też dłuższe bicie.
+        for seed in (3, 1, 12, 29):
+            games = self.__randomGames(10, seed)
+
+            stream = io.StringIO()
+            self.assertEqual(Pdn.write(stream, games), len(games))
+
+            text = stream.getvalue()
+            self.assertTrue(all(len(l) <= 79 for l in text.splitlines()))
+
+            stream.seek(0)
+            self.assertEqual(list(Pdn.read(stream)), games)
+
+            stream.seek(0)
+            stats = Pdn.replay(Pdn.read(stream))
+            self.assertEqual(stats['games'], len(games))
+            self.assertEqual(stats['valid'], len(games))
+            self.assertEqual(stats['invalid'], 0)
+            self.assertEqual(stats['moves'], sum(len(g.moves) for g in games))
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_Read(self) -> None:
+        """
+        Komentarze, numery ruchów i skrócony zapis bicia.
+        """
+
+        text = (
+            '[Event "Test"]\n'
+            '[Result "*"]\n'
+            '1. 22-18 {komentarz\n'
+            'na dwa wiersze} 11-15 2. 18x11 *\n'
+        )
+
+        games = list(Pdn.read(io.StringIO(text)))
+        self.assertEqual (
+            games, [PdnGame (
+                {'Event': 'Test', 'Result': '*'},
+                ['22-18', '11-15', '18x11'], '*'
+            )]
+        )
+
+        checkers = Checkers()
+        checkers.newGame()
+        for text in games[0].moves:
+            move = Pdn.parseMove(checkers, text)
+            self.assertIsNotNone(move)
+            self.assertEqual(Pdn.formatMove(move), text)
+            checkers.makeMove(move)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_InvalidGames(self) -> None:
+        """
+        Niedozwolony ruch oraz błędny wynik zakończonej gry.
+        """
+
+        games = self.__randomGames(10, 5)
+        finished = [g for g in games if Pdn.RESULT_UNKNOWN != g.result]
+        self.assertTrue(finished)
+
+        illegal = games[0]._replace(moves = ['1-5'] + games[0].moves[1:])
+        swapped = finished[0]._replace(result = Pdn.RESULT_DRAW)
+
+        stream = io.StringIO()
+        Pdn.write(stream, [illegal, finished[0], swapped])
+        stream.seek(0)
+
+        stats = Pdn.replay(Pdn.read(stream))
+        self.assertEqual(stats['games'], 3)
+        self.assertEqual(stats['valid'], 1)
+        self.assertEqual(stats['invalid'], 2)
+        self.assertEqual([n for n, _ in stats['errors']], [1, 3])
+        self.assertIn('1-5', stats['errors'][0][1])
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    unittest.main()
+
+
+################################################################
@@ -0,0 +1,68 @@
+################################################################
+# Warcaby: "/src/test_Perft.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import unittest
+
+from Checkers import Checkers
+from Perft import Perft
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class test_Perft(unittest.TestCase):
+    """
+    Testy liczenia pozycji osiągalnych w grze "Warcaby"
+    """
+
+    # Liczba liści dla głębokości 1, 2, 3, ... od początku gry.
+    # Pierwsze trzy wartości zgadzają się z warcabami angielskimi,
+    # dalej różnice wynikają z bicia do tyłu pionkami.
+    EXPECTED = (7, 49, 302, 1469, 7482)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_NewGame(self) -> None:
+        """
+        Znane wartości perft dla obu reprezentacji planszy,
+        z zapamiętywaniem pozycji i bez niego.
+        """
+
+        for backend in (Checkers.BACKEND_OBJECTS,
+        Checkers.BACKEND_BITBOARDS):
+            checkers = Checkers(backend)
+            checkers.newGame()
+            h = checkers.getPositionHash()
+            perft = Perft(checkers)
+
+            for depth, expected in enumerate(self.EXPECTED, 1):
+                self.assertEqual(perft.perft(depth), expected)
+                self.assertEqual(perft.perft(depth, True), expected)
+
+            self.assertEqual(checkers.getPositionHash(), h)
+            self.assertIsNone(checkers.unmakeMove())
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_Divide(self) -> None:
+        """
+        Suma wyników "divide" równa się wynikowi perft.
+        """
+
+        checkers = Checkers()
+        checkers.newGame()
+        perft = Perft(checkers)
+
+        result = perft.divide(4)
+
+        self.assertEqual(len(result), self.EXPECTED[0])
+        self.assertEqual(sum(n for _, n in result), self.EXPECTED[3])
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    unittest.main()
+
+
+################################################################
@@ -0,0 +1,113 @@
+################################################################
+# Warcaby: "/src/test_SelfPlay.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import random
+import unittest
+from typing import List
+
+from Checkers import Checkers
+from Move import Move
+from SelfPlay import SelfPlay, playGame, randomPolicy, \
+    greedyCapturePolicy, computerPolicy
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class test_SelfPlay(unittest.TestCase):
+    """
+    Testy masowego rozgrywania gier w grze "Warcaby"
+    """
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_Statistics(self) -> None:
+        """
+        Wyniki są powtarzalne (niezależnie od liczby procesów)
+        i sumują się do liczby rozegranych gier.
+        """
+
+        keys = (
+            'winsA', 'winsB', 'draws', 'winsPlayer0', 'winsPlayer1',
+            'meanPlies', 'minPlies', 'maxPlies'
+        )
+
+        a = SelfPlay(greedyCapturePolicy, randomPolicy, 1).run(40, 5)
+        b = SelfPlay(greedyCapturePolicy, randomPolicy, 2).run(40, 5)
+
+        self.assertEqual([a[k] for k in keys], [b[k] for k in keys])
+        self.assertEqual(a['winsA'] + a['winsB'] + a['draws'], 40)
+        self.assertEqual (
+            a['winsPlayer0'] + a['winsPlayer1'] + a['draws'], 40
+        )
+        self.assertGreater(a['minPlies'], 0)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_PlyLimit(self) -> None:
+        """
+        Przekroczenie limitu ruchów kończy grę remisem.
+        """
+
+        stats = SelfPlay(randomPolicy, randomPolicy, 1, 10).run(6)
+
+        self.assertEqual(stats['draws'], 6)
+        self.assertEqual(stats['maxPlies'], 10)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_GreedyPromotion(self) -> None:
+        """
+        Za promocję uznawany jest tylko ruch pionka na ostatni rząd
+        po stronie przeciwnika (nie ruch damki ani własny rząd).
+        """
+
+        rows = [[''] * Checkers.BOARD_SIZE for _ in range(Checkers.BOARD_SIZE)]
+        rows[1][0] = 'C'
+        rows[5][2] = 'Cd'
+        rows[0][7] = 'B'
+
+        checkers = Checkers()
+        checkers.newGame()
+        checkers.setTextBoard(rows)
+        checkers.setCurrentPlayer(0)
+
+        moves = checkers.generateMoves()
+        self.assertIn(((2, 5), ((0, 7),)), [(m.start, m.path) for m in moves])
+
+        for seed in range(10):
+            move = greedyCapturePolicy(checkers, moves, random.Random(seed))
+            self.assertEqual((move.start, move.path), ((0, 1), ((1, 0),)))
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_ComputerRepeatable(self) -> None:
+        """
+        Gra przeciwnika komputerowego nie zależy od gier
+        rozegranych wcześniej w tym samym procesie.
+        """
+
+        played = []
+
+        def recorded(checkers: Checkers, moves: List[Move], \
+        rng: random.Random) -> Move:
+            move = computerPolicy(checkers, moves, rng)
+            played[-1].append((move.start, move.path))
+            return move
+
+        for seed in (2, 4, 2):
+            played.append([])
+            playGame (
+                (recorded, randomPolicy), seed, 30, Checkers.BACKEND_OBJECTS
+            )
+
+        self.assertEqual(played[0], played[2])
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    unittest.main()
+
+
+################################################################
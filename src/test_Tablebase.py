@@ -0,0 +1,153 @@
+################################################################
+# Warcaby: "/src/test_Tablebase.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import os
+import tempfile
+import unittest
+
+from Checkers import Checkers
+from Tablebase import Tablebase, expandPositions
+from test_Checkers import multilineBoardTextToList
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class test_Tablebase(unittest.TestCase):
+    """
+    Testy tablicy końcówek w grze "Warcaby"
+    """
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Zbudowanie tablicy końcówek z dwoma pionkami.
+        """
+
+        cls.__dir = tempfile.TemporaryDirectory()
+        path = os.path.join(cls.__dir.name, 'tb2.bin')
+        Tablebase.generate(path, 2, 1)
+        cls.__tablebase = Tablebase(path)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """
+        Zamknięcie i usunięcie pliku tablicy końcówek.
+        """
+
+        cls.__tablebase.close()
+        cls.__dir.cleanup()
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_Indexing(self) -> None:
+        """
+        Indeks pozycji jednoznacznie odtwarza maski bitowe planszy.
+        """
+
+        for counts in Tablebase.signatures(3):
+            size = Tablebase.tableSize(counts)
+            for index in range(0, size, max(1, size // 97)):
+                masks = Tablebase.positionFromIndex(counts, index)
+                self.assertEqual (
+                    Tablebase.indexPosition(masks), (counts, index)
+                )
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_Consistency(self) -> None:
+        """
+        Wynik każdej pozycji zgadza się z wynikami pozycji po ruchach:
+        wygrana, jeśli któryś ruch daje przegraną przeciwnikowi,
+        przegrana, jeśli każdy ruch daje mu wygraną.
+        """
+
+        tb = self.__tablebase
+        WIN, LOSS, DRAW = \
+            Tablebase.RESULT_WIN, Tablebase.RESULT_LOSS, Tablebase.RESULT_DRAW
+
+        for counts in Tablebase.signatures(2):
+            for player in range(2):
+                size = Tablebase.tableSize(counts)
+                entries = expandPositions(counts, player, 0, size)
+
+                for index, entry in enumerate(entries):
+                    masks = Tablebase.positionFromIndex(counts, index)
+                    result = tb.probe(masks, player)
+
+                    if entry is None:
+                        self.assertEqual(result, Tablebase.RESULT_UNKNOWN)
+                        continue
+                    if entry is True:
+                        self.assertEqual(result, WIN)
+                        continue
+
+                    replies = [
+                        tb.probe (
+                            Tablebase.positionFromIndex(c, i), player ^ 1
+                        )
+                        for c, i in entry
+                    ]
+
+                    if LOSS in replies:
+                        expected = WIN
+                    elif DRAW in replies:
+                        expected = DRAW
+                    else:
+                        expected = LOSS
+
+                    self.assertEqual(result, expected)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_ProbeCheckers(self) -> None:
+        """
+        Odczyt wyniku pozycji z rozgrywanej gry.
+        """
+
+        checkers = Checkers()
+        checkers.newGame()
+        checkers.setTextBoard(multilineBoardTextToList (
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ B _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ C _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+        ))
+
+        # Patrz: `test_ComputerPlayer.test_FindsWinningMove`.
+        checkers.setCurrentPlayer(1)
+        self.assertEqual (
+            self.__tablebase.probeCheckers(checkers), Tablebase.RESULT_WIN
+        )
+
+        checkers.setTextBoard(multilineBoardTextToList (
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " _ _ _ _ _ _ _ _ \n"
+            " C _ C _ _ _ _ _ \n"
+        ))
+        self.assertEqual (
+            self.__tablebase.probeCheckers(checkers),
+            Tablebase.RESULT_UNKNOWN
+        )
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    unittest.main()
+
+
+################################################################
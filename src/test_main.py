@@ -0,0 +1,100 @@
+################################################################
+# Warcaby: "/src/test_main.py"
+################################################################
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+import os
+import subprocess
+import sys
+import time
+import unittest
+from typing import Tuple
+
+import main
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+class test_main(unittest.TestCase):
+    """
+    Testy uruchamiania gry "Warcaby" z wiersza poleceń
+    """
+
+    DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def __run(self, code: str, stdin: str = '') -> Tuple[str, float]:
+        """
+        Uruchomienie kodu w nowym procesie interpretera.
+        Zwraca wyjście procesu oraz czas działania (w sekundach).
+        """
+
+        start = time.perf_counter()
+        result = subprocess.run (
+            [sys.executable, '-c', code], input = stdin,
+            capture_output = True, text = True, cwd = self.DIRECTORY,
+            check = True
+        )
+
+        return result.stdout, time.perf_counter() - start
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_HeadlessColdStart(self) -> None:
+        """
+        Tryby bez okna nie importują `tkinter` i mieszczą się
+        w budżecie czasu uruchomienia.
+        """
+
+        cases = (
+            (['--ui', 'engine'], 'moves\nquit\n'),
+            (['--ui', 'batch', '--games', '2', '--workers', '1'], ''),
+        )
+
+        for argv, stdin in cases:
+            code = (
+                'import sys, main; main.main(%r); '
+                'print(\'tkinter\' in sys.modules)' % argv
+            )
+
+            # Najlepszy z kilku pomiarów (odporność na obciążenie maszyny)
+            best = None
+            for _ in range(3):
+                output, seconds = self.__run(code, stdin)
+                best = seconds if best is None else min(best, seconds)
+
+            self.assertEqual(output.splitlines()[-1], 'False')
+            self.assertLess(best, main.COLD_START_BUDGET)
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+    def test_EngineProtocol(self) -> None:
+        """
+        Odpowiedzi protokołu tekstowego.
+        """
+
+        output, _ = self.__run (
+            'import main; main.main([\'--ui\', \'engine\'])',
+            'moves\nplay 0,5-1,4\nplay 0,5-1,4\nstate\n'
+            'go nodes 200\nundo\nundo\nnonsense\nquit\nstate\n'
+        )
+        lines = output.splitlines()
+
+        self.assertEqual(len(lines), 8)
+        self.assertIn('0,5-1,4', lines[0].split())
+        self.assertEqual(lines[1:4], [
+            'ok', 'error illegal move', 'state 0 0 1'
+        ])
+        self.assertTrue(lines[4].startswith('bestmove '))
+        self.assertEqual(lines[5:], [
+            'ok', 'error nothing to undo', 'error unknown command'
+        ])
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
+if '__main__' == __name__:
+    unittest.main()
+
+
+################################################################